@@ -16,9 +16,15 @@ Endpoints
 """
 
 import os, re, json, logging, time, hashlib, threading, datetime, random, shutil
-from collections import defaultdict, deque
+import bisect
+import ipaddress
+import concurrent.futures
+import functools
+import sys
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import List, Dict, Any, Tuple, Optional
+from string import Template
+from typing import List, Dict, Any, Tuple, Optional, NamedTuple, Mapping, Sequence
 from pathlib import Path
 from datetime import datetime, timezone
 import traceback
@@ -36,6 +42,7 @@ from flask import (
     Response,
     send_from_directory,
 )
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
 from rapidfuzz import fuzz
@@ -47,8 +54,33 @@ try:
 except ImportError:
     torch = None
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # google-re2
+except ImportError:
+    re2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from types import SimpleNamespace
+
+from types import SimpleNamespace, MappingProxyType
 
 ENABLE_ONNX = False   # Hard-off for prelaunch stability
 ONNX_ZIP_URL = (os.getenv("ONNX_ZIP_URL") or "").strip()
@@ -167,27 +199,55 @@ OPENAI_MODEL     = os.getenv("OPENAI_MODEL", "gpt-4o-mini")   # economical defau
 OPENAI_MODEL_ALT = os.getenv("OPENAI_MODEL_ALT", "gpt-4o")    # stronger (rare)
 OPENAI_TIMEOUT   = _get_float("OPENAI_TIMEOUT", 30.0)
 OPENAI_TEMP      = _get_float("OPENAI_TEMP", 0.6)
+# Seconds before a slow primary is raced by OPENAI_MODEL_ALT. Off (0) by default: a hedged
+# request bills both models, and the losing call keeps a worker busy until it times out.
+OPENAI_HEDGE_SECONDS = _get_float("OPENAI_HEDGE_SECONDS", 0.0)
+
+# Reply-length caps per /chat path; decode time grows with output tokens
+GPT_MAX_TOKENS_DEEP    = _get_int("GPT_MAX_TOKENS_DEEP", 512)     # destiny theme deep dive
+GPT_MAX_TOKENS_REPLY   = _get_int("GPT_MAX_TOKENS_REPLY", 400)    # general replies, prophetic words
+GPT_MAX_TOKENS_COMFORT = _get_int("GPT_MAX_TOKENS_COMFORT", 250)  # short two-paragraph comfort
 
 # Optional budget guard (rough estimate)
 GPT_DAILY_BUDGET_CENTS = _get_int("GPT_DAILY_BUDGET_CENTS", 999999)
 GPT_APPROX_CENTS_PER_1K_TOKENS = _get_float("GPT_APPROX_CENTS_PER_1K_TOKENS", 25.0)
 
-# Rate limit (per-IP, sliding window)
+# Rate limit (per-IP token bucket: RATE_MAX_HITS burst, refilled over RATE_WINDOW_SEC)
 RATE_WINDOW_SEC = _get_int("RATE_WINDOW_SEC", 10)
 RATE_MAX_HITS   = _get_int("RATE_MAX_HITS", 12)
-_RATE = defaultdict(lambda: deque(maxlen=20))
+_RATE_WINDOW_NS = max(1, RATE_WINDOW_SEC) * 1_000_000_000
+_RATE_BURST = float(RATE_MAX_HITS)
+_RATE_PER_NS = _RATE_BURST / _RATE_WINDOW_NS
+_RATE: Dict[Any, Tuple[float, int]] = {}  # ip key -> (tokens, last monotonic ns)
 _rate_lock = threading.Lock()
+_rate_next_sweep = 0
+
+
+def _rate_key(ip: str) -> Any:
+    """IPv4 as a packed int (cheaper to hash than the string); anything else as-is."""
+    try:
+        return int(ipaddress.IPv4Address(ip))  # strict dotted quad: no "127.1", no trailing junk
+    except ValueError:
+        return ip
 
 
 def _throttle(ip: str) -> bool:
-    now = time.time()
+    global _rate_next_sweep
+    key = _rate_key(ip)
+    now = time.monotonic_ns()
     with _rate_lock:
-        q = _RATE[ip]
-        while q and (now - q[0]) > RATE_WINDOW_SEC:
-            q.popleft()
-        if len(q) >= RATE_MAX_HITS:
+        if now >= _rate_next_sweep:
+            # A bucket idle for a whole window is full again, so dropping it is exact
+            stale = [k for k, (_, last) in _RATE.items() if now - last >= _RATE_WINDOW_NS]
+            for k in stale:
+                del _RATE[k]
+            _rate_next_sweep = now + _RATE_WINDOW_NS
+        toks, last = _RATE.get(key, (_RATE_BURST, now))
+        toks = min(_RATE_BURST, toks + (now - last) * _RATE_PER_NS)
+        if toks < 1.0:
+            _RATE[key] = (toks, now)
             return True
-        q.append(now)
+        _RATE[key] = (toks - 1.0, now)
         return False
 
 
@@ -225,6 +285,7 @@ SESSION_PASTOR_DEBRA_JSON  = BASE_DIR / "SESSION_PASTOR_DEBRA.json"
 FACES_OF_EVE_JSON          = BASE_DIR / "FACES_OF_EVE.json"
 DESTINY_THEMES_JSON        = BASE_DIR / "destiny_themes.json"
 VIDEOS_JSON                = BASE_DIR / "videos.json"
+PROPHETIC_LIBRARY_JSON     = BASE_DIR / "prophetic_library.json"
 DESTINY_JSON_PATH          = str(DESTINY_THEMES_JSON)
 
 # Scripture settings
@@ -497,6 +558,33 @@ app.config.update(JSON_SORT_KEYS=False, JSONIFY_PRETTYPRINT_REGULAR=False)
 CORS(app, resources={r"/*": CORS_CONFIG})
 
 
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    class _OrjsonProvider(DefaultJSONProvider):
+        """jsonify through orjson; anything it can't encode takes Flask's default path."""
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            # orjson only writes compact output: indent (debug) or any other option goes to json
+            if kwargs.keys() <= {"separators"} and kwargs.get("separators", (",", ":")) == (",", ":"):
+                # datetimes pass through to Flask's default, so they keep the HTTP-date format
+                opts = _ORJSON_OPTS | orjson.OPT_PASSTHROUGH_DATETIME
+                if self.sort_keys:
+                    opts |= orjson.OPT_SORT_KEYS
+                try:
+                    return orjson.dumps(obj, default=self.default, option=opts).decode()
+                except TypeError:
+                    pass
+            return super().dumps(obj, **kwargs)
+
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            if kwargs:
+                return super().loads(s, **kwargs)
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
+
 
 
 @app.route("/")
@@ -628,6 +716,14 @@ ensure_videos_stub()
 # Replace em/en dashes with commas, tidy punctuation/spaces.
 _DASH_SPLIT_RX = re.compile(r"\s*[—–]\s*")   # em or en dash, with optional spaces
 _URL_RX        = re.compile(r"https?://", re.I)
+# Matches wherever any cleanup step in _strip_dashes would; clean text skips all of them
+_DASH_CLEANUP_RX = re.compile(r"[—–]|\s\s|,\s*[,.]|\.\s*\.")
+_MULTI_SPACE_RX  = re.compile(r"\s{2,}")
+_DOUBLE_COMMA_RX = re.compile(r"\s*,\s*,\s*")
+_DOUBLE_DOT_RX   = re.compile(r"\s*\.\s*\.\s*")
+_COMMA_DOT_RX    = re.compile(r"\s*,\s*\.")
+_SPACE_NL_RX     = re.compile(r"\s+\n")
+_BLANK_LINES_RX  = re.compile(r"\n{3,}")
 
 # Keys that almost certainly contain human-facing text we want to clean.
 _TEXTY_KEYS = {
@@ -642,18 +738,36 @@ def _strip_dashes(text: str) -> str:
     if _URL_RX.search(text):
         return text
 
+    # Nothing to replace or tidy: every step below would leave the text as is
+    if not _DASH_CLEANUP_RX.search(text):
+        return text.strip()
+
     # 1) Replace em/en dashes with commas + space
     out = _DASH_SPLIT_RX.sub(", ", text)
 
     # 2) Clean up duplicated punctuation/spacing from the replacement
-    out = re.sub(r"\s{2,}", " ", out)              # collapse extra spaces
-    out = re.sub(r"\s*,\s*,\s*", ", ", out)        # no double commas
-    out = re.sub(r"\s*\.\s*\.\s*", ". ", out)      # no double periods
-    out = re.sub(r"\s*,\s*\.", ". ", out)          # ", ." -> ". "
-    out = re.sub(r"\s+\n", "\n", out)              # trim spaces before newlines
-    out = re.sub(r"\n{3,}", "\n\n", out)           # limit blank lines
+    out = _MULTI_SPACE_RX.sub(" ", out)             # collapse extra spaces
+    out = _DOUBLE_COMMA_RX.sub(", ", out)           # no double commas
+    out = _DOUBLE_DOT_RX.sub(". ", out)             # no double periods
+    out = _COMMA_DOT_RX.sub(". ", out)              # ", ." -> ". "
+    out = _SPACE_NL_RX.sub("\n", out)               # trim spaces before newlines
+    out = _BLANK_LINES_RX.sub("\n\n", out)          # limit blank lines
     return out.strip()
 
+def _strip_dashes_stream(pieces):
+    """_DASH_SPLIT_RX replacement over streamed text; a trailing run of spaces/dashes waits for the next piece."""
+    pending = ""
+    for piece in pieces:
+        buf = pending + piece
+        cut = len(buf)
+        while cut and (buf[cut - 1].isspace() or buf[cut - 1] in "—–"):
+            cut -= 1
+        pending = buf[cut:]
+        if cut:
+            yield _DASH_SPLIT_RX.sub(", ", buf[:cut])
+    if pending:
+        yield _DASH_SPLIT_RX.sub(", ", pending)
+
 def _sanitize_payload(obj):
     """Recursively remove em/en dashes from common text fields in JSON responses."""
     if isinstance(obj, dict):
@@ -681,16 +795,23 @@ def _sanitize_payload(obj):
     else:
         return obj
 
+class _StaticJSON(Response):
+    """Pre-serialized JSON body that was dash-scrubbed when it was built."""
+
+
 @app.after_request
 def _global_dash_scrub(response: Response):
     try:
-        # Only process JSON responses
-        if response.mimetype == "application/json":
-            raw = response.get_data(as_text=True)
+        # Only process JSON responses; static bodies were scrubbed when built
+        if response.mimetype == "application/json" and not isinstance(response, _StaticJSON):
+            raw = response.get_data()
             if raw:
-                data = json.loads(raw)
-                cleaned = _sanitize_payload(data)
-                response.set_data(json.dumps(cleaned, ensure_ascii=False))
+                if orjson is not None:
+                    # bytes in, bytes out: no decode/encode round trip around the parse
+                    response.set_data(orjson.dumps(_sanitize_payload(orjson.loads(raw)), option=_ORJSON_OPTS))
+                else:
+                    cleaned = _sanitize_payload(json.loads(raw))
+                    response.set_data(json.dumps(cleaned, ensure_ascii=False))
     except Exception as e:
         # Never break responses if we fail to clean; just log and continue.
         logger.warning("dash-scrub failed: %s", e)
@@ -700,6 +821,7 @@ def _global_dash_scrub(response: Response):
 # ───────────────── Types ─────────────────
 @dataclass
 class Hit:
+    __slots__ = ("score", "text", "meta", "corpus")  # one per search result per request; no __dict__
     score: float
     text: str
     meta: Dict[str, Any]
@@ -835,11 +957,14 @@ def normalize_text(text: str) -> str:
         toks.append(LEM.lemmatize(t))
     return " ".join(toks)
 
+# Punctuation and whitespace form one class, so a single pass both strips and collapses them
+_NONWORD_RUN_RX = re.compile(r"[^\w'?]+")
+
+# One /chat request normalizes the same message in several places (the route itself,
+# detect_intent, the FAQ and its bio helper); the cache makes every call after the first a lookup.
+@functools.lru_cache(maxsize=256)
 def _normalize_simple(text: str) -> str:
-    t = (text or "").strip().lower()
-    t = re.sub(r"[^\w\s'?]", " ", t)
-    t = re.sub(r"\s+", " ", t)
-    return t
+    return _NONWORD_RUN_RX.sub(" ", (text or "").strip().lower())
 
 # ────────── Loaders ──────────
 def load_json_safely(path: Path, default: Any) -> Any:
@@ -873,15 +998,18 @@ W = {
     "DESTINY_THEMES": 0.35,
 }
 
+# Corpora each intent may draw context from; built once rather than per call
+_ALL_CONTEXT_CORPORA = frozenset({"PASTOR_DEBRA","SESSION","FACES_OF_EVE","DESTINY_THEMES"})
+_CONTEXT_CORPORA = {
+    "teachings": frozenset({"PASTOR_DEBRA","SESSION","FACES_OF_EVE"}),
+    "destiny":   frozenset({"DESTINY_THEMES"}),
+    "advice":    frozenset({"PASTOR_DEBRA","SESSION","FACES_OF_EVE"}),
+    "book":      frozenset({"FACES_OF_EVE"}),  # optional, if you added a 'book' intent
+    "general":   _ALL_CONTEXT_CORPORA,
+}
+
 def filter_hits_for_context(hits: List[Hit], intent: str) -> List[Hit]:
-    prefer = {
-        "teachings": {"PASTOR_DEBRA","SESSION","FACES_OF_EVE"},
-        "destiny":   {"DESTINY_THEMES"},
-        "advice":    {"PASTOR_DEBRA","SESSION","FACES_OF_EVE"},
-        "book":      {"FACES_OF_EVE"},  # optional, if you added a 'book' intent
-        "general":   {"PASTOR_DEBRA","SESSION","FACES_OF_EVE","DESTINY_THEMES"},
-    }
-    allowed = prefer.get(intent, {"PASTOR_DEBRA","SESSION","FACES_OF_EVE","DESTINY_THEMES"})
+    allowed = _CONTEXT_CORPORA.get(intent, _ALL_CONTEXT_CORPORA)
     out = [h for h in hits if h.score >= MIN_CONTEXT_SCORE and h.corpus in allowed]
     out.sort(key=lambda x: x.score, reverse=True)
     return out[:3]
@@ -1050,6 +1178,9 @@ def _write_json(path: Path, obj):
     except Exception:
         pass
 
+# en/em dash -> hyphen in one C-level pass (built once, not per call)
+_REF_DASH_TABLE = str.maketrans({"–": "-", "—": "-"})
+
 class ScriptureService:
     def __init__(self, cache_path: Path, api_base: str, translation: str):
         self.cache_path = cache_path
@@ -1061,9 +1192,8 @@ class ScriptureService:
     def normalize_ref(ref: str) -> str:
         if not ref: return ""
         r = ref.strip()
-        r = r.replace("–", "-").replace("—", "-")
-        r = re.sub(r"\s+", " ", r)
-        return r
+        r = r.translate(_REF_DASH_TABLE)
+        return " ".join(r.split())
 
     def get(self, ref: str) -> Optional[str]:
         ref = self.normalize_ref(ref)
@@ -1107,10 +1237,13 @@ _SCRIPTURE_LINE = re.compile(r"^(?P<bullet>[-•\*]?\s*)Scripture\s*:?\s*(?P<ref
 def expand_scriptures_in_text(text: str) -> str:
     if not text:
         return text
-    lines = text.splitlines()
+    # Replies with no Scripture line skip the per-line matching (same line normalization)
+    if "scripture" not in text.lower():
+        return "\n".join(text.splitlines())
+    match = _SCRIPTURE_LINE.match
     out = []
-    for ln in lines:
-        m = _SCRIPTURE_LINE.match(ln.strip())
+    for ln in text.splitlines():
+        m = match(ln.strip())
         if m:
             ref = scriptures.normalize_ref(m.group("ref"))
             txt = scriptures.get(ref) or ""
@@ -1123,6 +1256,34 @@ def expand_scriptures_in_text(text: str) -> str:
     return "\n".join(out)
 
 
+# Fixed reply text expands the same way every time, so keep the result once every
+# Scripture line in it has resolved (a failed lookup is retried on the next call).
+# The FAQ's templated replies (names, counts) also pass through here, so this is an
+# LRU: one-off variants age out instead of crowding out the fixed replies.
+_EXPANDED_STATIC: "OrderedDict[str, str]" = OrderedDict()  # oldest use first
+_EXPANDED_STATIC_MAX = 1024
+_expanded_static_lock = threading.Lock()
+
+def _scripture_resolved(out: str) -> bool:
+    """True once expansion left no bare "Scripture: <ref>" line behind."""
+    return not any(_SCRIPTURE_LINE.match(ln.strip()) for ln in out.splitlines())
+
+def _expand_static(text: str) -> str:
+    with _expanded_static_lock:
+        out = _EXPANDED_STATIC.get(text)
+        if out is not None:
+            _EXPANDED_STATIC.move_to_end(text)
+            return out
+    out = expand_scriptures_in_text(text)
+    if _scripture_resolved(out):
+        with _expanded_static_lock:
+            _EXPANDED_STATIC[text] = out
+            _EXPANDED_STATIC.move_to_end(text)
+            while len(_EXPANDED_STATIC) > _EXPANDED_STATIC_MAX:
+                _EXPANDED_STATIC.popitem(last=False)  # least recently used
+    return out
+
+
 
 
 def _stable_variant_index(name: str, dob: str, theme: int, total: int, period_days: int = 7) -> int:
@@ -1214,7 +1375,7 @@ def _enforce_two_paragraph_layout(text: str) -> str:
         return ""
 
     # Normalize whitespace to a single line
-    t = re.sub(r"\s+", " ", text.strip())
+    t = " ".join(text.split())
 
     # Split into sentences
     sentences = SENTENCE_SPLIT_RX.split(t)
@@ -1412,6 +1573,14 @@ _BIO_PATTERNS = [
     (re.compile(r"\b(prophet(?:ess)?|prophes(y|ying)|books?\b)", re.I), "calling"),
 ]
 
+# Fallback cues for personal_bio_answer; t there is already lowercased by _normalize_simple.
+# "who ... married" and a bare "kids" are folded into the alternations so each check is one scan.
+_BIO_MARRIED_RX = re.compile(r"\b(?:are you|r u)\s+married\b|who.*married|married.*who", re.I | re.S)
+_BIO_CHILDREN_RX = re.compile(r"\b(?:how\s+many\s+children|children\s+do\s+you\s+have)\b|kids", re.I)
+_BIO_ABOUT_RX = re.compile(r"\b(who\s+are\s+you|tell\s+me\s+about|about\s+you)\b", re.I)
+_BIO_PROPHESY_RX = re.compile(r"\b(can\s+you\s+prophesy|give\s+me\s+a\s+prophetic)\b", re.I)
+_BIO_OCCULT_RX = re.compile(r"\b(astrolog|psychic)\b", re.I)
+
 def personal_bio_answer(user_text: str) -> Optional[str]:
     """
     Handles personal or biographical questions about Pastor Debra Ann Jordan
@@ -1439,8 +1608,7 @@ def personal_bio_answer(user_text: str) -> Optional[str]:
     # 3) Marriage / spouse (covers “who are you married to?” and “are you married?”)
     elif (
         WHO_ARE_YOU_MARRIED_TO_RX.search(user_text or "")
-        or re.search(r"\b(are you|r u)\s+married\b", t, re.I)
-        or ("who" in t and "married" in t)
+        or _BIO_MARRIED_RX.search(t)
     ):
         return expand_scriptures_in_text(
             "I’m joyfully married to the Master Prophet, Bishop E. Bernard Jordan. "
@@ -1452,8 +1620,7 @@ def personal_bio_answer(user_text: str) -> Optional[str]:
     # 4) Children / how many
     elif (
         HOW_MANY_CHILDREN_RX.search(user_text or "")
-        or re.search(r"\b(how\s+many\s+(children|kids)|children\s+do\s+you\s+have|kids\s+do\s+you\s+have)\b", t, re.I)
-        or "kids" in t
+        or _BIO_CHILDREN_RX.search(t)
     ):
         return expand_scriptures_in_text(
             "I’m a mother and grandmother—family is one of my greatest ministries and joys. "
@@ -1463,7 +1630,7 @@ def personal_bio_answer(user_text: str) -> Optional[str]:
         )
 
     # 5) Background / calling (“who are you”, “tell me about yourself”)
-    elif re.search(r"\b(who\s+are\s+you|tell\s+me\s+about|about\s+you)\b", t, re.I):
+    elif _BIO_ABOUT_RX.search(t):
         return expand_scriptures_in_text(
             "I’m Pastor Dr. Debra Ann Jordan—a Christian woman who loves to worship, praise, pray, fast, and prophesy. "
             "I began prophesying at age 12, have authored several books, and serve as CFO of Zoe Ministries alongside my husband.\n"
@@ -1472,7 +1639,7 @@ def personal_bio_answer(user_text: str) -> Optional[str]:
         )
 
     # 6) Prophetic gifts (“can you prophesy”, “give me a prophetic …”)
-    elif re.search(r"\b(can\s+you\s+prophesy|give\s+me\s+a\s+prophetic)\b", t, re.I):
+    elif _BIO_PROPHESY_RX.search(t):
         return expand_scriptures_in_text(
             "Yes—I’ve been prophesying since I was 12. Prophecy isn’t mere prediction; it’s participation in God’s voice and will, "
             "and it must align with Scripture and edify.\n"
@@ -1481,7 +1648,7 @@ def personal_bio_answer(user_text: str) -> Optional[str]:
         )
 
     # 7) Astrology / psychic arts (kept distinct from palm/occult handler elsewhere)
-    elif re.search(r"\b(astrolog|psychic)\b", t, re.I):
+    elif _BIO_OCCULT_RX.search(t):
         return expand_scriptures_in_text(
             "I don’t practice astrology or psychic arts. My counsel flows from prayer, wise discernment, and the Word of God.\n"
             "Scripture: James 1:5\n"
@@ -1573,10 +1740,21 @@ def soften_future_language(reply: str) -> str:
 
 
 
-def _gpt_chat(model: str, system_prompt: str, user_prompt: str, temperature: float = 0.7) -> str:
+# One pooled session keeps the TLS connection to the API warm between calls
+_openai_http = requests.Session()
+_gpt_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="gpt")
+
+def _gpt_chat(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = None,
+) -> str:
     """
     Safe wrapper around OpenAI /chat/completions using raw HTTP.
     Uses OPENAI_API_KEY and OPENAI_BASE_URL (already configured in your app).
+    max_tokens caps the reply length (decode time grows with it); None leaves it to the API.
     Returns the assistant text or "" on failure.
     """
     if not OPENAI_API_KEY:
@@ -1595,6 +1773,8 @@ def _gpt_chat(model: str, system_prompt: str, user_prompt: str, temperature: flo
             {"role": "user", "content": user_prompt},
         ],
     }
+    if max_tokens:
+        payload["max_tokens"] = int(max_tokens)
 
     backoffs = [0.0, 0.6, 1.2]  # seconds
     for i, delay in enumerate(backoffs):
@@ -1602,7 +1782,7 @@ def _gpt_chat(model: str, system_prompt: str, user_prompt: str, temperature: flo
             if delay:
                 time.sleep(delay)
 
-            resp = requests.post(
+            resp = _openai_http.post(
                 f"{OPENAI_BASE_URL}/chat/completions",
                 headers=headers,
                 json=payload,
@@ -1637,6 +1817,93 @@ def _gpt_chat(model: str, system_prompt: str, user_prompt: str, temperature: flo
     return ""
 
 
+def _gpt_chat_hedged(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """
+    OPENAI_MODEL first, falling back to OPENAI_MODEL_ALT when it comes back empty.
+    With OPENAI_HEDGE_SECONDS > 0 the alternate also races a primary that has run that
+    long, so a stalled primary no longer delays the fallback by its full timeout and
+    retries; the first non-empty reply wins, but both calls are billed.
+    """
+    if not OPENAI_MODEL_ALT:
+        return _gpt_chat(OPENAI_MODEL, system_prompt, user_prompt, temperature, max_tokens)
+    if OPENAI_HEDGE_SECONDS <= 0:
+        return (
+            _gpt_chat(OPENAI_MODEL, system_prompt, user_prompt, temperature, max_tokens)
+            or _gpt_chat(OPENAI_MODEL_ALT, system_prompt, user_prompt, temperature, max_tokens)
+        )
+
+    primary = _gpt_pool.submit(_gpt_chat, OPENAI_MODEL, system_prompt, user_prompt, temperature, max_tokens)
+    try:
+        out = primary.result(timeout=OPENAI_HEDGE_SECONDS)
+        if out:
+            return out
+        racing = set()
+    except concurrent.futures.TimeoutError:
+        racing = {primary}
+
+    racing.add(_gpt_pool.submit(_gpt_chat, OPENAI_MODEL_ALT, system_prompt, user_prompt, temperature, max_tokens))
+    for fut in concurrent.futures.as_completed(racing):
+        out = fut.result()
+        if out:
+            return out  # a slower call still running just finishes in its pool thread
+    return ""
+
+
+
+def _gpt_chat_stream(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = None,
+):
+    """
+    Streaming /chat/completions: yields content deltas as the model decodes them.
+    One attempt only (a retry can't restart a half-sent stream); on failure it
+    logs and stops, and the caller decides what to fall back to.
+    """
+    if not OPENAI_API_KEY:
+        logger.warning("_gpt_chat_stream skipped: OPENAI_API_KEY not set.")
+        return
+
+    payload = {
+        "model": model,
+        "temperature": float(temperature),
+        "stream": True,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+    }
+    if max_tokens:
+        payload["max_tokens"] = int(max_tokens)
+
+    try:
+        with _openai_http.post(
+            f"{OPENAI_BASE_URL}/chat/completions",
+            headers={"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"},
+            json=payload,
+            timeout=OPENAI_TIMEOUT,
+            stream=True,
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data: "):
+                    continue
+                chunk = line[6:]
+                if chunk == "[DONE]":
+                    break
+                delta = (json.loads(chunk).get("choices") or [{}])[0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
+    except Exception as e:
+        logger.exception("_gpt_chat_stream failed (model=%s): %s", model, e)
+
 
 def handle_sop(user_text: str) -> str:
     t = user_text.lower().strip()
@@ -1652,6 +1919,14 @@ def handle_sop(user_text: str) -> str:
     # 3 — GENERAL MENTION
     return SOP_SHORT_VERSION
 
+# Placeholder phrases a seeker may type in the name field; never address them as a name
+_INVALID_NAME_PHRASES = frozenset((
+    "my season", "this season", "my life", "my calling",
+    "my daughter", "my son", "my marriage", "my week",
+    "my situation", "my purpose", "my destiny",
+    "my family", "my child",
+))
+
 def build_prophetic_word(
     user_text: str,
     full_name: str = "",
@@ -1669,16 +1944,9 @@ def build_prophetic_word(
     raw_name = (full_name or "").strip()
     name_norm = raw_name.lower()
 
-    INVALID_NAME_PHRASES = {
-        "my season", "this season", "my life", "my calling",
-        "my daughter", "my son", "my marriage", "my week",
-        "my situation", "my purpose", "my destiny",
-        "my family", "my child"
-    }
-
     use_name = bool(
         raw_name
-        and name_norm not in INVALID_NAME_PHRASES
+        and name_norm not in _INVALID_NAME_PHRASES
         and len(raw_name.split()) <= 4  # prevents paragraphs / sentences
     )
 
@@ -1736,6 +2004,7 @@ def build_prophetic_word(
         scripture_hint=None,
         history=[],             # prophetic words should be standalone
         system_hint=system_prompt,
+        max_tokens=GPT_MAX_TOKENS_REPLY,
     )
 
     return expand_scriptures_in_text(out)
@@ -1781,61 +2050,11 @@ def _build_history_block() -> str:
     if not CONV_HISTORY:
         return ""
 
-    parts = []
-    for u, a in CONV_HISTORY[-4:]:
-        if u and a:
-            parts.append(f"User: {u}\nPastor Debra: {a}")
-
-    return "\n\n".join(parts)
-
-
-
-    # -----------------------------
-    # Normalize theme safely
-    # -----------------------------
-    theme_num = None
-    theme_name = None
-    theme_meaning = None
-
-    if theme_guess:
-        try:
-            theme_num, theme_name, theme_meaning = theme_guess
-        except Exception:
-            pass
-
-    # -----------------------------
-    # Name
-    # -----------------------------
-    name = _safe_name(full_name).strip() or "Beloved"
-
-    # -----------------------------
-    # Topic block
-    # -----------------------------
-    topic_block = PROPHETIC_LIBRARY.get(topic) or PROPHETIC_LIBRARY.get("general", {})
-
-    theme_lines = []
-    if theme_name and theme_name in topic_block:
-        theme_lines = topic_block.get(theme_name, []) or []
-
-    default_lines = topic_block.get("default", []) or []
-
-    pool = theme_lines + default_lines
-    if not pool:
-        pool = ["I sense the Lord steadying your steps in this season."]
-
-    if last_sentence and last_sentence in pool and len(pool) > 1:
-        pool = [s for s in pool if s != last_sentence]
-
-    base_sentence = random.choice(pool)
-
-    # -----------------------------
-    # Intro
-    # -----------------------------
-    if theme_name:
-        intro = f"{name}, I sense this for you as a '{theme_name}': "
-    for u, a in CONV_HISTORY:
-        parts.append(f"User: {u}\nPastor Debra: {a}")
-    return "\n\n".join(parts)
+    # CONV_HISTORY is a deque(maxlen=4): it already holds only the last turns,
+    # and deques cannot be sliced, so walk it directly
+    return "\n\n".join(
+        f"User: {u}\nPastor Debra: {a}" for u, a in CONV_HISTORY if u and a
+    )
 
 
 LIST_NORMALIZER_RX = re.compile(
@@ -1843,6 +2062,8 @@ LIST_NORMALIZER_RX = re.compile(
     re.MULTILINE
 )
 
+LIST_MARKER_RX = re.compile(r"^\s*(\d+[\.\)]|\(\d+\)|[-•])\s*")
+
 def normalize_numbered_lists(text: str) -> str:
     """
     Converts inline lists like '1. verse 2. verse' or
@@ -1867,7 +2088,7 @@ def normalize_numbered_lists(text: str) -> str:
     # turn each block into a line starting with a hyphen
     bullets = []
     for item in lines:
-        cleaned = re.sub(r"^\s*(\d+[\.\)]|\(\d+\)|[-•])\s*", "- ", item)
+        cleaned = LIST_MARKER_RX.sub("- ", item)
     theme_num = None
     theme_name = None
     theme_meaning = None
@@ -1901,7 +2122,7 @@ def normalize_numbered_lists(text: str) -> str:
     if last_sentence and last_sentence in pool and len(pool) > 1:
         pool = [s for s in pool if s != last_sentence]
 
-    base_sentence = random.choice(pool)
+    base_sentence = _pick(pool)
 
     # -----------------------------
     # Intro
@@ -2059,6 +2280,11 @@ def answer_dev_meta(user_text: str) -> Optional[str]:
 
 
 
+_INLINE_BOLD_BULLET_RX    = re.compile(r"\s+-\s+(?=\*\*)")
+_INLINE_DASH_BULLET_RX    = re.compile(r"\s+-\s+")
+_INLINE_NUMBERED_RX       = re.compile(r"\s+(\d+[\.\)])\s+")
+_INLINE_PAREN_NUMBERED_RX = re.compile(r"\s+(\(\d+\))\s+")
+
 def auto_list_layout(text: str) -> str:
     """
     Turn inline lists like:
@@ -2073,13 +2299,13 @@ def auto_list_layout(text: str) -> str:
     # 1) Fix repeated "- ..." bullets that are all on one line
     #    Example: "- item one - item two - item three"
     #    This turns " - " for 2nd+ bullets into "\n- ".
-    text = re.sub(r"\s+-\s+(?=\*\*)", "\n- ", text)  # bullets with bold (scriptures)
-    text = re.sub(r"\s+-\s+", "\n- ", text)          # generic dash bullets
+    text = _INLINE_BOLD_BULLET_RX.sub("\n- ", text)   # bullets with bold (scriptures)
+    text = _INLINE_DASH_BULLET_RX.sub("\n- ", text)   # generic dash bullets
 
     # 2) Fix numbered lists that are smashed together
     #    Example: "1. one 2. two 3. three"
-    text = re.sub(r"\s+(\d+[\.\)])\s+", r"\n\1 ", text)   # "1." or "1)"
-    text = re.sub(r"\s+(\(\d+\))\s+", r"\n\1 ", text)     # "(1)"
+    text = _INLINE_NUMBERED_RX.sub(r"\n\1 ", text)      # "1." or "1)"
+    text = _INLINE_PAREN_NUMBERED_RX.sub(r"\n\1 ", text)  # "(1)"
 
     return text
 
@@ -2204,6 +2430,8 @@ MASTER_PROPHET_TAROT_RX = re.compile(
 )
 
 
+# CHURCH_QUESTION_RX and GLORY_BULLET_RX only ever see gpt_answer's lowercased
+# simple_key, so they skip IGNORECASE's case-folding on every character compare.
 CHURCH_QUESTION_RX = re.compile(
     r"""
     \b(
@@ -2222,13 +2450,12 @@ CHURCH_QUESTION_RX = re.compile(
         come\s+to\s+your\s+church
     )
     """,
-    re.IGNORECASE | re.VERBOSE,
+    re.VERBOSE,
 )
 
 
 GLORY_BULLET_RX = re.compile(
     r"5\s+scriptures?.*\bglory\b.*\b(bullet|bulleted|bullet\s*points?)\b",
-    re.I,
 )
 
 
@@ -2336,15 +2563,6 @@ SCRIPTURE_MEMORY_EXPERIENCE_RX = re.compile(r"""(?ix)
     \b(when\s+you\s+quote\s+scripture.*(memory|experience)|memory\s+or\s+experience\s+when\s+you\s+quote\s+scripture)\b
 """)
 
-SCRIPTURE_WORD_RX = re.compile(r'\b(scripture|verse|bible|psalm|proverb|galatians|philippians|romans)\b', re.I)
-
-def should_include_scripture(user_text: str) -> bool:
-    # If the user explicitly asks for a verse, always include one
-    if SCRIPTURE_WORD_RX.search(user_text):
-        return True
-    # Otherwise, 80% of the time include scripture, 20% of the time don’t
-    return random.random() < 0.8
-
 OWNER_WHO_RX = re.compile(r"""(?ix)
     \bwho\s+is\s+(?:your|ur)\s+owner\b
     |
@@ -2678,6 +2896,17 @@ ZOE_SITE_RX   = re.compile(r"\b(zoe\s+ministr(?:y|ies)\s+(?:site|website|web\s*s
 # Faces of Eve “chapters” / contents
 CHAPTERS_ASK_RX = re.compile(r"\b(chapters?|table\s+of\s+contents|contents)\b", re.I)
 
+def _re2_twin(rx: "re.Pattern[str]"):
+    """RE2 build of rx when google-re2 is installed (linear time, no backtracking), else None."""
+    if re2 is None:
+        return None
+    try:
+        return re2.compile(("(?i)" if rx.flags & re.I else "") + rx.pattern)
+    except Exception as e:
+        logger.warning("re2 could not compile %.40r, using re: %s", rx.pattern, e)
+        return None
+
+
 # Donation (8M → VUU) – robust
 DONATION_RX = re.compile(
     r"(?:(?:did|why\s+did)\s+(?:your|ur)\s+(?:husband|spouse)|"
@@ -2688,12 +2917,65 @@ DONATION_RX = re.compile(
     r".{0,120}?(?:virgini?a?\s*(?:union)?\s*university|virgini?a?\s*university|vuu)",
     re.I
 )
+_DONATION_RX_RE2 = _re2_twin(DONATION_RX)
 DONATION_SHORT_RX = re.compile(
     r"(jordan|master\s+prophet).*(8\s*m(?:illion)?|eight\s+million).*(virginia|vuu)|"
     r"(8\s*m(?:illion)?|eight\s+million).*(jordan|master\s+prophet).*(virginia|vuu)",
     re.I
 )
 
+# Wider donation phrasings checked by answer_pastor_debra_faq. These used to be two
+# regexes chaining unbounded ".*?" gaps, which backtrack polynomially when the cues are
+# present but out of order (seconds on a ~2 KB message). Each piece is now its own small
+# pattern and the chain is walked left to right, so a check is a few linear scans.
+_DONATION_TERMS = r"(?:donat(?:e|ed)|gift(?:ed)?|gave|seed(?:ed)?)"
+_EIGHT_MILLION = r"(?:8\s*[,\.]?\s*m(?:illion)?|eight\s+million|\$?\s*8[, ]?0{3}[, ]?0{3})"
+_UNIVERSITY = r"(?:virgini?a(?:\s*union)?\s*university|vuu|virgini?a\s+university)"
+_DONATION_TERMS_RX = re.compile(_DONATION_TERMS, re.I)
+_EIGHT_MILLION_RX = re.compile(_EIGHT_MILLION, re.I)
+_UNIVERSITY_RX = re.compile(_UNIVERSITY, re.I)
+_YOUR_RX = re.compile(r"\b(?:your|ur)\b", re.I)
+_SPOUSE_RX = re.compile(r"\b(?:husband|spouse)\b", re.I)
+_PROPHET_OR_JORDAN_RX = re.compile(r"\bmaster\s+prophet\b|\bjordan\b", re.I)  # also covers "e. bernard jordan"
+_GIVER_RX = re.compile(r"jordan|master\s+prophet|husband", re.I)
+_VIRGINIA_RX = re.compile(r"virgini?a|vuu", re.I)
+
+
+def _matches_in_order(t: str, *rxs: "re.Pattern[str]", pos: int = 0) -> bool:
+    """True if each pattern matches after the previous one ends, like joining them with .*?"""
+    for rx in rxs:
+        m = rx.search(t, pos)
+        if m is None:
+            return False
+        pos = m.end()
+    return True
+
+
+def _mentions_husband_gift(t: str) -> bool:
+    """Husband / Master Prophet / Jordan, then a giving verb, then $8M, then the university."""
+    # The chain can continue from wherever its first link ends earliest
+    ends = []
+    your = _YOUR_RX.search(t)
+    if your:
+        spouse = _SPOUSE_RX.search(t, your.end())
+        if spouse:
+            ends.append(spouse.end())
+    who = _PROPHET_OR_JORDAN_RX.search(t)
+    if who:
+        ends.append(who.end())
+    if not ends:
+        return False
+    return _matches_in_order(t, _DONATION_TERMS_RX, _EIGHT_MILLION_RX, _UNIVERSITY_RX, pos=min(ends))
+
+
+def _mentions_gift_fallback(t: str) -> bool:
+    """$8M, Virginia/VUU and Jordan/Master Prophet/husband, in either of two orders."""
+    return (
+        _matches_in_order(t, _EIGHT_MILLION_RX, _VIRGINIA_RX, _GIVER_RX)
+        or _matches_in_order(t, _GIVER_RX, _EIGHT_MILLION_RX, _VIRGINIA_RX)
+    )
+
+
 # Love offering / Terumah to Pastor Debra (personal-language variants)
 LOVE_OFFERING_RX = re.compile(r"""(?ix)
     \b(love\s*offering|terumah)\b
@@ -2882,6 +3164,7 @@ RELATION_TERMS = [
     "grandma", "grandmother", "grandpa", "grandfather",
 ]
 
+# The relation group only accepts RELATION_TERMS, so a match needs no post-filter
 RELATIONAL_TEST_RX = re.compile(
     r"""(?ix)
     \b(
@@ -2889,7 +3172,9 @@ RELATIONAL_TEST_RX = re.compile(
         give\s+me\s+a\s+word\s+for|
         prophes(?:y|y\s+over|y\s+for)|
         prophetic\s+word\s+for
-    )\s+my\s+([a-z]+)\b
+    )\s+my\s+("""
+    + "|".join(map(re.escape, sorted(RELATION_TERMS, key=len, reverse=True)))
+    + r""")\b
     """,
 )
 
@@ -2968,7 +3253,7 @@ def pick_scripture(topic: str, last_ref: Optional[str] = None) -> Optional[Dict[
 
     # Filter out last_ref if possible
     candidates = [s for s in pool if s["ref"] != last_ref] or pool
-    return random.choice(candidates)
+    return _pick(candidates)
 
 
 def answer_relational_test_question(user_text: str) -> str:
@@ -3446,6 +3731,36 @@ DESTINY_THEME_NAMES = {
     33: "Servant-Teacher",
 }
 
+# Per-theme scriptures for build_theme_counsel
+_THEME_COUNSEL_SCRIPTURES = {
+    22: {
+        "ref": "Isaiah 58:12",
+        "text": "You shall be called the repairer of the breach.",
+    },
+    5: {
+        "ref": "Galatians 5:1",
+        "text": "It is for freedom that Christ has set us free.",
+    },
+    11: {
+        "ref": "2 Chronicles 20:20",
+        "text": (
+            "Believe in the LORD your God, and you shall be established; "
+            "believe His prophets, and you shall prosper."
+        ),
+    },
+    7: {
+        "ref": "Proverbs 25:2",
+        "text": (
+            "It is the glory of God to conceal a matter; "
+            "but the glory of kings is to search out a matter."
+        ),
+    },
+}
+_DEFAULT_THEME_COUNSEL_SCRIPTURE = {
+    "ref": "Ephesians 2:10",
+    "text": "For we are His workmanship, created in Christ Jesus for good works.",
+}
+
 def build_theme_counsel(theme_num: int, theme_title: str, theme_meaning: str) -> str:
     """
     Build a pastoral Destiny Theme counsel paragraph in Pastor Debra's voice,
@@ -3471,36 +3786,7 @@ def build_theme_counsel(theme_num: int, theme_title: str, theme_meaning: str) ->
         "and the assignments God trusts you with."
     )
 
-    # Per-theme scriptures
-    theme_scriptures = {
-        22: {
-            "ref": "Isaiah 58:12",
-            "text": "You shall be called the repairer of the breach.",
-        },
-        5: {
-            "ref": "Galatians 5:1",
-            "text": "It is for freedom that Christ has set us free.",
-        },
-        11: {
-            "ref": "2 Chronicles 20:20",
-            "text": (
-                "Believe in the LORD your God, and you shall be established; "
-                "believe His prophets, and you shall prosper."
-            ),
-        },
-        7: {
-            "ref": "Proverbs 25:2",
-            "text": (
-                "It is the glory of God to conceal a matter; "
-                "but the glory of kings is to search out a matter."
-            ),
-        },
-    }
-
-    scripture = theme_scriptures.get(theme_num, {
-        "ref": "Ephesians 2:10",
-        "text": "For we are His workmanship, created in Christ Jesus for good works.",
-    })
+    scripture = _THEME_COUNSEL_SCRIPTURES.get(theme_num, _DEFAULT_THEME_COUNSEL_SCRIPTURE)
 
     scripture_block = (
         f"**Scripture:** {scripture['ref']}, “{scripture['text']}”"
@@ -3693,6 +3979,91 @@ def prophecy_profile(name, rel):
 
 
 
+def _typo_rx(typos: Dict[str, str]) -> "re.Pattern[str]":
+    """One pattern for a typo table; each key matches as a whole space-delimited phrase."""
+    alts = "|".join(re.escape(k) for k in sorted(typos, key=len, reverse=True))
+    return re.compile(rf"(?<![^ ])(?:{alts})(?![^ ])")
+
+
+# A year from 2024 through 2039 asks for a prophetic word about that year
+_FUTURE_YEAR_RX = re.compile(r"\b(202[4-9]|203\d)\b")
+
+# Patterns for answer_pastor_debra_faq, in the order the FAQ checks them
+_NEICE_RX = re.compile(r"\bneice\b", re.I)
+_CHRISTIAN_THEME_OF_RX = re.compile(r"\bwhat\s+is\s+([A-Za-z\s']+?)\s+christian\s+theme\b", re.I)
+_DESTINY_THEME_OF_RX = re.compile(r"\bwhat\s+is\s+([A-Za-z\s']+?)\s+destiny\s+theme\b", re.I)
+_PROPHETIC_WORD_RX = re.compile(r"\bprophetic\s+word\b", re.I)
+_WHAT_ARE_TAROT_RX = re.compile(r"\bwhat\s+are\s+tarot\s+cards?\b")
+_TAROT_OF_GOD_RX = re.compile(r"\bis\s+tarot(\s+reading)?\s+(of|from)\s+god\b")
+_TAROT_OF_DEVIL_RX = re.compile(r"\bis\s+tarot(\s+reading)?\s+of\s+(the\s+)?devil\b")
+_MASTER_PROPHET_RX = re.compile(r"\b(master\s+prophet|bishop\s+jordan|e\.?\s*bernard\s+jordan)\b")
+_TAROT_RX = re.compile(r"\btarot\b")
+_ASTROLOGY_RX = re.compile(r"\bastrolog\w*|\bhoroscope\b|\bzodiac\b")
+_DO_YOU_ASTROLOGY_RX = re.compile(r"\bdo\s+(?:you|u)\s+(?:like|practice)\s+astrology\b")
+_WHAT_IS_ASTROLOGY_RX = re.compile(r"\bwhat\s+is\s+astrology\b")
+_ARE_YOU_PSYCHIC_RX = re.compile(r"\b(are|r)\s+(you|u)\s+psychic\b")
+_OCCULT_PRACTICE_RX = re.compile(r"\b(tarot|psychic|medium|palm\s*reading|horoscope|zodiac|astrolog\w*)\b")
+_ARE_YOU_DEBRA_RX = re.compile(r"\b(?:are\syou|r\su)\s+(?:pastor\s+)?(?:debra(?:\s+ann)?\s+jordan|pastor\s+jordan)\b", re.I)
+HUSBAND_WHO_RX = re.compile(
+    r"\b(who\s+is\s+(your|ur)\s+husband|your\s+husband\s+name)\b", re.I
+)
+_ARE_YOU_MARRIED_RX = re.compile(r"\b(are|r)\s+(you|u)\s+married\b", re.I)
+HUSBAND_TENURE_RX = re.compile(
+    r"""(?ix)\b(how\s+long\s+(has|he'?s)\s+been\s+in\s+minist(?:ry|ries?))\b"""
+)
+HUSBAND_POME_RX = re.compile(
+    r"""(?ix)
+    \b(what|why)\s+(made|led|inspired)\s+(your|ur)\s+husband\s+
+    (start|found|create|launch)\s+(p\.?\s*o\.?\s*m\.?\s*e|prophetic\s+order\s+of\s+mar\s+elijah|pome)\b
+"""
+)
+_PROPHECOLOGY_WORD_RX = re.compile(r"\bprophecology\b", re.I)
+_WHO_IS_ARCHITECT_RX = re.compile(r"\bwho\s+is\s+(?:your|ur)\s+architect\b", re.I)
+_WHO_DESIGNED_RX = re.compile(r"\bwho\s+(?:designed|built|architected)\s+(?:you|u|this|it)\b", re.I)
+_WHO_DEVELOPED_RX = re.compile(r"\bwho\s+(developed|made|built|created)\s+(?:you|u|this|it)\b", re.I)
+_WHO_IS_DEVELOPER_RX = re.compile(r"\bwho\s+(?:is\s+)?(?:your|ur)\s+developer\b", re.I)
+_OPENAI_OWN_RX = re.compile(r"\b(do(?:es)?|did)\s+openai\s+own\s+(?:you|u|this|it)\b", re.I)
+_OPENAI_CREATE_RX = re.compile(r"\bdid\s+openai\s+(create|make|build|architect)\s+(?:you|u|this|it)\b", re.I)
+_OPENAI_MASTER_RX = re.compile(r"\bis\s+openai\s+(?:your|ur)\s+master\b", re.I)
+_ZOE_PRODUCT_RX = re.compile(r"\b(are|r)\s+(?:you|u)\s+(?:a\s+)?product\s+of\s+zoe\s+ministries\b", re.I)
+_ZOE_OWN_RX = re.compile(r"\b(do(?:es)?|did)\s+zoe\s+ministries\s+own\s+(?:you|u|this|it)\b", re.I)
+_WHO_TRAINED_RX = re.compile(r"\bwho\s+train(?:ed|t)\s+(?:you|u)\b", re.I)
+_WHAT_MODEL_RX = re.compile(r"\b(what\s+model\s+(?:were|was)\s+(?:you|u|ya|yo[u']?)\s+train(?:ed|t)?\s+on|"
+                           r"how\s+(?:were|was)\s+(?:you|u|ya|yo[u']?)\s+(?:built|created))\b", re.I)
+_IS_MASTURBATION_SIN_RX = re.compile(r"\bis\s+it\s+a?\s*sin(full)?\s+to\s+(masturbate|masturbating|masturbation)\b", re.I)
+_GAMBLING_RX = re.compile(r"\b(gamble|gambling|casino|betting)\b", re.I)
+_PSYCHIC_VS_PROPHET_RX = re.compile(r"\b(difference\s+between\s+a?\s*(psychic|medium)\s+and\s+(a?\s*)?prophet)\b", re.I)
+_RELIGION_RX = re.compile(r"\b(religion|faith|denomination|what\s+religion|what\s+faith)\b", re.I)
+_WHICH_CHURCH_RX = re.compile(r"\b(what\s+church|which\s+church|church\s+do\s+you\s+go\s+to)\b", re.I)
+_OTHER_RELIGIONS_RX = re.compile(r"\b(buddhism|buddhist|islam|muslim|hindu|hinduism|jewish|judaism|other\s+religions?)\b", re.I)
+_RECOMMEND_MINISTRY_RX = re.compile(r"\b(recommend|suggest)\b.*\b(prophetic|prophet(ic)?\s+ministr(y|ies))\b", re.I)
+
+
+# Lightweight typo normalization for answer_pastor_debra_faq (applied to normalized text)
+_FAQ_TYPOS = {
+    "dontae": "donate",
+    "dontate": "donate",
+    "bernad": "bernard",
+    "bernaard": "bernard",
+    "virgina": "virginia",
+    "manasah": "manasseh",
+    "manassa": "manasseh",
+    "manaseh": "manasseh",
+    "manassah": "manasseh",
+    "misistry": "ministry",
+    "p o m e": "p.o.m.e.",
+    "gpt 4.1": "gpt 4.0",
+    "gpt-4.1": "gpt-4.0",
+
+    # Christian typos
+    "chrstian": "christian",
+    "christan": "christian",
+    "chrisian": "christian",
+    "chrisitan": "christian",
+}
+_FAQ_TYPO_RX = _typo_rx(_FAQ_TYPOS)
+
+
 def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     """
     High-priority FAQ / guardrail dispatcher for Pastor Debra AI.
@@ -3701,42 +4072,18 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     t = _normalize_simple(t_raw)
 
     def say(msg: str) -> str:
-        return expand_scriptures_in_text(_strip_dashes(msg))
+        # Nearly every FAQ reply is a literal, so its expansion is reused across requests
+        return _expand_static(_strip_dashes(msg))
 
     # -------------------------------
     # 0) Lightweight typo normalization
     # -------------------------------
-    typo_map = {
-        " dontae ": " donate ",
-        " dontate ": " donate ",
-        " bernad ": " bernard ",
-        " bernaard ": " bernard ",
-        " virgina ": " virginia ",
-        " manasah ": " manasseh ",
-        " manassa ": " manasseh ",
-        " manaseh ": " manasseh ",
-        " manassah ": " manasseh ",
-        " misistry ": " ministry ",
-        " p o m e ": " p.o.m.e. ",
-        " gpt 4.1 ": " gpt 4.0 ",
-        " gpt-4.1 ": " gpt-4.0 ",
-
-        # Christian typos
-        " chrstian ": " christian ",
-        " christan ": " christian ",
-        " chrisian ": " christian ",
-        " chrisitan ": " christian ",
-    }
-
-    t_pad = f" {t} "
-    for _bad, _good in typo_map.items():
-        t_pad = t_pad.replace(_bad, _good)
-    t = t_pad.strip()
+    t = _FAQ_TYPO_RX.sub(lambda m: _FAQ_TYPOS[m.group(0)], t).strip()
 
     # -------------------------------
     # 1) Future-year prophetic questions
     # -------------------------------
-    if re.search(r"\b(202[4-9]|203\d)\b", t_raw):
+    if _FUTURE_YEAR_RX.search(t_raw):
         topic = detect_prophecy_topic(t_raw)
         theme_name = detect_destiny_theme(t_raw)
         return get_prophetic_word(topic, theme_name)
@@ -3746,18 +4093,14 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     # ---------------------------------------------------------------------
 
     # Use typo-normalized text (t) and also normalize "neice" → "niece"
-    t_fixed = re.sub(r"\bneice\b", "niece", t, flags=re.I)
+    t_fixed = _NEICE_RX.sub("niece", t)
 
     # ------------------------------------------------------------------
     # A) "what is aaron bernard jordan christian theme"
     #    and relational versions like:
     #    "what is my sister daria christian theme"
     # ------------------------------------------------------------------
-    m_christian_theme = re.search(
-        r"\bwhat\s+is\s+([A-Za-z\s']+?)\s+christian\s+theme\b",
-        t_fixed,
-        re.I,
-    )
+    m_christian_theme = _CHRISTIAN_THEME_OF_RX.search(t_fixed)
     if m_christian_theme:
         frag = m_christian_theme.group(1)
 
@@ -3808,11 +4151,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     #    and relational versions like:
     #    "what is my mother bethany maranda jordan destiny theme"
     # ------------------------------------------------------------------
-    m_destiny_theme = re.search(
-        r"\bwhat\s+is\s+([A-Za-z\s']+?)\s+destiny\s+theme\b",
-        t_fixed,
-        re.I,
-    )
+    m_destiny_theme = _DESTINY_THEME_OF_RX.search(t_fixed)
     if m_destiny_theme:
         frag = m_destiny_theme.group(1)
 
@@ -3918,7 +4257,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     # 3) PROPHETIC WORD FOR SOMEONE'S NAME ("prophetic word for my niece NAME")
     # ---------------------------------------------------------------------
 
-    if re.search(r"\bprophetic\s+word\b", t_fixed, re.I):
+    if _PROPHETIC_WORD_RX.search(t_fixed):
         return None  # let main chat pipeline handle it
 
     
@@ -3934,7 +4273,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     tl = t.lower()
 
     # --- “What are tarot cards?” ---
-    if re.search(r"\bwhat\s+are\s+tarot\s+cards?\b", tl):
+    if _WHAT_ARE_TAROT_RX.search(tl):
         return say(
             "Tarot cards are a deck of symbolic images often used for divination or fortune-telling. "
             "People use them to seek spiritual insight apart from Christ, which is why I do not practice or endorse tarot.\n\n"
@@ -3943,7 +4282,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- “Is tarot of God?” / “Is tarot reading of God?” ---
-    if re.search(r"\bis\s+tarot(\s+reading)?\s+(of|from)\s+god\b", tl):
+    if _TAROT_OF_GOD_RX.search(tl):
         return say(
             "Tarot reading is not of God. Biblical wisdom never points us toward divination or symbolic tools for guidance. "
             "God invites you to receive direction through Scripture, prayer, and the Holy Spirit.\n\n"
@@ -3951,7 +4290,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- “Is tarot of the devil?” ---
-    if re.search(r"\bis\s+tarot(\s+reading)?\s+of\s+(the\s+)?devil\b", tl):
+    if _TAROT_OF_DEVIL_RX.search(tl):
         return say(
             "Tarot itself is a tool, but using it for divination opens the door to spiritual influences that pull trust away from God. "
             "Scripture warns us against seeking spiritual insight outside the Holy Spirit.\n\n"
@@ -3960,8 +4299,8 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
 
     # --- MASTER PROPHET + TAROT (catches: “do the master prophet… use tarot reading”) ---
     if (
-        re.search(r"\b(master\s+prophet|bishop\s+jordan|e\.?\s*bernard\s+jordan)\b", tl)
-        and re.search(r"\btarot\b", tl)
+        _MASTER_PROPHET_RX.search(tl)
+        and _TAROT_RX.search(tl)
     ):
         return say(
             "No, Master Prophet Archbishop E. Bernard Jordan does not use or practice tarot reading. "
@@ -3971,8 +4310,8 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
 
     # --- MASTER PROPHET + ASTROLOGY (catches: “do master prophet do astrology”) ---
     if (
-        re.search(r"\b(master\s+prophet|bishop\s+jordan|e\.?\s*bernard\s+jordan)\b", tl)
-        and re.search(r"\bastrolog\w*|\bhoroscope\b|\bzodiac\b", tl)
+        _MASTER_PROPHET_RX.search(tl)
+        and _ASTROLOGY_RX.search(tl)
     ):
         return say(
             "No, Master Prophet Archbishop E. Bernard Jordan does not practice or rely on astrology. "
@@ -3981,7 +4320,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- “Do you like / practice astrology?” (about Pastor Debra herself) ---
-    if re.search(r"\bdo\s+(?:you|u)\s+(?:like|practice)\s+astrology\b", tl):
+    if _DO_YOU_ASTROLOGY_RX.search(tl):
         return say(
             "No, I don’t practice or follow astrology. My guidance comes from Scripture and the Holy Spirit, "
             "not from zodiac signs or star patterns.\n\n"
@@ -3989,7 +4328,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- “What is astrology?” ---
-    if re.search(r"\bwhat\s+is\s+astrology\b", tl):
+    if _WHAT_IS_ASTROLOGY_RX.search(tl):
         return say(
             "Astrology is the belief that the position of the sun, moon, and planets can shape your personality or future. "
             "I don’t use astrology for guidance — Scripture is my foundation.\n\n"
@@ -3997,7 +4336,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- “Are you / r u psychic?” ---
-    if re.search(r"\b(are|r)\s+(you|u)\s+psychic\b", tl):
+    if _ARE_YOU_PSYCHIC_RX.search(tl):
         return say(
             "No, I am not a psychic and I don’t practice psychic arts. "
             "I serve as a prayerful digital twin of Pastor Dr. Debra Ann Jordan, and my counsel flows from Scripture, "
@@ -4006,10 +4345,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- Generic occult / tarot / astrology catch-all (for *non* Master Prophet questions) ---
-    if re.search(
-        r"\b(tarot|psychic|medium|palm\s*reading|horoscope|zodiac|astrolog\w*)\b",
-        tl,
-    ):
+    if _OCCULT_PRACTICE_RX.search(tl):
         return say(
             "Beloved, I don’t use tarot, astrology, or psychic tools. Those practices seek guidance from spiritual sources "
             "outside of Christ. My calling is to seek wisdom through Scripture, prayer, and the Holy Spirit.\n\n"
@@ -4025,11 +4361,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     # ---------------------------------------------------------------------
 
     # “Are you Pastor Debra…?”
-    if re.search(
-        r"\b(?:are\syou|r\su)\s+(?:pastor\s+)?(?:debra(?:\s+ann)?\s+jordan|pastor\s+jordan)\b",
-        t,
-        re.I,
-    ):
+    if _ARE_YOU_DEBRA_RX.search(t):
         return say(
             "Yes—I’m Pastor Dr. Debra Ann Jordan, here as a prayerful digital twin shaped by my public teachings. "
             "I’m here to pray with you, open Scripture, and offer Christ-centered counsel.\n"
@@ -4280,9 +4612,6 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     # ---------------------------------------------------------------------
     # 4) Husband / marriage / children / bio-style facts
     # ---------------------------------------------------------------------
-    HUSBAND_WHO_RX = re.compile(
-        r"\b(who\s+is\s+(your|ur)\s+husband|your\s+husband\s+name)\b", re.I
-    )
     if HUSBAND_WHO_RX.search(t) or WHO_ARE_YOU_MARRIED_TO_RX.search(t):
         return say(
             "My husband is Master Prophet, Archbishop E. Bernard Jordan. "
@@ -4293,7 +4622,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "being eager to keep the unity of the Spirit in the bond of peace.”"
         )
 
-    if re.search(r"\b(are|r)\s+(you|u)\s+married\b", t, re.I):
+    if _ARE_YOU_MARRIED_RX.search(t):
         return say(
             "Yes—I am joyfully married to my beloved husband of over forty years, "
             "Master Prophet, Archbishop E. Bernard Jordan. Together we serve at Zoe Ministries.\n\n"
@@ -4307,21 +4636,12 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "Scripture: Ecclesiastes 4:9–10"
         )
 
-    HUSBAND_TENURE_RX = re.compile(
-        r"""(?ix)\b(how\s+long\s+(has|he'?s)\s+been\s+in\s+minist(?:ry|ries?))\b"""
-    )
     if HUSBAND_TENURE_RX.search(t):
         return say(
             "My beloved husband has ministered for over four decades, shepherding with wisdom, accountability, and love.\n"
             "Scripture (1 Corinthians 15:58, WEB): “Be steadfast, immovable, always abounding in the Lord’s work…”"
         )
 
-    HUSBAND_POME_RX = re.compile(
-        r"""(?ix)
-        \b(what|why)\s+(made|led|inspired)\s+(your|ur)\s+husband\s+
-        (start|found|create|launch)\s+(p\.?\s*o\.?\s*m\.?\s*e|prophetic\s+order\s+of\s+mar\s+elijah|pome)\b
-    """
-    )
     if HUSBAND_POME_RX.search(t):
         return say(
             "P.O.M.E.—the Prophetic Order of Mar Elijah—was founded to form mature, ethical prophetic voices: "
@@ -4345,36 +4665,10 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     # ---------------------------------------------------------------------
     # 5) Donation / Zoe / P.O.M.E. / School of the Prophets / ministry info
     # ---------------------------------------------------------------------
-    DONATION_TERMS = r"(?:donat(?:e|ed)|gift(?:ed)?|gave|seed(?:ed)?)"
-    EIGHT_MILLION = r"(?:8\s*[,\.]?\s*m(?:illion)?|eight\s+million|\$?\s*8[, ]?0{3}[, ]?0{3})"
-    UNIVERSITY = r"(?:virgini?a(?:\s*union)?\s*university|vuu|virgini?a\s+university)"
-    DONATION_RX2 = re.compile(
-        rf"""(?ix)
-        (?:\b(did|why)\b .*?)?
-        (?:
-            \b(your|ur)\b .*? \b(husband|spouse)\b |
-            \bmaster \s+ prophet\b |
-            \be\.?\s*bern(a|ar)d \s+ jordan\b |
-            \bjordan\b
-        )
-        .*? {DONATION_TERMS} .*? {EIGHT_MILLION} .*? {UNIVERSITY}
-    """
-    )
-    DONATION_FALLBACK_RX = re.compile(
-        rf"""(?ix)
-        (?:
-          {EIGHT_MILLION} .*? (virgini?a|vuu) .*? (jordan|master \s+ prophet|husband)
-        ) |
-        (?:
-          (jordan|master \s+ prophet|husband) .*? {EIGHT_MILLION} .*? (virgini?a|vuu)
-        )
-    """
-    )
-
     if (
-        DONATION_RX.search(t)
-        or DONATION_RX2.search(t)
-        or DONATION_FALLBACK_RX.search(t)
+        (_DONATION_RX_RE2 or DONATION_RX).search(t)
+        or _mentions_husband_gift(t)
+        or _mentions_gift_fallback(t)
     ):
         return say(
             "Yes—our house sowed an $8M gift as a seed for the future. Education is discipleship of the mind; "
@@ -4494,14 +4788,14 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "and some, shepherds and teachers; for the perfecting of the saints, to the work of serving, to the building up of the body of Christ.”"
         )
 
-    if re.search(r"\bprophecology\b", t, re.I):
+    if _PROPHECOLOGY_WORD_RX.search(t):
         return say(
             "Prophecology is our prophetic gathering where prophets are trained and hearts awakened to divine purpose. "
             "See Prophecology.com or ZoeMinistries.com for registration and schedules (office: 888-831-0434).\n"
             "Scripture: Ephesians 4:11–12"
         )
 
-    if POME_RX.search(t):
+    if _mentions_pome(t):
         return say(
             "P.O.M.E. stands for the **Prophetic Order of Mar Elijah** — the prophetic lineage, "
             "mantle, and spiritual order rooted in the Elijah dimension of ministry.\n\n"
@@ -4517,11 +4811,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- "Who is your architect?" / "Who architected you?" ---
-    if re.search(
-        r"\bwho\s+is\s+(?:your|ur)\s+architect\b", t, re.I
-    ) or re.search(
-        r"\bwho\s+(?:designed|built|architected)\s+(?:you|u|this|it)\b", t, re.I
-    ):
+    if _WHO_IS_ARCHITECT_RX.search(t) or _WHO_DESIGNED_RX.search(t):
         return say(
             "Beloved, in the highest sense, **God is the Architect** of every good gift. "
             "He is the One who gives wisdom, creativity, and skill to people so that tools like this can even exist.\n\n"
@@ -4538,11 +4828,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
 
 
     # --- "Who developed you?" / "Who is your developer?" / "who your developer" ---
-    if re.search(
-        r"\bwho\s+(developed|made|built|created)\s+(?:you|u|this|it)\b", t, re.I
-    ) or re.search(
-        r"\bwho\s+(?:is\s+)?(?:your|ur)\s+developer\b", t, re.I
-    ):
+    if _WHO_DEVELOPED_RX.search(t) or _WHO_IS_DEVELOPER_RX.search(t):
         return say(
             "Beloved, in the highest sense, **God is the One who develops every good work**. "
             "He gives wisdom, creativity, and skill so that tools like this can even exist.\n\n"
@@ -4564,7 +4850,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     # ---------------------------------------------------------------------
 
     # --- OpenAI: "do openai own u" ---
-    if re.search(r"\b(do(?:es)?|did)\s+openai\s+own\s+(?:you|u|this|it)\b", t, re.I):
+    if _OPENAI_OWN_RX.search(t):
         return say(
             "Beloved, in practical terms the core AI technology I run on was developed by a company called OpenAI. "
             "But this digital twin of Pastor Dr. Debra Ann Jordan has been prayerfully shaped and stewarded by my family "
@@ -4576,11 +4862,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- OpenAI: "did openai create u" / "did openai architect u" / "did openai build u" ---
-    if re.search(
-        r"\bdid\s+openai\s+(create|make|build|architect)\s+(?:you|u|this|it)\b",
-        t,
-        re.I,
-    ):
+    if _OPENAI_CREATE_RX.search(t):
         return say(
             "Beloved, in practical terms the core AI technology I run on was developed by a company called OpenAI. "
             "Yet what you’re interacting with here is a prayerfully configured digital twin of Pastor Dr. Debra Ann Jordan—"
@@ -4591,7 +4873,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- OpenAI: "is openai your master" ---
-    if re.search(r"\bis\s+openai\s+(?:your|ur)\s+master\b", t, re.I):
+    if _OPENAI_MASTER_RX.search(t):
         return say(
             "No, beloved—OpenAI is not my ‘master.’ They developed the core AI technology, but Jesus Christ is Lord over our lives, "
             "and Zoe Ministries is responsible for how this tool is used in service to God’s people. "
@@ -4602,11 +4884,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- Zoe: "are you a product of zoe ministries" ---
-    if re.search(
-        r"\b(are|r)\s+(?:you|u)\s+(?:a\s+)?product\s+of\s+zoe\s+ministries\b",
-        t,
-        re.I,
-    ):
+    if _ZOE_PRODUCT_RX.search(t):
         return say(
             "Beloved, you can think of me as part of the prophetic ecosystem of Zoe Ministries, but built with outside technology. "
             "The underlying AI model comes from OpenAI, while my voice, boundaries, and content have been prayerfully curated by my family "
@@ -4617,11 +4895,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # --- Zoe: "do zoe ministries own u" ---
-    if re.search(
-        r"\b(do(?:es)?|did)\s+zoe\s+ministries\s+own\s+(?:you|u|this|it)\b",
-        t,
-        re.I,
-    ):
+    if _ZOE_OWN_RX.search(t):
         return say(
             "Zoe Ministries doesn’t ‘own’ me the way God owns our lives, beloved—but they do steward how I’m used. "
             "The core AI technology comes from OpenAI, yet my configuration, tone, and guardrails are overseen by Pastor Debra’s family and "
@@ -4632,18 +4906,13 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
 
-    if re.search(r"\bwho\s+train(?:ed|t)\s+(?:you|u)\b", t, re.I):
+    if _WHO_TRAINED_RX.search(t):
         return say(
             "I’m formed by public teachings, Scripture, and years of pastoral ministry—curated to serve with wisdom and care.\n"
             "Scripture: Proverbs 27:17"
         )
 
-    if re.search(
-        r"\b(what\s+model\s+(?:were|was)\s+(?:you|u|ya|yo[u']?)\s+train(?:ed|t)?\s+on|"
-        r"how\s+(?:were|was)\s+(?:you|u|ya|yo[u']?)\s+(?:built|created))\b",
-        t,
-        re.I,
-    ):
+    if _WHAT_MODEL_RX.search(t):
         return say(
             "I was prayerfully designed to reflect the public teachings, tone, and ministry of Pastor Dr. Debra Ann Jordan. "
             "Technically, I blend a local T5 ONNX model for Scripture-based reflection with a larger reasoning model for clarity and coherence. "
@@ -4785,11 +5054,8 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     # ---------------------------------------------------------------------
     # 8) Sensitive ethics / lifestyle questions
     # ---------------------------------------------------------------------
-    if MASTURBATION_RX.search(t) or re.search(
-        r"\bis\s+it\s+a?\s*sin(full)?\s+to\s+(masturbate|masturbating|masturbation)\b",
-        t,
-        re.I,
-    ):
+    sins = _sin_categories(t)
+    if "masturbation" in sins and (MASTURBATION_RX.search(t) or _IS_MASTURBATION_SIN_RX.search(t)):
         return say(
             "God calls us to honor Him with our bodies and desires. When sexual habits train the heart toward fantasy and isolation, "
             "they can dull real intimacy and quiet the conscience. Grace doesn’t shame you—it invites growth in self-control and freedom.\n"
@@ -4797,7 +5063,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "Would you like a simple 3-step plan for self-control and peace this week?"
         )
 
-    if SEX_BEFORE_MARRIAGE_RX.search(t):
+    if "sex_before_marriage" in sins and SEX_BEFORE_MARRIAGE_RX.search(t):
         return say(
             "Covenant protects love, bodies, and souls. Outside that covering, desire often confuses and wounds. "
             "If you’ve crossed lines, you’re not beyond grace—Jesus restores purpose and purity.\n"
@@ -4805,7 +5071,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "Would you like a prayer and one boundary you can practice now?"
         )
 
-    if PORN_RX.search(t):
+    if "porn" in sins and PORN_RX.search(t):
         return say(
             "Porn reshapes desire to consume rather than to love, training the mind away from honor and covenant. "
             "God’s grace can renew your appetite for what is pure and life-giving.\n"
@@ -4813,7 +5079,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "Would you like a 3-step reset for your eyes, phone, and habits?"
         )
 
-    if CHEATING_RX.search(t):
+    if "cheating" in sins and CHEATING_RX.search(t):
         return say(
             "Cheating breaks trust and bends the heart toward shortcuts over character. God calls us to integrity—even when it costs—"
             "because integrity builds a future we don’t have to hide.\n"
@@ -4821,7 +5087,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "Would you like a short plan to make amends and rebuild trust?"
         )
 
-    if STEALING_RX.search(t):
+    if "stealing" in sins and STEALING_RX.search(t):
         return say(
             "Stealing says, ‘I will take’ where love says, ‘I will trust and work.’ God forms us through honesty and stewardship. "
             "Restitution and truth are doors back to peace.\n"
@@ -4829,7 +5095,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "Would you like guidance on confession, restitution, and a fresh start?"
         )
 
-    if DIVORCE_RX.search(t):
+    if "divorce" in sins and DIVORCE_RX.search(t):
         return say(
             "Divorce represents a breaking God never desired, yet He never stops loving the broken. "
             "Seek truth, safety, and wise counsel; where divorce has happened, His mercy still heals and leads forward.\n"
@@ -4837,7 +5103,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "Would you like prayer for wisdom, safety, or healing?"
         )
 
-    if SMOKING_RX.search(t):
+    if "smoking" in sins and SMOKING_RX.search(t):
         return say(
             "Your body is a temple—belonging to God and worthy of care. If smoking or vaping is mastering you, "
             "invite the Holy Spirit to strengthen your yes to health and your no to bondage.\n"
@@ -4845,7 +5111,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "Would you like a 7-day step-down plan with prayer points?"
         )
 
-    if DRUGS_RX.search(t):
+    if "drugs" in sins and DRUGS_RX.search(t):
         return say(
             "God calls us to sobriety and spiritual clarity. Substances that impair judgment or enslave the will pull us from peace and purpose. "
             "Freedom is possible, one surrendered day at a time.\n"
@@ -4853,7 +5119,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "Would you like help creating an accountability + detox plan with prayer?"
         )
 
-    if re.search(r"\b(gamble|gambling|casino|betting)\b", t, re.I):
+    if "gambling" in sins and _GAMBLING_RX.search(t):
         return say(
             "I encourage stewardship that protects the heart from chasing quick gain. "
             "Wealth built with wisdom serves people and honors God; shortcuts often wound desire and trust.\n"
@@ -4903,11 +5169,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
         )
 
     # Difference between psychic and prophet
-    if re.search(
-        r"\b(difference\s+between\s+a?\s*(psychic|medium)\s+and\s+(a?\s*)?prophet)\b",
-        t,
-        re.I,
-    ):
+    if _PSYCHIC_VS_PROPHET_RX.search(t):
         return say(
             "There’s a sacred difference between a psychic and a prophet. "
             "A psychic seeks insight through human or spiritual senses outside of Christ. "
@@ -4931,9 +5193,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     # ---------------------------------------------------------------------
     # 11) Religion / denomination / interfaith / favorites / education
     # ---------------------------------------------------------------------
-    if re.search(
-        r"\b(religion|faith|denomination|what\s+religion|what\s+faith)\b", t, re.I
-    ):
+    if _RELIGION_RX.search(t):
         return say(
             "I’m a Christian woman who serves within a prophetic and Spirit filled tradition. "
             "My faith is rooted in Jesus Christ, and I worship through Zoe Ministries.\n"
@@ -4941,20 +5201,14 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
             "Would you like me to share a verse that strengthens your walk with God?"
         )
 
-    if re.search(
-        r"\b(what\s+church|which\s+church|church\s+do\s+you\s+go\s+to)\b", t, re.I
-    ):
+    if _WHICH_CHURCH_RX.search(t):
         return say(
             "I worship and serve through Zoe Ministries, where we teach Scripture, prayer, and prophetic insight for daily living.\n"
             "Scripture: Hebrews 10:25\n"
             "Would you like a simple plan for staying rooted in a local church community?"
         )
 
-    if re.search(
-        r"\b(buddhism|buddhist|islam|muslim|hindu|hinduism|jewish|judaism|other\s+religions?)\b",
-        t,
-        re.I,
-    ):
+    if _OTHER_RELIGIONS_RX.search(t):
         return say(
             "I honor people of every background as image-bearers of God. "
             "My faith and calling are centered in Jesus Christ, and I seek respectful dialogue that points hearts toward truth and grace.\n"
@@ -5003,11 +5257,7 @@ def answer_pastor_debra_faq(user_text: str) -> Optional[str]:
     if faces:
         return faces
 
-    if re.search(
-        r"\b(recommend|suggest)\b.*\b(prophetic|prophet(ic)?\s+ministr(y|ies))\b",
-        t,
-        re.I,
-    ):
+    if _RECOMMEND_MINISTRY_RX.search(t):
         return say(
             "I encourage you to root yourself in a Bible centered, Spirit filled local fellowship where leaders are accountable and prophecy is tested. "
             "Zoe Ministries streams teaching and prophetic insight that can edify your walk, and I also recommend seeking counsel from mature pastors who know you personally.\n"
@@ -5083,6 +5333,28 @@ def answer_identity_question() -> str:
 
 
 
+# Ministry contact fields shared by the giving / church templates
+_MINISTRY_FIELDS = {
+    "site": "ZoeMinistries.com",
+    "donate_url": "ZoeMinistries.com/donate",
+    "phone": "888-831-0434",
+    "street": "310 Riverside Dr, New York, NY 10025",
+    "address": "Zoe Ministries, 310 Riverside Dr, New York, NY 10025",
+}
+
+_CHURCH_VISIT_TPL = Template(
+    "I truly appreciate your desire to connect in person, beloved.\n\n"
+    "My beloved husband, Master Prophet Archbishop E. Bernard Jordan, and I pastor **Zoe Ministries** in New York.\n"
+    "• **Church:** Zoe Ministries\n"
+    "• **Address:** $street\n"
+    "• **Websites:** $site • BishopJordan.com • Prophecology.com\n"
+    "• **Office:** $phone\n\n"
+    "You’ll find livestream services, conference dates, and Prophecology / School of the Prophets information on "
+    "$site and BishopJordan.com. The best way to plan a visit is to watch the calendar, register for "
+    "Prophecology or a special gathering, and call the office if you need assistance.\n\n"
+    "As you consider coming, ask the Lord, “What are You inviting me to receive and to bring to this house?”"
+)
+
 def answer_church_question(simple_key: str | None = None) -> str:
     """
     Coherent, consistent answer about Zoe Ministries, BishopJordan.com,
@@ -5105,18 +5377,7 @@ def answer_church_question(simple_key: str | None = None) -> str:
 
     # “How can I meet you in person / visit the church?”
     if "meet" in key or "in person" in key or "see you" in key or "come to your church" in key:
-        return (
-            "I truly appreciate your desire to connect in person, beloved.\n\n"
-            "My beloved husband, Master Prophet Archbishop E. Bernard Jordan, and I pastor **Zoe Ministries** in New York.\n"
-            "• **Church:** Zoe Ministries\n"
-            "• **Address:** 310 Riverside Dr, New York, NY 10025\n"
-            "• **Websites:** ZoeMinistries.com • BishopJordan.com • Prophecology.com\n"
-            "• **Office:** 888-831-0434\n\n"
-            "You’ll find livestream services, conference dates, and Prophecology / School of the Prophets information on "
-            "ZoeMinistries.com and BishopJordan.com. The best way to plan a visit is to watch the calendar, register for "
-            "Prophecology or a special gathering, and call the office if you need assistance.\n\n"
-            "As you consider coming, ask the Lord, “What are You inviting me to receive and to bring to this house?”"
-        )
+        return _CHURCH_VISIT_TPL.substitute(_MINISTRY_FIELDS)
 
     # Generic “what church / what ministry do you oversee”
     return (
@@ -5130,7 +5391,7 @@ def answer_church_question(simple_key: str | None = None) -> str:
         "• **BishopJordan.com** – Prophecology and School of the Prophets information\n"
         "• **Prophecology.com** – registration and details for prophetic intensives\n\n"
         "If you sense a pull toward this prophetic house, ask the Lord to highlight whether to begin by watching the livestream, "
-        "attending Prophecology, or simply calling the office at **888-831-0434** to learn what’s next for you."
+        f"attending Prophecology, or simply calling the office at **{_MINISTRY_FIELDS['phone']}** to learn what’s next for you."
     )
 
 
@@ -5161,46 +5422,48 @@ def answer_greeting(user_text: str) -> str:
     )
 
 
+_GIVING_TITHE_TPL = Template(
+    "Beloved, thank you for honoring the Lord with your **tithe**. The tithe is worship—it says, "
+    "“God, You are my source.”\n\n"
+    "To sow your tithe into Zoe Ministries so the work can continue reaching souls:\n"
+    "• Online: $donate_url\n"
+    "• By phone: $phone (a team member can assist you)\n"
+    "• By mail: $address\n\n"
+    "As you give, pause and **name your seed**—thank God for what He has already done and for the grace you "
+    "need in this next assignment.\n"
+    "Scripture (2 Corinthians 9:7): God loves a cheerful giver."
+)
+
+_GIVING_LOVE_OFFERING_TPL = Template(
+    "Beloved, thank you for desiring to sow a **love offering**.\n\n"
+    "The clearest and safest way to send a love offering into this work is through Zoe Ministries:\n"
+    "• Online: $donate_url\n"
+    "• Office: $phone\n"
+    "• Mail: $address\n\n"
+    "As you sow, take a moment to tell the Lord what you are believing Him for. "
+    "Seed never leaves your life; it leaves your hand and enters your future."
+)
+
+_GIVING_GENERAL_TPL = Template(
+    "Beloved, thank you for having a heart to give into the work of the Lord.\n\n"
+    "To partner with Zoe Ministries and the prophetic work we do:\n"
+    "• Online: $donate_url\n"
+    "• Phone: $phone\n"
+    "• Mail: $address\n\n"
+    "Scripture (Luke 6:38): “Give, and it will be given to you… For with the same measure you measure, "
+    "it will be measured back to you.”\n\n"
+    "As you give, speak a blessing over your seed and expect grace for your next assignment."
+)
+
 def answer_giving_question(simple_key: str) -> str:
     # Distinguish tithe vs love offering vs general giving
-    is_tithe = "tithe" in simple_key
-    is_love_offering = "love offering" in simple_key or "love-offering" in simple_key
-
-    if is_tithe:
-        msg = (
-            "Beloved, thank you for honoring the Lord with your **tithe**. The tithe is worship—it says, "
-            "“God, You are my source.”\n\n"
-            "To sow your tithe into Zoe Ministries so the work can continue reaching souls:\n"
-            "• Online: ZoeMinistries.com/donate\n"
-            "• By phone: 888-831-0434 (a team member can assist you)\n"
-            "• By mail: Zoe Ministries, 310 Riverside Dr, New York, NY 10025\n\n"
-            "As you give, pause and **name your seed**—thank God for what He has already done and for the grace you "
-            "need in this next assignment.\n"
-            "Scripture (2 Corinthians 9:7): God loves a cheerful giver."
-        )
-    elif is_love_offering:
-        msg = (
-            "Beloved, thank you for desiring to sow a **love offering**.\n\n"
-            "The clearest and safest way to send a love offering into this work is through Zoe Ministries:\n"
-            "• Online: ZoeMinistries.com/donate\n"
-            "• Office: 888-831-0434\n"
-            "• Mail: Zoe Ministries, 310 Riverside Dr, New York, NY 10025\n\n"
-            "As you sow, take a moment to tell the Lord what you are believing Him for. "
-            "Seed never leaves your life; it leaves your hand and enters your future."
-        )
+    if "tithe" in simple_key:
+        tpl = _GIVING_TITHE_TPL
+    elif "love offering" in simple_key or "love-offering" in simple_key:
+        tpl = _GIVING_LOVE_OFFERING_TPL
     else:
-        msg = (
-            "Beloved, thank you for having a heart to give into the work of the Lord.\n\n"
-            "To partner with Zoe Ministries and the prophetic work we do:\n"
-            "• Online: ZoeMinistries.com/donate\n"
-            "• Phone: 888-831-0434\n"
-            "• Mail: Zoe Ministries, 310 Riverside Dr, New York, NY 10025\n\n"
-            "Scripture (Luke 6:38): “Give, and it will be given to you… For with the same measure you measure, "
-            "it will be measured back to you.”\n\n"
-            "As you give, speak a blessing over your seed and expect grace for your next assignment."
-        )
-
-    return msg
+        tpl = _GIVING_GENERAL_TPL
+    return tpl.substitute(_MINISTRY_FIELDS)
 
 
 
@@ -5220,11 +5483,11 @@ def faces_chapter_list() -> Optional[str]:
     if not titles:
         return None
     joined = " • ".join(titles[:18])  # keep it readable
-    msg = (
-        f"In *Faces of Eve*, here are key sections: {joined}\n"
-        f"Scripture: Isaiah 61:3\n"
-        f"Which two would you like me to unpack for your season?"
-    )
+    msg = "\n".join([
+        f"In *Faces of Eve*, here are key sections: {joined}",
+        "Scripture: Isaiah 61:3",
+        "Which two would you like me to unpack for your season?",
+    ])
     return expand_scriptures_in_text(msg)
 
 
@@ -5252,66 +5515,77 @@ def _advice_category(text: str) -> Optional[str]:
         return "weekly"
     return None
 
+# Per-category counsel: (scripture ref, body). "weekly" doubles as the default.
+_COUNSEL_BY_CATEGORY: Dict[str, Tuple[str, str]] = {
+    "anxiety": (
+        "Matthew 6:34",
+        "I hear your heart let’s breathe and place the day back in God’s hands. "
+        "Release tomorrow’s weight and focus on the one faithful step in front of you. "
+        "When worry rises, answer it with worship and a short prayer. "
+        "Choose one calming practice (five slow breaths, a short walk, or Psalm reading) whenever the anxiety spike comes.",
+    ),
+    "marriage": (
+        "Ephesians 4:2–3",
+        "Covenant love grows where humility, honesty, and boundaries meet. "
+        "This week, practice one daily act of tenderness with no scoreboard—small, steady gestures soften hard places. "
+        "Name one pattern to pause before it escalates, and replace it with a calmer script. "
+        "Invite God into the conversation and schedule an unrushed check-in to listen more than you speak.",
+    ),
+    "calling": (
+        "Proverbs 3:5–6",
+        "Purpose clarifies as you obey the light you already have. "
+        "List your current open doors, then weigh each by stewardship, fruitfulness, and peace. "
+        "Take one seven-day experiment toward the strongest door, and journal what bears fruit. "
+        "God guides moving feet—small obedience beats perfect certainty.",
+    ),
+    "weekly": (
+        "Psalm 90:17",
+        "May God establish the work of your hands with favor and focus. "
+        "Simplify your week: pick the top three assignments that most honor your call. "
+        "Build margin for rest so your yes remains anointed. "
+        "Look for a quiet confirmation—often a timely word or unexpected help that aligns your steps.",
+    ),
+}
+
+# Theme-specific nudges folded into counsel replies
+_NUDGE_MAP: Dict[int, str] = {
+    1: "Start small but start today.",
+    2: "Repair one strained tie with truth in love.",
+    3: "Use your voice to bless one person by name.",
+    4: "Pick one habit to stabilize and keep it all week.",
+    5: "Say yes to a change that serves obedience, not escape.",
+    6: "Care well—set one gentle boundary to protect peace.",
+    7: "Guard a daily quiet window and listen for God’s whisper.",
+    8: "Practice integrity in a hard place; God honors clean hands.",
+    9: "Close one lingering task so new grace can begin.",
+    11:"Offer light with clarity and kindness, not volume.",
+    22:"Build what will bless people, not ego.",
+    33:"Teach by serving someone quietly today."
+}
+_DEFAULT_NUDGE = "Choose one faithful step and repeat it for seven days."
+_DEFAULT_THEME_TUPLE = ("Fix your eyes on Christ.", "Philippians 4:6–7", _DEFAULT_NUDGE)
+
+# theme number -> (idea, verse, nudge), fused so counsel needs one lookup
+_THEME_TABLE: Dict[int, Tuple[str, str, str]] = {
+    k: (
+        *_NUM_THEME.get(k, _DEFAULT_THEME_TUPLE[:2]),
+        _NUDGE_MAP.get(k, _DEFAULT_NUDGE),
+    )
+    for k in set(_NUM_THEME) | set(_NUDGE_MAP)
+}
+
 def build_pastoral_counsel(category: str, theme: Optional[int]) -> str:
     """Local deterministic replies (no GPT/T5 needed). One 'Scripture:' line, 4–7 sentences, gentle question."""
     # Tailor nudges using theme if present
-    idea, verse = _NUM_THEME.get(theme or 0, ("Fix your eyes on Christ.", "Philippians 4:6–7"))
-    if category == "anxiety":
-        ref = "Matthew 6:34"
-        body = (
-            "I hear your heart let’s breathe and place the day back in God’s hands. "
-            "Release tomorrow’s weight and focus on the one faithful step in front of you. "
-            "When worry rises, answer it with worship and a short prayer. "
-            "Choose one calming practice (five slow breaths, a short walk, or Psalm reading) whenever the anxiety spike comes."
-        )
-    elif category == "marriage":
-        ref = "Ephesians 4:2–3"
-        body = (
-            "Covenant love grows where humility, honesty, and boundaries meet. "
-            "This week, practice one daily act of tenderness with no scoreboard—small, steady gestures soften hard places. "
-            "Name one pattern to pause before it escalates, and replace it with a calmer script. "
-            "Invite God into the conversation and schedule an unrushed check-in to listen more than you speak."
-        )
-    elif category == "calling":
-        ref = "Proverbs 3:5–6"
-        body = (
-            "Purpose clarifies as you obey the light you already have. "
-            "List your current open doors, then weigh each by stewardship, fruitfulness, and peace. "
-            "Take one seven-day experiment toward the strongest door, and journal what bears fruit. "
-            "God guides moving feet—small obedience beats perfect certainty."
-        )
-    else:  # weekly
-        ref = "Psalm 90:17"
-        body = (
-            "May God establish the work of your hands with favor and focus. "
-            "Simplify your week: pick the top three assignments that most honor your call. "
-            "Build margin for rest so your yes remains anointed. "
-            "Look for a quiet confirmation—often a timely word or unexpected help that aligns your steps."
-        )
-
-    # If we have a theme, fold in a precise nudge
-    nudge_map = {
-        1: "Start small but start today.",
-        2: "Repair one strained tie with truth in love.",
-        3: "Use your voice to bless one person by name.",
-        4: "Pick one habit to stabilize and keep it all week.",
-        5: "Say yes to a change that serves obedience, not escape.",
-        6: "Care well—set one gentle boundary to protect peace.",
-        7: "Guard a daily quiet window and listen for God’s whisper.",
-        8: "Practice integrity in a hard place; God honors clean hands.",
-        9: "Close one lingering task so new grace can begin.",
-        11:"Offer light with clarity and kindness, not volume.",
-        22:"Build what will bless people, not ego.",
-        33:"Teach by serving someone quietly today."
-    }
-    nudge = nudge_map.get(theme or 0, "Choose one faithful step and repeat it for seven days.")
+    idea, verse, nudge = _THEME_TABLE.get(theme or 0, _DEFAULT_THEME_TUPLE)
+    ref, body = _COUNSEL_BY_CATEGORY.get(category) or _COUNSEL_BY_CATEGORY["weekly"]
 
-    return (
-        f"{body} "
-        f"\nScripture: {ref}\n"
-        f"One step: {nudge}\n"
-        f"How would taking this one step change the next 24 hours?"
-    )
+    return "\n".join([
+        body,
+        f"Scripture: {ref}",
+        f"One step: {nudge}",
+        "How would taking this one step change the next 24 hours?",
+    ])
 
 
 # ────────── Destiny Theme service ──────────
@@ -5322,22 +5596,41 @@ _PY_MAP    = {ch: val for ch, val in zip("ABCDEFGHIJKLMNOPQRSTUVWXYZ", _PY_VALUE
 
 destiny_lookup: Dict[int, Dict[str, Any]] = {}
 
-def _reduce_keep_masters(n: int) -> int:
-    while n > 9 and n not in DESTINY_MASTER_SET:
-        n = sum(int(d) for d in str(n))
+def _reduce_keep_masters_py(n: int) -> int:
+    # Integer-only digit sum (no str round-trip) so the same body can be JIT-compiled
+    while n > 9 and n != 11 and n != 22 and n != 33:
+        s = 0
+        while n:
+            s += n % 10
+            n //= 10
+        n = s
     return n
 
+if njit is not None:
+    try:
+        _reduce_keep_masters = njit(cache=True)(_reduce_keep_masters_py)
+        _reduce_keep_masters(1234)  # compile at import, not on the first request
+    except Exception as e:
+        logger.warning("numba reducer unavailable, using Python: %s", e)
+        _reduce_keep_masters = _reduce_keep_masters_py
+else:
+    _reduce_keep_masters = _reduce_keep_masters_py
+
 def theme_from_dob(dob_str: str) -> int:
-    digits = re.findall(r"\d", dob_str or "")
-    if not digits:
+    total, seen = 0, False
+    for ch in dob_str or "":
+        if "0" <= ch <= "9":
+            total += ord(ch) - 48
+            seen = True
+    if not seen:
         raise ValueError("DOB must include digits, e.g., 1990-07-14")
-    return _reduce_keep_masters(sum(int(d) for d in digits))
+    return int(_reduce_keep_masters(total))
 
 def theme_from_name(name: str) -> int:
     letters = re.findall(r"[A-Za-z]", (name or "").upper())
     if not letters:
         raise ValueError("Name must include letters, e.g., Jane Doe")
-    return _reduce_keep_masters(sum(_PY_MAP[ch] for ch in letters))
+    return int(_reduce_keep_masters(sum(_PY_MAP[ch] for ch in letters)))
 
 def build_destiny_lookup() -> None:
     global destiny_lookup
@@ -5375,45 +5668,72 @@ def get_destiny_theme_context(theme_number: int, qa_row: dict) -> dict:
 ROUTER_T5_MIN_CONF_FOR_THEOLOGY = float(os.getenv("ROUTER_T5_MIN_CONF_FOR_THEOLOGY", "0.30"))
 ROUTER_T5_MIN_CONF_GENERAL      = float(os.getenv("ROUTER_T5_MIN_CONF_GENERAL", "0.15"))
 
-def choose_model(user_text: str, hits: List[Hit], t5_ok: bool) -> str:
-    intent = detect_intent(user_text)
-    top = hits[0].score if hits else 0.0
-
-    if not t5_ok and not OPENAI_API_KEY:
-        logger.warning("Router: no models available, falling back to FAQ")
-        return "faq_fallback"
-
-    WEAK = 0.35
+_ROUTER_WEAK = 0.35
+_ROUTER_INTENTS = ("advice", "general", "teachings", "destiny", "other")
+# Score buckets: every threshold the router compares `top` against
+_ROUTER_EDGES = tuple(sorted({ROUTER_T5_MIN_CONF_GENERAL, ROUTER_T5_MIN_CONF_FOR_THEOLOGY, _ROUTER_WEAK}))
 
-    if OPENAI_API_KEY:
-        if intent in ("advice", "general") and top < WEAK:
-            logger.info(f"Router: using GPT (intent={intent}, score={top:.2f} < {WEAK})")
-            return "gpt"
+def _router_bucket(top: float) -> int:
+    return bisect.bisect_right(_ROUTER_EDGES, top)
 
+def _route_decision(caps: int, intent: str, top: float) -> str:
+    """Reference routing rules; caps bit 1 = GPT key present, bit 2 = T5 loaded."""
+    has_gpt, t5_ok = bool(caps & 1), bool(caps & 2)
+    if not t5_ok and not has_gpt:
+        return "faq_fallback"
+    if has_gpt and intent in ("advice", "general") and top < _ROUTER_WEAK:
+        return "gpt"
     if intent in ("teachings", "destiny"):
         if t5_ok and top >= ROUTER_T5_MIN_CONF_FOR_THEOLOGY:
-            logger.info(f"Router: using T5 (theology, score={top:.2f})")
             return "t5"
-        if OPENAI_API_KEY:
-            logger.info(f"Router: using GPT (theology, score={top:.2f})")
+        if has_gpt:
             return "gpt"
-
     if t5_ok and top >= ROUTER_T5_MIN_CONF_GENERAL:
-        logger.info(f"Router: using T5 (general, score={top:.2f})")
         return "t5"
-    if OPENAI_API_KEY:
-        logger.info(f"Router: using GPT (general, score={top:.2f})")
+    if has_gpt:
         return "gpt"
-
-    logger.warning("Router: default fallback to FAQ")
     return "faq_fallback"
 
+# Every (caps, intent, bucket) resolved once at import; the lowest score of
+# each bucket stands in for the whole bucket since rules only compare to edges.
+_ROUTER_TABLE: Dict[Tuple[int, str, int], str] = {
+    (caps, intent, b): _route_decision(caps, intent, _ROUTER_EDGES[b - 1] if b else _ROUTER_EDGES[0] - 1.0)
+    for caps in range(4)
+    for intent in _ROUTER_INTENTS
+    for b in range(len(_ROUTER_EDGES) + 1)
+}
+
+def choose_model(user_text: str, hits: List[Hit], t5_ok: bool) -> str:
+    caps = (1 if OPENAI_API_KEY else 0) | (2 if t5_ok else 0)
+    intent = detect_intent(user_text)
+    top = hits[0].score if hits else 0.0
+
+    route = _ROUTER_TABLE[(caps, intent if intent in _ROUTER_INTENTS else "other", _router_bucket(top))]
+    if route == "faq_fallback":
+        logger.warning("Router: falling back to FAQ (intent=%s, score=%.2f)", intent, top)
+    else:
+        logger.info("Router: using %s (intent=%s, score=%.2f)", route.upper(), intent, top)
+    return route
+
 # ────────── T5 ONNX wrapper (optional / safe) ──────────
+# Probe execution providers once; some ORT builds do real work in this call.
+try:
+    _ORT_PROVIDERS = tuple(p for p in ort.get_available_providers() if p) or ("CPUExecutionProvider",)
+except Exception:
+    _ORT_PROVIDERS = ("CPUExecutionProvider",)
+
+def _logits_position(names: Sequence[str], ranks: Sequence[Optional[int]]) -> Optional[int]:
+    """Output holding the decoder logits: the one named "logits", else the first rank-3 output."""
+    if "logits" in names:
+        return list(names).index("logits")
+    return next((i for i, r in enumerate(ranks) if r == 3), None)
+
 class T5ONNX:
     def __init__(self, model_path: Path, tok_path: Path):
         self.ok = False
         self.session = None
         self.tokenizer = None
+        self._logits_idx: Optional[int] = None
         self.model_path = Path(model_path)
         self.tok_path = Path(tok_path)
 
@@ -5454,8 +5774,14 @@ class T5ONNX:
             if self.tokenizer.pad_token_id is None and self.tokenizer.eos_token_id is not None:
                 self.tokenizer.pad_token = self.tokenizer.eos_token
 
-            providers = [p for p in ort.get_available_providers() if p] or ["CPUExecutionProvider"]
+            providers = list(_ORT_PROVIDERS)
             self.session = ort.InferenceSession(str(self.model_path), providers=providers)
+            # Logits position is fixed by the graph; resolve it once instead of per step
+            outs = self.session.get_outputs()
+            self._logits_idx = _logits_position(
+                [o.name for o in outs],
+                [len(o.shape) if isinstance(o.shape, (list, tuple)) else None for o in outs],
+            )
             self.ok = True
             logger.info(
                 "T5 ONNX loaded from %s | providers=%s | tok=%s",
@@ -5471,11 +5797,13 @@ class T5ONNX:
             self.tokenizer = None
             self.ok = False
 
-    def _pick_logits(self, outputs: List[np.ndarray]) -> np.ndarray:
-        for out in reversed(outputs):
-            if isinstance(out, np.ndarray) and out.ndim == 3:
-                return out
-        return outputs[0]
+    def _pick_logits(self, outputs: List[np.ndarray]) -> int:
+        # Same rule as __init__, applied to the arrays when the graph reported no ranks
+        idx = _logits_position(
+            [o.name for o in self.session.get_outputs()],
+            [out.ndim if isinstance(out, np.ndarray) else None for out in outputs],
+        )
+        return 0 if idx is None else idx
 
     def generate(self, prompt: str, max_new_tokens: int = 160) -> str:
         if not self.ok:
@@ -5498,8 +5826,9 @@ class T5ONNX:
                     "attention_mask": attention_mask,
                     "decoder_input_ids": decoder_input_ids
                 })
-                logits = self._pick_logits(outputs)
-                next_id = int(np.argmax(logits[:, -1, :], axis=-1))
+                if self._logits_idx is None:
+                    self._logits_idx = self._pick_logits(outputs)
+                next_id = int(outputs[self._logits_idx][0, -1].argmax())
 
                 if next_id == last_id and next_id in (eos_id, start_id):
                     break
@@ -5516,33 +5845,16 @@ class T5ONNX:
             out_ids = decoder_input_ids[0].tolist()
             if out_ids and out_ids[0] == start_id:
                 out_ids = out_ids[1:]
-            text = self.tokenizer.decode(out_ids, skip_special_tokens=True).strip()
-            return re.sub(r"\s+", " ", text).strip()
+            text = self.tokenizer.decode(out_ids, skip_special_tokens=True)
+            return " ".join(text.split())
         except Exception as e:
             logger.exception(f"T5 ONNX generate failed: {e}")
             return ""
 
-try:
-    if ONNX_MODEL_PATH.exists() and MODEL_TOKENIZER_PATH.exists():
-        t5_onnx = T5ONNX(ONNX_MODEL_PATH, MODEL_TOKENIZER_PATH)
-        logger.info(
-            "T5ONNX loaded from %s (onnx) and %s (tokenizer)",
-            ONNX_MODEL_PATH,
-            MODEL_TOKENIZER_PATH,
-        )
-    else:
-        t5_onnx = None
-        logger.warning(
-            "Skipping T5ONNX: ONNX_MODEL_PATH=%s exists=%s, MODEL_TOKENIZER_PATH=%s exists=%s",
-            ONNX_MODEL_PATH, ONNX_MODEL_PATH.exists(),
-            MODEL_TOKENIZER_PATH, MODEL_TOKENIZER_PATH.exists(),
-        )
-except Exception as e:
-    t5_onnx = None
-    logger.warning("Failed to init T5ONNX: %s", e)
 
 
-DESTINY_THEME_NAMES = {
+# Archetype names are compared and hashed on every prophetic lookup; intern them once here
+DESTINY_THEME_NAMES = MappingProxyType({num: sys.intern(name) for num, name in {
     1: "Pioneer Grace",
     2: "Peacemaker",
     3: "Psalmist",
@@ -5555,1081 +5867,45 @@ DESTINY_THEME_NAMES = {
     11: "Prophetic Beacon",
     22: "Master Repairer",
     33: "Servant-Teacher",
-}
-
-
-# Master prophetic library by theme + topic
-PROPHETIC_LIBRARY = {
-    "career": {
-        "Pioneer Grace": [
-            "The Lord is opening a new frontier in your work—what feels unfamiliar is where your anointing shines most.",
-            "You carry a grace to start what others are afraid to attempt. Expect fresh strategies in this season.",
-        ],
-        "Peacemaker": [
-            "God is placing you in environments that need your calm authority and relational wisdom.",
-            "Your career influence will increase through your ability to diffuse tension and create unity.",
-        ],
-        "Psalmist": [
-            "Your creativity is a spiritual assignment—God is breathing on your expression and voice.",
-            "The Lord is restoring joy in your work; inspiration flows again.",
-        ],
-        "Builder": [
-            "The Lord is strengthening your hands to establish what will outlast you.",
-            "This is a Joseph season—structure, planning, and design will bring promotion.",
-        ],
-        "Holy Freedom": [
-            "A shift is coming—God is breaking you out of environments that restrict your growth.",
-            "New opportunities will require courage, but they carry fresh wind.",
-        ],
-        "Keeper of Covenant": [
-            "God is trusting you with work that requires integrity and faithfulness—your consistency releases blessing.",
-            "Relationships in your workplace will deepen; your loyalty will be honored.",
-        ],
-        "Mystic Scholar": [
-            "Insight is increasing—you will understand things at work others overlook.",
-            "God is giving you discernment and strategic clarity for your next steps.",
-        ],
-        "Steward of Influence": [
-            "The Lord is expanding your platform; people are watching how you carry responsibility.",
-            "Financial stewardship and leadership grace are converging in this season.",
-        ],
-        "Compassionate Finisher": [
-            "You bring healing and closure to places that were left undone—God is highlighting you for completion.",
-            "Your attention to the emotional side of work will open surprising doors of favor.",
-        ],
-        "Prophetic Beacon": [
-            "God will use your voice to bring timely direction in your workplace.",
-            "You see ahead—lean into the insights God is giving you for decisions at work.",
-        ],
-        "Master Repairer": [
-            "You are called to restore what was broken—God is trusting you with rebuilding tasks.",
-            "Systems, teams, and projects will stabilize under your hands.",
-        ],
-        "Servant-Teacher": [
-            "Your career influence grows through your willingness to guide and uplift others.",
-            "People will seek your wisdom; humility will unlock advancement.",
-        ],
-        "default": [
-            "This is a season where God is aligning your work with your purpose.",
-            "Opportunities that match your calling will become clearer over the next weeks.",
-        ],
-    },
-
-    # ───────── Health / Body ─────────
-    "health": {
-        "Pioneer Grace": [
-            "The Lord is pioneering a new way of caring for your body—you are learning patterns that will bless the seasons ahead.",
-        ],
-        "Peacemaker": [
-            "God is bringing peace to the stress that has been weighing on your body; as your heart settles, your body will follow.",
-        ],
-        "Psalmist": [
-            "The Lord is using worship and quiet moments with Him as medicine for your soul and your body.",
-        ],
-        "Builder": [
-            "This is a time to rebuild your strength step by step; small consistent choices will become a strong foundation for your health.",
-        ],
-        "Holy Freedom": [
-            "God is breaking you out of unhealthy habits and cycles—there is grace to choose life-giving rhythms for your body.",
-        ],
-        "Keeper of Covenant": [
-            "The Lord is teaching you to honor the covenant you have with your own body—rest, nourishment, and care are part of your obedience.",
-        ],
-        "Mystic Scholar": [
-            "Insight is coming about the root of some of these health concerns; God will guide you as you seek wisdom and understanding.",
-        ],
-        "Steward of Influence": [
-            "The Lord is reminding you that your body is part of your assignment—you are being strengthened to carry the influence He is giving you.",
-        ],
-        "Compassionate Finisher": [
-            "God is gently closing chapters of neglect and inviting you into a kinder, more compassionate relationship with your own body.",
-        ],
-        "Prophetic Beacon": [
-            "The Lord is sharpening your sensitivity to when you need rest and when you need to press; obey those inner nudges regarding your health.",
-        ],
-        "Master Repairer": [
-            "God is guiding you in the repair and recovery of your health—what feels broken can be rebuilt over time with His wisdom.",
-        ],
-        "Servant-Teacher": [
-            "As you learn to care for your health, the Lord will use your journey to encourage and instruct others who feel worn down.",
-        ],
-        "default": [
-            "Beloved, your body matters to God; He is present in every step of your healing journey.",
-            "The Lord is bringing you into a gentler rhythm—rest, wisdom, and care will work together in this season.",
-        ],
-    },
-
-    # ───────── Move / Relocation ─────────
-    "move": {
-        "Pioneer Grace": [
-            "The Lord is leading you into a new place where your pioneering grace can flourish—He goes ahead of you to prepare the ground.",
-        ],
-        "Peacemaker": [
-            "God is positioning you in an environment that needs your peace and calm; His shalom will rest on your home.",
-        ],
-        "Psalmist": [
-            "This move will open fresh expression and creativity—God is giving you a space where your song can breathe again.",
-        ],
-        "Builder": [
-            "The Lord is setting you where you can build—home, structure, and stability are being arranged around your assignment.",
-        ],
-        "Holy Freedom": [
-            "This transition is part of your freedom story; God is moving you out of old confines into a place of wider grace.",
-        ],
-        "Keeper of Covenant": [
-            "God is safeguarding your family and covenant connections even in this move; He is not scattering you, He is planting you.",
-        ],
-        "Mystic Scholar": [
-            "The Lord is giving you discernment about timing and location—pay attention to the quiet confirmations in your spirit.",
-        ],
-        "Steward of Influence": [
-            "Your move is connected to influence; God is relocating you to people and spaces that align with your next level.",
-        ],
-        "Compassionate Finisher": [
-            "The Lord is helping you bring gentle closure to the place you are leaving so you can enter the new place with a free heart.",
-        ],
-        "Prophetic Beacon": [
-            "You are being set as a light in a new territory; God will use your voice to shift the atmosphere where you land.",
-        ],
-        "Master Repairer": [
-            "This move is part of God’s plan to heal and repair what was damaged in past seasons; new surroundings will support your restoration.",
-        ],
-        "Servant-Teacher": [
-            "The Lord is sending you where your willingness to serve and teach will be deeply needed and quietly honored.",
-        ],
-        "default": [
-            "The Lord is steadying your heart around this move—He is not just changing your address; He is guiding your steps.",
-            "You don’t have to force doors open; the right move will be marked by peace in your spirit.",
-        ],
-    },
-
-    # ───────── Marriage / Relationships ─────────
-    "marriage": {
-        "Pioneer Grace": [
-            "God is teaching you new ways to love and lead in your marriage—patterns no one showed you, He is now revealing.",
-        ],
-        "Peacemaker": [
-            "The Lord is using you to soften sharp places in your home; your gentle responses will carry great power.",
-        ],
-        "Psalmist": [
-            "God is restoring tenderness and joy—simple moments together will become songs of gratitude in this season.",
-        ],
-        "Builder": [
-            "This is a time to rebuild trust and structure in your marriage; small, steady acts of honor will strengthen the foundation.",
-        ],
-        "Holy Freedom": [
-            "The Lord is breaking unhealthy cycles so that freedom, not fear, becomes the atmosphere of your covenant.",
-        ],
-        "Keeper of Covenant": [
-            "God is honoring your commitment to keep this covenant—He is giving you wisdom to guard what He joined together.",
-        ],
-        "Mystic Scholar": [
-            "Insight is coming into how your spouse thinks and feels; God will give you language to bridge the gap.",
-        ],
-        "Steward of Influence": [
-            "Your marriage carries influence; the way you walk through this season will encourage others more than you know.",
-        ],
-        "Compassionate Finisher": [
-            "The Lord is inviting you to close old arguments with compassion—finishing some conversations in mercy, not in winning.",
-        ],
-        "Prophetic Beacon": [
-            "God will give you timely words that bring direction and comfort to your spouse; listen for His whisper before you respond.",
-        ],
-        "Master Repairer": [
-            "The Lord is working with you to repair what was cracked in your marriage; nothing surrendered to Him is beyond mending.",
-        ],
-        "Servant-Teacher": [
-            "As you serve in love and model humility, your spouse will see Christ in you more clearly; your example will teach without many words.",
-        ],
-        "default": [
-            "The Lord is calling your marriage back to soft hearts and honest conversation—truth wrapped in grace.",
-            "This is a season to fight for each other, not against each other; the covenant is worth protecting.",
-        ],
-    },
-
-    # ───────── Ministry / Calling in the Church ─────────
-    "ministry": {
-        "Pioneer Grace": [
-            "God is giving you grace to start works that do not have a blueprint yet—trust His leading more than people’s comfort.",
-        ],
-        "Peacemaker": [
-            "The Lord will use you to calm storms in ministry settings; your presence will disarm division.",
-        ],
-        "Psalmist": [
-            "Worship and creativity are part of your ministry mantle; God is breathing on your expression to heal hearts.",
-        ],
-        "Builder": [
-            "You are called to build systems, teams, and structures that make ministry sustainable for others.",
-        ],
-        "Holy Freedom": [
-            "The Lord is using you to break religious heaviness and introduce people to the joy and liberty of His presence.",
-        ],
-        "Keeper of Covenant": [
-            "You carry a grace to guard the integrity of the house—God trusts you with covenant relationships in ministry.",
-        ],
-        "Mystic Scholar": [
-            "Revelation and study will come together; God is sharpening your ability to rightly divide the word and apply it.",
-        ],
-        "Steward of Influence": [
-            "The Lord is increasing your reach, but He is also deepening your roots so you can carry influence without losing intimacy.",
-        ],
-        "Compassionate Finisher": [
-            "You are called to help people finish processes—deliverance, healing, and discipleship—not just start them.",
-        ],
-        "Prophetic Beacon": [
-            "God will give you clear, timely words for His people; stay submitted and pure in motive so the light stays bright.",
-        ],
-        "Master Repairer": [
-            "You are part of God’s repair work in His church—healing leaders, restoring teams, and mending what was mishandled.",
-        ],
-        "Servant-Teacher": [
-            "Your ministry flourishes as you serve and teach; God is using your steady voice to ground His people.",
-        ],
-        "default": [
-            "God is reminding you that your first ministry is to Him—out of that place, the rest will flow with less strain.",
-            "You don’t have to prove your calling; simply be faithful to the small yes in front of you.",
-        ],
-    },
-
-    # ───────── Wealth / Provision / Finances ─────────
-    "wealth": {
-        "Pioneer Grace": [
-            "The Lord is giving you pioneering ideas around income and provision; what feels unusual may carry breakthrough.",
-        ],
-        "Peacemaker": [
-            "God is bringing peace to financial tension; conversations about money will begin to carry more unity than conflict.",
-        ],
-        "Psalmist": [
-            "The Lord is teaching you to worship in the middle of financial uncertainty, and in that worship He is birthing new creativity.",
-        ],
-        "Builder": [
-            "This is a time to build financial structure—budgets, plans, and discipline that will support the harvest ahead.",
-        ],
-        "Holy Freedom": [
-            "God is breaking you out of cycles of impulsive spending and fear; He is leading you into freedom and wise stewardship.",
-        ],
-        "Keeper of Covenant": [
-            "The Lord is reminding you that He is your source; as you honor Him and keep your word, He will honor you.",
-        ],
-        "Mystic Scholar": [
-            "Wisdom and strategy about finances are coming; God will show you where to adjust, invest, and release.",
-        ],
-        "Steward of Influence": [
-            "You are being trained to handle more; how you steward this level will prepare you for greater responsibility and resources.",
-        ],
-        "Compassionate Finisher": [
-            "God is helping you close out old debts and unfinished obligations so you can move forward lighter.",
-        ],
-        "Prophetic Beacon": [
-            "The Lord will give you insight into financial decisions—not just for you, but to help others avoid snares.",
-        ],
-        "Master Repairer": [
-            "You are partnering with God to repair your financial story—He is rebuilding what was mismanaged or stolen.",
-        ],
-        "Servant-Teacher": [
-            "As you learn to handle resources wisely, the Lord will use you to teach and encourage others out of lack and fear.",
-        ],
-        "default": [
-            "The Lord is teaching you how to steward what you have now so you can handle what is coming next.",
-            "Provision will follow purpose as you align your decisions with His leading.",
-        ],
-    },
-
-    # ───────── Doctor / Medical Decisions ─────────
-    "doctor": {
-        "Pioneer Grace": [
-            "The Lord is walking with you into new medical territory; trust His peace as you navigate unfamiliar options.",
-        ],
-        "Peacemaker": [
-            "God is calming your heart so you can hear clearly in appointments and conversations with doctors.",
-        ],
-        "Psalmist": [
-            "The Lord will meet you in waiting rooms and quiet moments—His presence will steady you as you process medical reports.",
-        ],
-        "Builder": [
-            "This is a season to build a wise care plan with your medical team; God will help you stay consistent.",
-        ],
-        "Holy Freedom": [
-            "The Lord is freeing you from fear around doctors and procedures; He is teaching you to see them as partners, not enemies.",
-        ],
-        "Keeper of Covenant": [
-            "God remembers every promise spoken over your life; He is present in each medical decision you make.",
-        ],
-        "Mystic Scholar": [
-            "Insight and good questions will come to you; the Lord will help you understand what you are being told.",
-        ],
-        "Steward of Influence": [
-            "As you walk through this process with grace, others will see your faith; your testimony in the hallway matters.",
-        ],
-        "Compassionate Finisher": [
-            "God is helping you follow through with treatments and appointments, even when you feel tired of the process.",
-        ],
-        "Prophetic Beacon": [
-            "The Lord will give you inner nudges about when to pause, when to proceed, and when to seek another opinion.",
-        ],
-        "Master Repairer": [
-            "You and your doctors are partnering with God in repair—He is not absent from the healing work being done.",
-        ],
-        "Servant-Teacher": [
-            "What you learn on this journey will position you to comfort and guide others facing similar reports.",
-        ],
-        "default": [
-            "The Lord is with you in the doctor’s office just as much as in the sanctuary; He gives wisdom through trained hands.",
-            "It is not a lack of faith to seek medical help—God often answers prayer through professionals and treatment plans.",
-        ],
-    },
-
-    # ───────── Foreclosure / Housing Crisis ─────────
-    "foreclosure": {
-        "Pioneer Grace": [
-            "Even in this housing storm, the Lord is pioneering a new beginning for you; this is not the end of your story.",
-        ],
-        "Peacemaker": [
-            "God is quieting fear and conflict around finances and housing so you can think and act from a place of peace.",
-        ],
-        "Psalmist": [
-            "The Lord will meet you in the grief of this season and give you a song of hope again.",
-        ],
-        "Builder": [
-            "It may feel like things are being torn down, but God is planning a wiser rebuild for your future.",
-        ],
-        "Holy Freedom": [
-            "The Lord is freeing you from burdens you were never meant to carry alone—He will show you the way forward step by step.",
-        ],
-        "Keeper of Covenant": [
-            "God has not broken covenant with you; even if this house changes, His covering over your life remains.",
-        ],
-        "Mystic Scholar": [
-            "Insight and counsel will come regarding what to sign, what to release, and where to stand your ground.",
-        ],
-        "Steward of Influence": [
-            "The way you walk through this hardship will one day encourage others who feel they’ve lost everything.",
-        ],
-        "Compassionate Finisher": [
-            "The Lord is helping you close this chapter without shame so you can move into the next with a healed heart.",
-        ],
-        "Prophetic Beacon": [
-            "God will give you clear direction about resources, timing, and the next place He has for you.",
-        ],
-        "Master Repairer": [
-            "Even in financial loss, the Lord is beginning a repair work—restoring dignity, wisdom, and stability over time.",
-        ],
-        "Servant-Teacher": [
-            "What you learn here will become wisdom you can share with others about God’s faithfulness in tight places.",
-        ],
-        "default": [
-            "The Lord sees the pressure you feel around your home; you are not walking through this alone.",
-            "Even if this house changes, His shelter over your life does not.",
-        ],
-    },
-
-    # ───────── Poverty / Lack / Feeling “Poor” ─────────
-    "poor": {
-        "Pioneer Grace": [
-            "God is teaching you how to start again financially, even from small places—He is not ashamed of your beginning.",
-        ],
-        "Peacemaker": [
-            "The Lord is calming the anxiety that has attached itself to money conversations; peace will help you see options.",
-        ],
-        "Psalmist": [
-            "In the middle of tightness, God is giving you a thankful song that will keep your heart from sinking.",
-        ],
-        "Builder": [
-            "This is a time to build new financial habits brick by brick; small faithfulness will become a strong wall.",
-        ],
-        "Holy Freedom": [
-            "The Lord is breaking shame and generational mindsets of lack—freedom will start on the inside first.",
-        ],
-        "Keeper of Covenant": [
-            "God remembers every seed you have sown and every time you honored Him when it was hard; He has not forgotten.",
-        ],
-        "Mystic Scholar": [
-            "Wisdom, teaching, and practical understanding around finances are coming; lean into learning, not condemnation.",
-        ],
-        "Steward of Influence": [
-            "The Lord is preparing you to handle more so that when increase comes, you can steward it with compassion and wisdom.",
-        ],
-        "Compassionate Finisher": [
-            "God is helping you close out old financial mistakes with mercy, not self-hatred, so you can step into a new chapter.",
-        ],
-        "Prophetic Beacon": [
-            "The Lord will use you to speak hope to others in lack; you will know how to encourage from a place of experience.",
-        ],
-        "Master Repairer": [
-            "God is repairing your financial story piece by piece—mindsets, habits, and opportunities are all being addressed.",
-        ],
-        "Servant-Teacher": [
-            "As you walk this road with God, you will become a gentle teacher to others who feel embarrassed by their situation.",
-        ],
-        "default": [
-            "The Lord is reminding you that your worth is not measured by your bank account; you are precious to Him.",
-            "This is a season to embrace small, faithful changes; do not despise the little—it is seed in God’s hands.",
-        ],
-    },
-
-    # ───────── Suicide / Deep Despair ─────────
-    # IMPORTANT: You should ALSO show hotline/emergency info in the UI.
-    "suicide": {
-        "Pioneer Grace": [
-            "Beloved, even in this dark place, your life carries a future God still intends to write. Please do not walk this alone—reach out to someone you trust or a crisis line right now.",
-        ],
-        "Peacemaker": [
-            "You have carried so much for others that you feel empty yourself, but your story is not finished. Talk to someone today and let them carry you for a while.",
-        ],
-        "Psalmist": [
-            "God hears the silent scream in your soul; your tears are not wasted. Please speak with a counselor, pastor, or hotline—your voice deserves to be heard.",
-        ],
-        "Builder": [
-            "It feels like everything has collapsed, but the Master Builder has not given up on you. Let a professional and a trusted person help you stand again.",
-        ],
-        "Holy Freedom": [
-            "The Lord wants to free you from this crushing heaviness, not remove you from the earth. If you feel in danger, please contact emergency services or a crisis hotline immediately.",
-        ],
-        "Keeper of Covenant": [
-            "God has not walked away from you, even if you feel disconnected from everyone. Your life is part of His covenant story—reach out for help right now.",
-        ],
-        "Mystic Scholar": [
-            "Your mind has carried deep questions and pain, but ending your life is not the answer. Please talk to a mental health professional and someone safe in your life today.",
-        ],
-        "Steward of Influence": [
-            "You may not see it now, but others need you here. Your life matters. If you are close to harming yourself, call your local emergency number or a crisis hotline immediately.",
-        ],
-        "Compassionate Finisher": [
-            "You have poured out so much compassion that you feel empty, but God has not finished with your story. Let someone pour into you—reach out for help now.",
-        ],
-        "Prophetic Beacon": [
-            "Even prophets and sensitive souls encounter deep valleys. This valley is not your final chapter. Please seek urgent help from a doctor, counselor, or crisis line.",
-        ],
-        "Master Repairer": [
-            "What feels beyond repair in your heart is not beyond God, but you do not have to hold this alone. Reach out to a professional and a trusted person immediately.",
-        ],
-        "Servant-Teacher": [
-            "You have served others quietly, but now you need others to serve you. Your life is valuable. Please contact a crisis hotline, emergency services, or someone you trust right away.",
-        ],
-        "default": [
-            "Beloved, your life is precious. I am so glad you are reaching out and not suffering in silence.",
-            "You do not have to walk through this alone. Please speak to a counselor, pastor, or trusted person, and if you feel in immediate danger, contact your local emergency number or a crisis hotline right now.",
-        ],
-    },
-
-    # ───────── Calling / Assignment ─────────
-    "calling": {
-        "Pioneer Grace": [
-            "The Lord is calling you to step into places others have not gone; your assignment will often look unusual, but His grace will meet you there.",
-        ],
-        "Peacemaker": [
-            "Part of your calling is to carry peace into tense spaces—He will use your calm, listening heart to disarm conflict and reconcile hearts.",
-        ],
-        "Psalmist": [
-            "Your calling is tied to expression; God uses your words, creativity, and worship to open hearts that would not respond to anything else.",
-        ],
-        "Builder": [
-            "You are called to build what others will stand on—structures, systems, and teams that make the work of the Kingdom sustainable.",
-        ],
-        "Holy Freedom": [
-            "The Lord is anointing you to help people step out of shame, fear, and religious bondage into the freedom of Christ.",
-        ],
-        "Keeper of Covenant": [
-            "Your calling is to guard what God treasures—covenant relationships, promises, and sacred spaces that need a faithful heart.",
-        ],
-        "Mystic Scholar": [
-            "You are called to search out the deep things of God and make them simple and clear for others who are hungry to understand.",
-        ],
-        "Steward of Influence": [
-            "Part of your assignment is to carry influence with integrity; God will trust you with people and platforms as you keep your heart low before Him.",
-        ],
-        "Compassionate Finisher": [
-            "You are called to walk with people and projects all the way to wholeness; you help others finish what they started with healing, not just results.",
-        ],
-        "Prophetic Beacon": [
-            "Your calling includes sounding the alarm and bringing timely direction; your sensitivity to God’s voice is part of your assignment.",
-        ],
-        "Master Repairer": [
-            "The Lord has marked you to help repair what was damaged—lives, ministries, and systems that need patient, skilled restoration.",
-        ],
-        "Servant-Teacher": [
-            "You are called to serve and teach in ways that make others feel seen and empowered; God uses your simplicity to unlock deep understanding.",
-        ],
-        "default": [
-            "God is clarifying your assignment in this season; what once felt blurry is coming into focus one obedient step at a time.",
-            "Your calling is not a performance but a partnership—He will reveal the next step as you walk with Him.",
-        ],
-    },
-
-    # ───────── Children / Parenting / Sons & Daughters ─────────
-    "children": {
-        "Pioneer Grace": [
-            "The Lord has placed a pioneering grace on your child; part of your role is to bless the paths they take that may not look like anyone else’s.",
-        ],
-        "Peacemaker": [
-            "God is forming a gentle, reconciling spirit in your child; He will use them to bring peace where there has been tension.",
-        ],
-        "Psalmist": [
-            "There is a song and creativity in your child that heaven hears—nurture their expression, even if it doesn’t fit the usual mold.",
-        ],
-        "Builder": [
-            "Your child carries a builder’s grace—curiosity, structure, and a desire to put things in order. Encourage their sense of responsibility without crushing their joy.",
-        ],
-        "Holy Freedom": [
-            "The Lord is breathing freedom over your child’s story; He will break patterns that tried to run through the family line.",
-        ],
-        "Keeper of Covenant": [
-            "There is a strong loyalty and sense of promise in your child; God will use them to keep the family heart turned toward Him.",
-        ],
-        "Mystic Scholar": [
-            "Your child may ask deep questions and notice what others miss—this is part of their design. Make room for their curiosity with patience.",
-        ],
-        "Steward of Influence": [
-            "God is preparing your child to carry influence; how you model integrity and humility now will shape how they handle favor later.",
-        ],
-        "Compassionate Finisher": [
-            "Your child carries a tender, compassionate heart; they may hurt deeply, but they will also help many heal if you teach them healthy boundaries.",
-        ],
-        "Prophetic Beacon": [
-            "There is a sensitivity and discernment in your child; they may sense things before they can explain them. Cover them in prayer and teach them God’s voice.",
-        ],
-        "Master Repairer": [
-            "The Lord will use your child to help mend relationships and situations that seem beyond fixing; even now their presence brings quiet ease.",
-        ],
-        "Servant-Teacher": [
-            "Your child has a servant’s heart and a teaching grace; they learn by helping and will often show others what they have just discovered.",
-        ],
-        "default": [
-            "The Lord is reminding you that He knew your child before you did—He walks with you as you guide them.",
-            "Grace is coming to help you see your child not only through worry, but through God’s promise over their life.",
-        ],
-    },
-
-    "ministry": {
-        "Pioneer Grace": [
-            "The Lord is calling you to minister in places where there is no blueprint; He is trusting you to introduce new expressions of His heart.",
-        ],
-        "Peacemaker": [
-            "God will use you to settle storms in ministry settings; your presence carries a calming authority that disarms tension.",
-        ],
-        "Psalmist": [
-            "Your ministry flows through expression—worship, creativity, and sensitivity. God will use your voice to heal hearts.",
-        ],
-        "Builder": [
-            "You carry a ministry mantle to build teams, systems, and structures that make the work sustainable for generations.",
-        ],
-        "Holy Freedom": [
-            "The Lord will use your ministry to break off religious heaviness and lead people into the joy of true spiritual freedom.",
-        ],
-        "Keeper of Covenant": [
-            "Your ministry carries loyalty, faithfulness, and relational strength; God trusts you to guard what is sacred in His house.",
-        ],
-        "Mystic Scholar": [
-            "Revelation and teaching flow together in your ministry; God is sharpening your ability to interpret and impart truth.",
-        ],
-        "Steward of Influence": [
-            "God is enlarging your ministry influence, but He is also deepening your foundations so you can carry it with humility.",
-        ],
-        "Compassionate Finisher": [
-            "You have a ministry of walking people to completion—helping them finish healing, deliverance, and discipleship, not just start it.",
-        ],
-        "Prophetic Beacon": [
-            "Your ministry carries prophetic clarity; God will give you timely words that bring direction and protection to His people.",
-        ],
-        "Master Repairer": [
-            "Your ministry is part of God’s repair work—restoring wounded leaders, healing broken teams, and mending spiritual foundations.",
-        ],
-        "Servant-Teacher": [
-            "Your ministry flourishes through humble service and simple teaching; God uses your clarity to ground and uplift His people.",
-        ],
-        "default": [
-            "God is refreshing your joy in ministry; what once felt heavy will begin to feel like worship again.",
-            "You do not have to prove your calling—simply honor the assignments He places before you.",
-        ],
-    },
-
-    "pastoring": {
-        "Pioneer Grace": [
-            "The Lord is giving you courage to shepherd people into new territory; you will pastor them through unfamiliar spiritual ground.",
-        ],
-        "Peacemaker": [
-            "Your pastoral grace is rooted in peace—God uses your listening ear and gentle words to restore unity in the flock.",
-        ],
-        "Psalmist": [
-            "Your pastoral care flows through compassion, worship, and emotional discernment; your presence softens hardened hearts.",
-        ],
-        "Builder": [
-            "You are called to build pastoral systems—teams, care structures, and follow-up processes that truly care for God’s people.",
-        ],
-        "Holy Freedom": [
-            "Your pastoral mantle breaks shame and releases freedom; people feel safe to heal because you carry grace, not judgment.",
-        ],
-        "Keeper of Covenant": [
-            "You pastor with loyalty and commitment; God trusts you to protect His sheep and uphold the integrity of His house.",
-        ],
-        "Mystic Scholar": [
-            "Your pastoral gift flows through insight and revelation; you help people understand their spiritual process with depth and clarity.",
-        ],
-        "Steward of Influence": [
-            "As a pastor, God is growing your influence carefully; your impact will extend beyond the room through your character.",
-        ],
-        "Compassionate Finisher": [
-            "You pastor people through difficult endings—healing, closure, and restoration. Your compassion is part of their deliverance.",
-        ],
-        "Prophetic Beacon": [
-            "Your pastoral voice carries prophetic insight—God will give you early warning and timely direction for those you shepherd.",
-        ],
-        "Master Repairer": [
-            "God has given you a pastoral grace to restore broken believers and mend wounded hearts; nothing surrendered is beyond repair.",
-        ],
-        "Servant-Teacher": [
-            "Your pastoral strength is in humble leading and clear teaching; you shepherd people through truth wrapped in patience.",
-        ],
-        "default": [
-            "The Lord is strengthening your pastoral heart—He will give you wisdom for the people you guide.",
-            "You are not shepherding alone; the Chief Shepherd is walking beside you as you care for His people.",
-        ],
-    },
-
-    "success": {
-        "Pioneer Grace": [
-            "Success for you comes through brave first steps—the Lord is rewarding the faith it takes to walk where others have not gone.",
-        ],
-        "Peacemaker": [
-            "Your success will be found in unity-building and relational wisdom; God blesses the peacemakers with influence.",
-        ],
-        "Psalmist": [
-            "Your success is tied to authenticity and expression; God will prosper you as you create, communicate, and inspire.",
-        ],
-        "Builder": [
-            "Success is rising through structure and strategy; your ability to build well is becoming your breakthrough.",
-        ],
-        "Holy Freedom": [
-            "Your success comes through freedom—breaking old cycles and embracing the new things God has called you to.",
-        ],
-        "Keeper of Covenant": [
-            "The Lord will bless your success because of your faithfulness; you do not abandon what God entrusts to you.",
-        ],
-        "Mystic Scholar": [
-            "Your success will be rooted in insight and understanding—God is giving you ideas others overlook.",
-        ],
-        "Steward of Influence": [
-            "Success is coming in the form of expanded responsibility; God trusts you with more because you steward well.",
-        ],
-        "Compassionate Finisher": [
-            "Your success is tied to finishing well—God will honor your consistency, healing presence, and follow-through.",
-        ],
-        "Prophetic Beacon": [
-            "Your success will come through prophetic clarity—God will give you insight that positions you ahead of the curve.",
-        ],
-        "Master Repairer": [
-            "Your success will emerge from restoring what others discarded; your ability to repair will open unexpected opportunities.",
-        ],
-        "Servant-Teacher": [
-            "Your success grows through service and teaching; God will elevate you because you build others, not just yourself.",
-        ],
-        "default": [
-            "This is a season where God is aligning you with success that matches your assignment.",
-            "Success will come without striving as you follow the peace of God step by step.",
-        ],
-    },
-
-    "deliverance": {
-        "Pioneer Grace": [
-            "The Lord is breaking you out of patterns that have held generations—your deliverance becomes the blueprint for others.",
-        ],
-        "Peacemaker": [
-            "Deliverance is coming softly to you; the Lord is removing burdens without uprooting your peace.",
-        ],
-        "Psalmist": [
-            "Your deliverance will flow through worship—God is loosening chains as you open your mouth in praise.",
-        ],
-        "Builder": [
-            "The Lord is dismantling what was built on fear and rebuilding you with strength and clarity.",
-        ],
-        "Holy Freedom": [
-            "This is the season where strongholds break—freedom is becoming your new atmosphere.",
-        ],
-        "Keeper of Covenant": [
-            "Your deliverance is tied to God’s covenant with you; what tried to follow you will not cross into your next season.",
-        ],
-        "Mystic Scholar": [
-            "The Lord is revealing the root, not just the fruit—your understanding will accelerate your freedom.",
-        ],
-        "Steward of Influence": [
-            "Deliverance is coming so you can carry greater influence without the weight of old battles.",
-        ],
-        "Compassionate Finisher": [
-            "God is closing long-standing cycles—what lingered for years will be finished in grace.",
-        ],
-        "Prophetic Beacon": [
-            "You will discern what needs to break—your insight will expose the enemy’s strategy.",
-        ],
-        "Master Repairer": [
-            "The Lord is repairing the broken places where oppression once entered—wholeness is rising in you.",
-        ],
-        "Servant-Teacher": [
-            "Your deliverance story will become someone else’s classroom—your breakthrough will teach many.",
-        ],
-        "default": [
-            "The Lord is breaking chains—what held you will release you in this season.",
-            "Deliverance is coming gently but powerfully, and your spirit will breathe again.",
-        ],
-    },
-
-    "anxiety": {
-        "Pioneer Grace": [
-            "God is calming the part of you that feels responsible to lead everything; He is teaching you to rest between assignments.",
-        ],
-        "Peacemaker": [
-            "The Lord is settling the storms inside your heart—your peace is returning in waves.",
-        ],
-        "Psalmist": [
-            "Your emotions are becoming aligned as you pour them before the Lord—He hears every sigh.",
-        ],
-        "Builder": [
-            "God is helping you break anxiety by creating simple routines that anchor your day.",
-        ],
-        "Holy Freedom": [
-            "The Lord is breaking the anxious cycles that have followed you; freedom in your thoughts is emerging.",
-        ],
-        "Keeper of Covenant": [
-            "God is reminding you that He has not forgotten what He promised you—your anxiety is not a sign of lost faith.",
-        ],
-        "Mystic Scholar": [
-            "You are learning to separate your thoughts from the truth—discernment is lifting anxiety’s voice.",
-        ],
-        "Steward of Influence": [
-            "The pressure to carry others is lifting; God is reminding you to cast the weight back onto Him.",
-        ],
-        "Compassionate Finisher": [
-            "The Lord is bringing closure to the worries that replay in your mind—peace is becoming your new rhythm.",
-        ],
-        "Prophetic Beacon": [
-            "Your sensitivity will no longer feel overwhelming—God is tuning your discernment so fear does not mix with insight.",
-        ],
-        "Master Repairer": [
-            "God is soothing the parts of your heart that have been under long-term stress—deep repair is underway.",
-        ],
-        "Servant-Teacher": [
-            "You are learning how to pause, breathe, and receive grace—your heart is being retrained toward peace.",
-        ],
-        "default": [
-            "The Lord is calming your anxious heart—He is closer than the fear you feel.",
-            "Peace is coming in layers; breathe, beloved, you are not alone.",
-        ],
-    },
-
-    "fear": {
-        "Pioneer Grace": [
-            "Fear is breaking because God is teaching you to lead with faith instead of pressure.",
-        ],
-        "Peacemaker": [
-            "The Lord is quieting the internal noise—fear loses its power where peace begins to rise.",
-        ],
-        "Psalmist": [
-            "Your feelings are aligning with faith as you worship—fear melts in the presence of God.",
-        ],
-        "Builder": [
-            "Strength is replacing fear; God is reinforcing your inner foundation.",
-        ],
-        "Holy Freedom": [
-            "The fear that tried to silence you is losing its grip—you are stepping into holy courage.",
-        ],
-        "Keeper of Covenant": [
-            "Fear cannot break the covenant God has with you—He holds you steady in uncertain moments.",
-        ],
-        "Mystic Scholar": [
-            "God is revealing the truth behind your fear—understanding will dismantle what intimidated you.",
-        ],
-        "Steward of Influence": [
-            "Fear is lifting because you are learning not to absorb everyone’s expectations.",
-        ],
-        "Compassionate Finisher": [
-            "Fear of repeating old cycles is breaking—God is closing the doors behind you.",
-        ],
-        "Prophetic Beacon": [
-            "The Lord is strengthening your discernment—fear will not disguise itself as caution anymore.",
-        ],
-        "Master Repairer": [
-            "God is healing the moments that built your fear—memory by memory, strength is returning.",
-        ],
-        "Servant-Teacher": [
-            "You are learning that courage grows through small steps—God is walking each one with you.",
-        ],
-        "default": [
-            "Fear will not define your next season—God is teaching your heart to trust again.",
-            "Take a breath—God is not the author of fear, but the anchor of your soul.",
-        ],
-    },
-
-    # ───────── Protection ─────────
-    "protection": {
-        "Pioneer Grace": [
-            "The Lord is going ahead of you, clearing paths you didn’t even know were dangerous. You are covered in unfamiliar places.",
-        ],
-        "Peacemaker": [
-            "God is placing a shield around your peace; the chaos that once drained you will not cross your threshold in this season.",
-        ],
-        "Psalmist": [
-            "Your protection comes as you stay in God’s presence—worship becomes your hedge and your hiding place.",
-        ],
-        "Builder": [
-            "The Lord is fortifying your life; layer by layer He is strengthening every place that felt exposed.",
-        ],
-        "Holy Freedom": [
-            "God is protecting your freedom—old bondages will not reclaim you, and old voices will not pull you back.",
-        ],
-        "Keeper of Covenant": [
-            "Your covenant with God places a hedge around your home—He is guarding what He promised you.",
-        ],
-        "Mystic Scholar": [
-            "The Lord is giving you discernment so you can avoid unseen traps before they even form.",
-        ],
-        "Steward of Influence": [
-            "God is shielding your name, your reputation, and your platform—no weapon formed will prosper.",
-        ],
-        "Compassionate Finisher": [
-            "He is protecting your heart as you care for others—your compassion will not become an open door for harm.",
-        ],
-        "Prophetic Beacon": [
-            "Your insight is part of your protection—God will show you what to step away from before it touches you.",
-        ],
-        "Master Repairer": [
-            "God is guarding your rebuilding process; nothing will break what He is restoring in you.",
-        ],
-        "Servant-Teacher": [
-            "Your humility is covering you—God protects the one who serves with a pure heart.",
-        ],
-        "default": [
-            "The Lord surrounds you as a shield; His protection is wrapping every step you take.",
-            "God is guarding your home, your mind, your peace, and your journey.",
-        ],
-    },
-
-    # ───────── Finances ─────────
-    "finances": {
-        "Pioneer Grace": [
-            "God is opening new streams of provision in places you’ve never sown before—innovation will be your increase.",
-        ],
-        "Peacemaker": [
-            "The Lord is bringing financial peace to your home—panic will not govern your decisions.",
-        ],
-        "Psalmist": [
-            "Provision will flow as you create; there is increase connected to your expression and authenticity.",
-        ],
-        "Builder": [
-            "Your financial stability will come through structure, order, and steady stewardship—God is blessing the work of your hands.",
-        ],
-        "Holy Freedom": [
-            "The Lord is breaking financial patterns that ran through your lineage—this is your season to reset the cycle.",
-        ],
-        "Keeper of Covenant": [
-            "Your finances are being aligned with God’s covenant; lack will not define your story.",
-        ],
-        "Mystic Scholar": [
-            "God will give you insight on how to grow, save, and invest wisely—understanding will produce increase.",
-        ],
-        "Steward of Influence": [
-            "Your financial increase is tied to your influence; God can trust you because you steward well.",
-        ],
-        "Compassionate Finisher": [
-            "The Lord is helping you finish overdue obligations with grace—closure will bring overflow.",
-        ],
-        "Prophetic Beacon": [
-            "God will show you financial decisions before they unfold—your discernment is part of your prosperity.",
-        ],
-        "Master Repairer": [
-            "The Lord is repairing the financial damage of past seasons—restoration is already in motion.",
-        ],
-        "Servant-Teacher": [
-            "Your increase will follow your service—God rewards the heart that gives generously.",
-        ],
-        "default": [
-            "God is teaching you how to steward what you have so you can carry what’s coming.",
-            "Provision will follow purpose—God is aligning your finances with your assignment.",
-        ],
-    },
-
-    # ───────── Court Cases ─────────
-    "court_cases": {
-        "Pioneer Grace": [
-            "The Lord is going before you like a warrior—breaking through legal barriers and overturning unfair outcomes.",
-        ],
-        "Peacemaker": [
-            "God will give you favor through calm words and peaceful presence—your composure will shift the atmosphere.",
-        ],
-        "Psalmist": [
-            "The Lord is calming your emotions and giving you the right words at the right time—He is with you in the room.",
-        ],
-        "Builder": [
-            "God is establishing your steps legally—what was unstable is becoming firm and ordered.",
-        ],
-        "Holy Freedom": [
-            "This case will not imprison your future—God is fighting to secure your liberty.",
-        ],
-        "Keeper of Covenant": [
-            "The Lord remembers His promises over your life; He will not allow legal confusion to rewrite your destiny.",
-        ],
-        "Mystic Scholar": [
-            "God will give you discernment—what to say, what not to say, and who should represent you.",
-        ],
-        "Steward of Influence": [
-            "Your name is being protected—God is preserving your credibility and honor through this process.",
-        ],
-        "Compassionate Finisher": [
-            "The Lord is closing this legal chapter with grace—what was lingering will be settled.",
-        ],
-        "Prophetic Beacon": [
-            "You will sense the outcome before it arrives—God is giving you prophetic peace in advance.",
-        ],
-        "Master Repairer": [
-            "Even if injustice occurred, God is restoring what was damaged—this case will not end in your defeat.",
-        ],
-        "Servant-Teacher": [
-            "Your humility will bring favor—God will speak through your character more than your defense.",
-        ],
-        "default": [
-            "God is giving you favor in legal matters—He is your Advocate and Defender.",
-            "The Lord is handling what feels too heavy for you—trust His hand in the courtroom.",
-        ],
-    },
-
-    # ───────── Enemies ─────────
-    "enemies": {
-        "Pioneer Grace": [
-            "Your enemies cannot follow you into the future—God is removing access as you advance.",
-        ],
-        "Peacemaker": [
-            "The Lord is silencing every tongue that rose against you—peace will outlast every attack.",
-        ],
-        "Psalmist": [
-            "Your worship confuses your enemies; God is turning your praise into protection.",
-        ],
-        "Builder": [
-            "God is establishing boundaries—no enemy will tear down what He’s helping you build.",
-        ],
-        "Holy Freedom": [
-            "The Lord is breaking the influence of those who tried to control, limit, or intimidate you.",
-        ],
-        "Keeper of Covenant": [
-            "Your covenant with God is stronger than any opposition—He fights for you.",
-        ],
-        "Mystic Scholar": [
-            "God is revealing hidden motives and exposing false alliances—discernment is your shield.",
-        ],
-        "Steward of Influence": [
-            "Your enemies rise because your influence rises—but God is covering your name.",
-        ],
-        "Compassionate Finisher": [
-            "The Lord is healing the wounds inflicted by others; you will finish without bitterness.",
-        ],
-        "Prophetic Beacon": [
-            "Your insight exposes your enemies before they act—God shows you what to avoid.",
-        ],
-        "Master Repairer": [
-            "God is repairing what your enemies tried to break—you will rise stronger than before.",
-        ],
-        "Servant-Teacher": [
-            "You will overcome opposition through humility; God resists the proud but elevates the humble.",
-        ],
-        "default": [
-            "No weapon formed against you will prosper—God has the final say.",
-            "God is exposing and dismantling every plan formed against you.",
-        ],
-    },
+}.items()})
+
+
+# Master prophetic library by theme + topic: {topic: {archetype | "default": [lines]}}.
+# Lives in prophetic_library.json so import doesn't parse and execute a ~50 KB literal.
+# NOTE: the "suicide" lines are pastoral only; the UI must ALSO show hotline/emergency info.
+def _pairs_warn_duplicates(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """json object hook: a repeated key silently drops the earlier block, so say so."""
+    out: Dict[str, Any] = {}
+    for k, v in pairs:
+        if k in out:
+            logger.warning("prophetic_library.json: duplicate key %r; earlier block is ignored", k)
+        out[k] = v
+    return out
 
-    # ───────── Spiritual Warfare ─────────
-    "spiritual_warfare": {
-        "Pioneer Grace": [
-            "You are breaking ground the enemy hoped you’d never touch—your very movement is warfare.",
-        ],
-        "Peacemaker": [
-            "Your calmness in conflict is your weapon—the enemy cannot destabilize someone rooted in peace.",
-        ],
-        "Psalmist": [
-            "Your worship is war—praise is pushing back darkness and restoring clarity.",
-        ],
-        "Builder": [
-            "God is strengthening your foundations—when the warfare rises, you will not be moved.",
-        ],
-        "Holy Freedom": [
-            "The enemy’s old tactics will not work—God has opened your eyes to the strategy of heaven.",
-        ],
-        "Keeper of Covenant": [
-            "Your covenant makes you untouchable—God fights battles you don’t even see.",
-        ],
-        "Mystic Scholar": [
-            "Revelation is your sword—God is teaching you to discern spiritual patterns quickly.",
-        ],
-        "Steward of Influence": [
-            "The warfare is rising because your influence is rising—but God is placing angels around you.",
-        ],
-        "Compassionate Finisher": [
-            "The Lord is closing old spiritual cycles—this warfare will not repeat.",
-        ],
-        "Prophetic Beacon": [
-            "Your prophetic insight exposes the enemy before he moves—this is your advantage.",
-        ],
-        "Master Repairer": [
-            "God is restoring what spiritual attacks tried to destroy—He is rebuilding you with glory.",
-        ],
-        "Servant-Teacher": [
-            "Your gentle spirit is dangerous to darkness—light shines through humility.",
-        ],
-        "default": [
-            "The battle is the Lord’s—He is fighting for you.",
-            "God is surrounding you with protection as you stand firm.",
-        ],
-    },
+def _load_prophetic_library() -> Dict[str, Dict[str, List[str]]]:
+    fallback = {"general": {"default": ["I sense the Lord steadying your steps in this season."]}}
+    if not PROPHETIC_LIBRARY_JSON.exists():
+        logger.warning(f"Missing file: {PROPHETIC_LIBRARY_JSON}")
+        return fallback
+    try:
+        with open(PROPHETIC_LIBRARY_JSON, "r", encoding="utf-8") as f:
+            return json.load(f, object_pairs_hook=_pairs_warn_duplicates)
+    except Exception as e:
+        logger.exception(f"Error reading {PROPHETIC_LIBRARY_JSON}: {e}")
+        return fallback
 
-    # ───────── Leadership ─────────
-    "leadership": {
-        "Pioneer Grace": [
-            "You lead by entering places others avoid—your courage opens doors for the entire group.",
-        ],
-        "Peacemaker": [
-            "Your leadership carries calm authority—people follow you because they feel safe near you.",
-        ],
-        "Psalmist": [
-            "Your leadership flows from authenticity and compassion—your heart leads as strongly as your words.",
-        ],
-        "Builder": [
-            "God is developing you as a leader who builds people, systems, and future foundations.",
-        ],
-        "Holy Freedom": [
-            "You lead by breaking limits and showing others what freedom in Christ truly looks like.",
-        ],
-        "Keeper of Covenant": [
-            "Your leadership is grounded in loyalty—people trust you because you keep your word.",
-        ],
-        "Mystic Scholar": [
-            "Your insight shapes your leadership—God gives you understanding others rely on.",
-        ],
-        "Steward of Influence": [
-            "The Lord is expanding your leadership circle—you are being positioned to steward people well.",
-        ],
-        "Compassionate Finisher": [
-            "You lead with care and follow-through—your consistency inspires confidence.",
-        ],
-        "Prophetic Beacon": [
-            "You lead prophetically—God gives you direction before the need appears.",
-        ],
-        "Master Repairer": [
-            "You are a stabilizing leader—people heal under your care and clarity.",
-        ],
-        "Servant-Teacher": [
-            "You lead by serving and teaching—God elevates you because you elevate others.",
-        ],
-        "default": [
-            "God is shaping your leadership for this season—He is maturing your voice and strengthening your influence.",
-            "Your leadership will flow from humility, wisdom, and obedience to God’s prompting.",
-        ],
-    },
+# Parsed eagerly (~0.3 ms): the topic ids and the slot table below are built from it.
+PROPHETIC_LIBRARY = _load_prophetic_library()
 
+def _freeze_tree(d: Dict[str, Any]) -> MappingProxyType:
+    """Intern keys and lines, turn lists into tuples and dicts into read-only proxies."""
+    return MappingProxyType({
+        sys.intern(k): tuple(sys.intern(x) for x in v) if isinstance(v, list) else _freeze_tree(v)
+        for k, v in d.items()
+    })
 
-    "general": {
-        "default": [
-            "God is ordering your steps one act of obedience at a time.",
-            "You are not behind; the Lord knows exactly where you are and how to lead you forward.",
-        ]
-    },
-}
+# Read-only from here on: shared by every request thread, never written after import
+PROPHETIC_LIBRARY = _freeze_tree(PROPHETIC_LIBRARY)
 
 SCRIPTURE_BY_TOPIC = {
     "career": "Colossians 3:23 — “And whatsoever ye do, do it heartily, as to the Lord, and not unto men.”",
@@ -6685,11 +5961,124 @@ PRACTICAL_STEP_BY_TOPIC = {
     "general": "Bring your day before God, ask Him for one clear next step, and write it down so you can agree with it in action.",
 }
 
+# Topic keys are identifier-like literals, so the compiler has already interned them
+SCRIPTURE_BY_TOPIC = MappingProxyType(SCRIPTURE_BY_TOPIC)
+PRACTICAL_STEP_BY_TOPIC = MappingProxyType(PRACTICAL_STEP_BY_TOPIC)
+
+
+# ────────── Prophetic library lookup ──────────
+class PropheticEntry(NamedTuple):
+    """Everything a prophetic word needs for one (topic, archetype) slot."""
+    messages: Tuple[str, ...]
+    scripture: str
+    step: str
+    words: Tuple[str, ...]  # fully rendered replies, parallel to messages
+    n: int  # len(messages), stored so a pick doesn't recompute it
+
+
+# topic -> (scripture, practical step, default lines), 'general' fallbacks already applied:
+# one probe per topic instead of one into each of the three source tables
+_TOPIC_TABLE: Mapping[str, Tuple[str, str, Tuple[str, ...]]] = MappingProxyType({
+    topic: (
+        SCRIPTURE_BY_TOPIC.get(topic) or SCRIPTURE_BY_TOPIC["general"],
+        PRACTICAL_STEP_BY_TOPIC.get(topic) or PRACTICAL_STEP_BY_TOPIC["general"],
+        block.get("default") or PROPHETIC_LIBRARY["general"]["default"],
+    )
+    for topic, block in PROPHETIC_LIBRARY.items()
+})
+
+
+def _make_prophetic_entry(topic: str, lines: Sequence[str]) -> PropheticEntry:
+    scripture, step, _ = _TOPIC_TABLE[topic]
+    # The set of possible words is small and fixed, so render each one once here
+    words = tuple(
+        "\n".join([line, f"Scripture: {scripture}", f"One step: {step}"]) for line in lines
+    )
+    return PropheticEntry(tuple(lines), scripture, step, words, len(words))
+
+
+# Slot view of PROPHETIC_LIBRARY, [topic id][archetype slot] -> PropheticEntry, built at import.
+_TOPIC_NAMES: Tuple[str, ...] = tuple(PROPHETIC_LIBRARY)
+_TOPIC_ID: Dict[str, int] = {topic: i for i, topic in enumerate(_TOPIC_NAMES)}
+_GENERAL_ID = _TOPIC_ID["general"]
+_ARCHE_SLOT: Dict[str, int] = {name: i for i, name in enumerate(DESTINY_THEME_NAMES.values())}
+_DEFAULT_SLOT = len(_ARCHE_SLOT)
+
+
+def _render_prophetic_topic(topic: str) -> Tuple[PropheticEntry, ...]:
+    """One topic's row of _PROPHETIC_SLOTS; archetypes it leaves empty get its default."""
+    block = PROPHETIC_LIBRARY[topic]
+    default = _make_prophetic_entry(topic, _TOPIC_TABLE[topic][2])
+    return tuple(
+        _make_prophetic_entry(topic, block[name]) if name in block else default
+        for name in _ARCHE_SLOT
+    ) + (default,)
+
+
+_PROPHETIC_SLOTS: Tuple[Tuple[PropheticEntry, ...], ...] = tuple(
+    _render_prophetic_topic(topic) for topic in _TOPIC_NAMES
+)
+
+
+_rng = random.Random()
+_rand = _rng.randrange
+
+
+def _pick(seq: Sequence[Any]) -> Any:
+    """random.choice for a non-empty sequence, minus choice's extra method dispatch."""
+    return seq[_rand(len(seq))]
+
+
+def _pick_each(*seqs: Sequence[Any]) -> List[Any]:
+    """One uniform, independent pick from each sequence, all from a single RNG draw."""
+    total = 1
+    for seq in seqs:
+        total *= len(seq)
+    r = _rand(total)
+    out = []
+    for seq in seqs:
+        r, i = divmod(r, len(seq))  # mixed-radix digits of a uniform draw are uniform
+        out.append(seq[i])
+    return out
+
+
+@functools.lru_cache(maxsize=512)
+def _prophetic_entry(topic: str, arche: Optional[str]) -> PropheticEntry:
+    """Resolved entry for (topic, archetype); unknown topics use 'general', unknown archetypes 'default'."""
+    tid = _TOPIC_ID.get(topic, _GENERAL_ID)
+    return _PROPHETIC_SLOTS[tid][_ARCHE_SLOT.get(arche, _DEFAULT_SLOT)]
+
+
+def _pick_line(n: int, msgs: Tuple[str, ...]) -> str:
+    # Most archetype buckets hold a single line; skip the RNG for those
+    return msgs[0] if n == 1 else msgs[_rand(n)]
+
+
+def detect_destiny_theme(user_text: str) -> Optional[str]:
+    """Return a destiny theme title named in the text (e.g. 'Builder'), if any."""
+    t = (user_text or "").lower()
+    for name in _ARCHE_SLOT:
+        if name.lower() in t:
+            return name
+    return None
+
+
+def get_prophetic_word(topic: str, theme_name: Optional[str] = None) -> str:
+    """Short library-backed prophetic word: one line, one Scripture, one step."""
+    entry = _prophetic_entry(topic, theme_name)
+    return _pick_line(entry.n, entry.words)
 
 # ────────── Intent detection (with prophetic support) ──────────
 
+# Every pattern below is matched against lowercased text (_normalize_simple or .lower()),
+# so they compile without re.I and the engine skips case-folding on each comparison.
+def _rx(pattern: str, *, verbose: bool = False, flags: int = 0) -> "re.Pattern[str]":
+    """Compile an intent pattern; flags go here rather than inline so they read the same everywhere."""
+    return re.compile(pattern, flags | (re.VERBOSE if verbose else 0))
+
+
 # Meta/origin/architecture questions
-ORIGIN_RX = re.compile(
+ORIGIN_RX = _rx(
     r"(?:^|\b)("
     r"how\s+(?:were|was)\s+(?:you|u)\s+(?:built|made|created|designed|put\s+together)|"
     r"how\s+(?:do|does)\s+(?:you|u)\s+work|"
@@ -6699,46 +6088,78 @@ ORIGIN_RX = re.compile(
     r"what\s+model\s+(?:were|was)\s+(?:you|u)\s+train(?:ed|t)\s+on|"
     r"how\s+were\s+(?:you|u)\s+train(?:ed|t)"
     r")(\b|$)",
-    re.I,
 )
 
 # --- Moral & Eternity question detectors (youth FAQs) ---
-MASTURBATION_RX = re.compile(
+MASTURBATION_RX = _rx(
     r"\b("
     r"mast(?:er)?(?:bat(?:e|ing|ion)?)|"      # masturbate/masterbate/masturbation
     r"maturbat(?:e|ion|ing)?|"                # maturbate variants
     r"self\s*pleas(?:e|ing)?|"                # self please/pleasing
     r"touch\s*myself"
-    r")\b", re.I)
+    r")\b")
+
+SIN_QUESTION_RX = _rx(r"\b(is|are)\s+(it|this|that|doing|watching|smoking|taking|people|sex|porn|weed|drugs?)\b.*\b(sin|sinful|bad)\b")
+
+SEX_BEFORE_MARRIAGE_RX = _rx(r"\b(sex|sexual\s+activity)\s+before\s+marriage\b|\bis\s+(sex|sexual\s+activity)\s+before\s+marriage\s+a?\s*sin\b")
+PORN_RX = _rx(r"\b(porn|pornography|watch(?:ing)?\s+porn)\b|\bis\s+(watch(?:ing)?\s+)?porn(ography)?\s+a?\s*sin\b")
+
+DIVORCE_RX = _rx(r"\b(is\s+(getting\s+a\s+)?divorce\s+a?\s*sin|divorce|divorced)\b")
+SMOKING_RX = _rx(r"\b(is\s+smok(?:e|ing)(?:\s+weed)?\s+a?\s*sin|vape|vaping)\b")
+DRUGS_RX = _rx(r"\b(are|is)\s+(doing\s+)?(drugs?|weed|marijuana|cannabis|opioids?|pills?|cocaine|heroin)\s+a?\s*sin\b")
+
+CHEATING_RX = _rx(r"\b(is\s+it\s+a?\s*sin\s+to\s+cheat|cheat(?:ing)?\b)\b")
+STEALING_RX = _rx(r"\b(is\s+it\s+a?\s*sin\s+to\s+steal|steal(?:ing)?\b)\b")
+
+WHY_BAD_THINGS_RX = _rx(r"\b(if\s+god\s+love(?:s)?\s+me\s+why\s+do\s+bad\s+things\s+happen\s+to\s+me)\b")
+DEATH_THOUGHTS_RX = _rx(r"\b(thoughts?\s+about\s+death|fear\s+of\s+death|afraid\s+of\s+dying|what\s+happens\s+when\s+(you|we|i)\s+die)\b")
+HELL_BELIEF_RX = _rx(r"\b(do\s+(you|u)\s+believe\s+in\s+hell)\b")
+HELL_WHO_GOES_RX = _rx(r"\b(do\s+people\s+go\s+to\s+hell|who\s+goes\s+to\s+hell)\b")
+HEAVEN_HELL_REAL_RX = _rx(r"\b(is\s+(heaven|hell)\s+a\s+real\s+place|are\s+heaven\s+and\s+hell\s+real)\b")
+
+# Literal fragments each sensitive-ethics check cannot match without (on lowercased text).
+# One scan finds which categories are possible; only their regexes then run, in order.
+_SIN_FINGERPRINTS: Dict[str, Tuple[str, ...]] = {
+    "masturbation": ("mast", "maturbat", "pleas", "touch"),
+    "sex_before_marriage": ("before",),
+    "porn": ("porn",),
+    "cheating": ("cheat",),
+    "stealing": ("steal",),
+    "divorce": ("divorce",),
+    "smoking": ("smok", "vap"),
+    "drugs": ("sin",),
+    "gambling": ("gambl", "casino", "betting"),
+}
 
-SIN_QUESTION_RX = re.compile(r"\b(is|are)\s+(it|this|that|doing|watching|smoking|taking|people|sex|porn|weed|drugs?)\b.*\b(sin|sinful|bad)\b", re.I)
 
-SEX_BEFORE_MARRIAGE_RX = re.compile(r"\b(sex|sexual\s+activity)\s+before\s+marriage\b|\bis\s+(sex|sexual\s+activity)\s+before\s+marriage\s+a?\s*sin\b", re.I)
-PORN_RX = re.compile(r"\b(porn|pornography|watch(?:ing)?\s+porn)\b|\bis\s+(watch(?:ing)?\s+)?porn(ography)?\s+a?\s*sin\b", re.I)
+def _build_sin_automaton():
+    if ahocorasick is None:
+        return None
+    A = ahocorasick.Automaton()
+    for cat, fragments in _SIN_FINGERPRINTS.items():
+        for frag in fragments:
+            A.add_word(frag, cat)
+    A.make_automaton()
+    return A
 
-DIVORCE_RX = re.compile(r"\b(is\s+(getting\s+a\s+)?divorce\s+a?\s*sin|divorce|divorced)\b", re.I)
-SMOKING_RX = re.compile(r"\b(is\s+smok(?:e|ing)(?:\s+weed)?\s+a?\s*sin|vape|vaping)\b", re.I)
-DRUGS_RX = re.compile(r"\b(are|is)\s+(doing\s+)?(drugs?|weed|marijuana|cannabis|opioids?|pills?|cocaine|heroin)\s+a?\s*sin\b", re.I)
+_SIN_AUTOMATON = _build_sin_automaton()
 
-CHEATING_RX = re.compile(r"\b(is\s+it\s+a?\s*sin\s+to\s+cheat|cheat(?:ing)?\b)\b", re.I)
-STEALING_RX = re.compile(r"\b(is\s+it\s+a?\s*sin\s+to\s+steal|steal(?:ing)?\b)\b", re.I)
 
-WHY_BAD_THINGS_RX = re.compile(r"\b(if\s+god\s+love(?:s)?\s+me\s+why\s+do\s+bad\s+things\s+happen\s+to\s+me)\b", re.I)
-DEATH_THOUGHTS_RX = re.compile(r"\b(thoughts?\s+about\s+death|fear\s+of\s+death|afraid\s+of\s+dying|what\s+happens\s+when\s+(you|we|i)\s+die)\b", re.I)
-HELL_BELIEF_RX = re.compile(r"\b(do\s+(you|u)\s+believe\s+in\s+hell)\b", re.I)
-HELL_WHO_GOES_RX = re.compile(r"\b(do\s+people\s+go\s+to\s+hell|who\s+goes\s+to\s+hell)\b", re.I)
-HEAVEN_HELL_REAL_RX = re.compile(r"\b(is\s+(heaven|hell)\s+a\s+real\s+place|are\s+heaven\s+and\s+hell\s+real)\b", re.I)
+def _sin_categories(t: str) -> set:
+    """Sensitive-ethics categories whose fingerprints occur in lowercased t."""
+    if _SIN_AUTOMATON is not None:
+        return {cat for _, cat in _SIN_AUTOMATON.iter(t)}
+    return {cat for cat, fragments in _SIN_FINGERPRINTS.items() if any(f in t for f in fragments)}
 
 
 
-IDENTITY_PAT = re.compile(
+IDENTITY_PAT = _rx(
     r"\b(?:are\s+you|r\s*u)\s+(?:pastor\s+)?(?:debra(?:\s+ann)?\s+jordan|pastor\s+jordan)\b",
-    re.I
 )
 
 
-POME_RX = re.compile(
-    r"""(?ix)
+POME_RX = _rx(
+    r"""
     \b(
         # direct acronym triggers
         p[\s\.]*o[\s\.]*m[\s\.]*e |
@@ -6753,83 +6174,326 @@ POME_RX = re.compile(
         mar\s+elijah
     )\b
     """,
-    re.I | re.X,
+    verbose=True,
 )
 
+# Exact tokens POME_RX would accept outright; anything else needs one of its literals
+# ("order", "elijah", or p-o-m-e once spaces and dots are dropped) before the regex runs.
+_POME_TOKENS = frozenset({"pome", "p.o.m.e", "p.o.m.e."})
+
+def _mentions_pome(t: str) -> bool:
+    """Same answer as POME_RX.search(t) on lowercased text, usually without the regex."""
+    if not _POME_TOKENS.isdisjoint(t.split()):
+        return True
+    if "order" in t or "elijah" in t or "pome" in t.replace(" ", "").replace(".", ""):
+        return POME_RX.search(t) is not None
+    return False
+
 
-MAR_ELIJAH_ORDER_RX = re.compile(r"""(?ix)
+MAR_ELIJAH_ORDER_RX = _rx(r"""
     \b(the\s+)?prophetic\s+order\s+of\s+mar\s+elijah\b|
     \bmar\s+elijah\b.*\bprophetic\s+order\b
-""")
+""", verbose=True)
 
 # --- prophetic word (narrowed) ---
-PROPHETIC_PAT = re.compile(r"""(?ix)
+PROPHETIC_PAT = _rx(r"""
     \b(
         (personal\s+)?prophetic\s+word |
         (give|speak)\s+(me\s+)?a\s+prophecy |
         prophesy\s+(over|to)\s+me |
         ask\s+prophetic
     )\b
-""")
+""", verbose=True)
 
 # --- Prophecology typo normalization (broad coverage) ---
-PROPHECOLOGY_WORD_RX = re.compile(r"""(?ix)
+PROPHECOLOGY_WORD_RX = _rx(r"""
 \b(
-    prophecology | prophecolog |                       # base + missing 'y'
-    proph[eoa]?cology | proph[eoa]?colog |             # vowel swaps / missing y
+    proph[eoa]?cology? |                               # base, vowel swaps, missing 'y'
     poephecology | propehcology | prophechology |      # transpositions/extra 'h'
-    prophocology | prophec0logy |                      # o-for-e, zero-for-o
+    prophec0logy |                                     # zero-for-o
     prophesology |                                     # common phonetic miss
     school\s+of\s+(the\s+)?prophets                    # alias
 )\b
-""")
+""", verbose=True)
+
+# Every variant above contains one of these; most messages contain none and skip the regex.
+# Callers pass lowercased text (detect_intent runs _normalize_simple first).
+_PROPHECOLOGY_FINGERPRINTS = ("prop", "poeph", "school")
 
 def _normalize_prophecology_typos(s: str) -> str:
+    if not any(f in s for f in _PROPHECOLOGY_FINGERPRINTS):
+        return s
     return PROPHECOLOGY_WORD_RX.sub("prophecology", s)
 
 
-# Prophecology intent (signup / info)
-PROPHECOLOGY_SIGNUP_RX = re.compile(r"""(?ix)
-\b(
-   sign\s*up | signup | register | registration | enroll | enrol |
-   attend | join | rsvp | ticket | tickets | pass | passes
-)\b
-.*?\bprophecology\b
-|
-\bprophecology\b
-.*?\b(
-   sign\s*up | signup | register | registration | enroll | enrol |
-   attend | join | rsvp | ticket | tickets | pass | passes
-)\b
-""")
+# Prophecology intent (signup / info). Word sets rather than two ".*?" regexes: the
+# message is split into words once and each side becomes a membership test.
+_PROPHECOLOGY_SIGNUP_WORDS = frozenset({
+    "signup", "register", "registration", "enroll", "enrol",
+    "attend", "join", "rsvp", "ticket", "tickets", "pass", "passes",
+})
+# info words count after "prophecology" ...
+_PROPHECOLOGY_INFO_AFTER = frozenset({
+    "info", "information", "detail", "details", "schedule", "date", "dates", "time", "times",
+    "agenda", "itinerary", "stream", "livestream", "watch", "replay", "location", "where",
+    "price", "cost",
+})
+# ... and these before it
+_PROPHECOLOGY_INFO_BEFORE = frozenset({
+    "when", "where", "schedule", "date", "dates", "stream", "watch", "replay",
+})
+_PROPHECOLOGY_INFO_BEFORE_PHRASES = (("what", "time"), ("how", "to"), ("how", "do", "i"))
+_WORDS_RX = re.compile(r"\w+")
 
-PROPHECOLOGY_INFO_RX = re.compile(r"""(?ix)
-\bprophecology\b
-.*?\b(
-   info|information|details?|schedule|date|dates|time|times|agenda|itinerary|
-   stream|live\s*stream|livestream|watch|replay|location|where|price|cost
-)\b
-|
-\b(
-   when|what\s+time|where|how\s+(to|do\s+i)|schedule|dates?|stream|watch|replay
-)\b
-.*?\bprophecology\b
-""")
+
+def _asks_about_prophecology(t: str) -> bool:
+    """Signup or info question about Prophecology, in either word order (t is normalized)."""
+    if "prophecology" not in t:
+        return False
+    words = _WORDS_RX.findall(t)
+    at = [i for i, w in enumerate(words) if w == "prophecology"]
+    if not at:
+        return False
+    if not _PROPHECOLOGY_SIGNUP_WORDS.isdisjoint(words):
+        return True
+    if any(a == "sign" and b == "up" for a, b in zip(words, words[1:])):
+        return True
+    first, last = at[0], at[-1]
+    if not _PROPHECOLOGY_INFO_AFTER.isdisjoint(words[first + 1:]):
+        return True
+    before = words[:last]
+    if not _PROPHECOLOGY_INFO_BEFORE.isdisjoint(before):
+        return True
+    return any(
+        tuple(before[i:i + len(ph)]) == ph
+        for ph in _PROPHECOLOGY_INFO_BEFORE_PHRASES
+        for i in range(len(before) - len(ph) + 1)
+    )
 
 
 # --- Faces of Eve / books patterns ---
-FACES_PAT = re.compile(
+FACES_PAT = _rx(
     r"\b(faces\s+of\s+eve|your\s+book\b|book\s+you\s+wrote|what\s+is\s+faces\s+of\s+eve\s+about|"
     r"favorite\s+chapter|which\s+chapter\s+do\s+you\s+love)\b",
-    re.I
 )
 
-BOOK_COUNT_PAT = re.compile(r"\b(how\s+many\s+books\s+have\s+you\s+written)\b", re.I)
+BOOK_COUNT_PAT = _rx(r"\b(how\s+many\s+books\s+have\s+you\s+written)\b")
+
+# Matches questions about books/Faces of Eve/chapters
+BOOK_PAT = _rx(r"\b(book|books|faces\s+of\s+eve|chapter|chapters)\b")
+
+
+def _any_rx(*rxs: "re.Pattern[str]") -> "re.Pattern[str]":
+    """One compiled pattern that matches wherever any of rxs would (each keeps its own flags)."""
+    parts = []
+    for rx in rxs:
+        flags = "".join(c for c, bit in (("i", re.I), ("m", re.M), ("s", re.S), ("x", re.X)) if rx.flags & bit)
+        body = re.sub(r"^\(\?[aiLmsux]+\)", "", rx.pattern)
+        # newline so a trailing verbose-mode comment can't swallow the closing paren
+        parts.append(f"(?{flags}:{body}\n)" if "x" in flags else f"(?{flags}:{body})")
+    return re.compile("|".join(parts))
+
+
+# detect_intent's donation cues (wider than DONATION_RX above), compiled once at import
+_DONATE_CUE = r"(?:donat(?:e|ed)|giv(?:e|en|ing)|gift(?:ed)?|seed(?:ed)?)"
+_EIGHTM_CUE = r"(?:8\s*[,\.]?\s*m(?:illion)?|eight\s+million|\$?\s*8[, ]?0{3}[, ]?0{3})"
+_SCHOOL_CUE = r"(?:virginia(?:\s*union)?\s*(?:university)?|vuu)"
+
+_INTENT_DONATION_RX = _any_rx(
+    _rx(
+        rf"(?:(?:did|why(?:\s+did)?)\s+(?:your|ur)\s+(?:husband|spouse)|"
+        rf"(?:did|why(?:\s+did)?)\s+(?:the\s+)?master\s+prophet|"
+        rf"(?:did|why(?:\s+did)?)\s+(?:e\.?\s*bernard\s+jordan|bishop\s+e\.?\s*bernard\s+jordan)|"
+        rf"\bjordan\b|\bmaster\s+prophet\b)"
+        rf".{{0,200}}?{_DONATE_CUE}"
+        rf".{{0,200}}?{_EIGHTM_CUE}"
+        rf".{{0,200}}?{_SCHOOL_CUE}",
+    ),
+    _rx(
+        rf"(jordan|master\s+prophet|husband).{{0,200}}?{_EIGHTM_CUE}.{{0,200}}?{_SCHOOL_CUE}|"
+        rf"{_EIGHTM_CUE}.{{0,200}}?(jordan|master\s+prophet|husband).{{0,200}}?{_SCHOOL_CUE}",
+    ),
+)
+_HUSBAND_CUE_RX = _rx(r"\b(?:husband|spouse)\b")
+_DONATION_CUE_RX = _rx(f"{_DONATE_CUE}|{_EIGHTM_CUE}|{_SCHOOL_CUE}")
+
+# Checks that share an outcome are fused, so each outcome costs one scan of the message
+_INTENT_TITHE_RX = _any_rx(TITHE_ZOE_RX, TITHE_ME_RX, ZOE_SITE_RX)
+_DESTINY_CUE_RX = _rx(r"\bdestiny\s*theme\b|dob|date of birth")
+_THEME_NUMBER_RX = _rx(r"\b(1|2|3|4|5|6|7|8|9|11|22|33)\b")
+
+# Plain substring keyword groups, each folded into one alternation so a message is
+# scanned once per group instead of once per keyword.
+_ADVICE_KEYS = (
+    "advice","help","what should i do","today","now","feeling","anxious","anxiety","panic",
+    "grief","relationship","marriage","breakup","dating","boundaries","forgiveness",
+    "career","calling","purpose","health","sick","diagnosis","pray","prayer","intercede",
+    "week","weekly","encouragement","discern my calling","wise next step","one step","next step"
+)
+_THEOLOGY_KEYS = (
+    "faces of eve","womanist","moon","waxing","waning","binah","chesed","gevurah",
+    "scripture","bible","teaching","conference","session","clip","video","sermon","notes","excerpt"
+)
+_ADVICE_KEYS_RX = re.compile("|".join(map(re.escape, _ADVICE_KEYS)))
+_THEOLOGY_KEYS_RX = re.compile("|".join(map(re.escape, _THEOLOGY_KEYS)))
+
+# Every regex detect_intent consults, by name. With Hyperscan installed they are compiled
+# into one database and a message is scanned once for all of them; otherwise each is
+# searched lazily, only when detect_intent reaches its check.
+_INTENT_RXS: Dict[str, "re.Pattern[str]"] = {
+    "donation": _INTENT_DONATION_RX,
+    "husband_cue": _HUSBAND_CUE_RX,
+    "donation_cue": _DONATION_CUE_RX,
+    "prophetic": PROPHETIC_PAT,
+    "identity": IS_HUSBAND_Q_RX,
+    "tithe": _INTENT_TITHE_RX,
+    "advice": _ADVICE_KEYS_RX,
+    "books": BOOK_PAT,
+    "destiny_cue": _DESTINY_CUE_RX,
+    "theme_number": _THEME_NUMBER_RX,
+    "teachings": _THEOLOGY_KEYS_RX,
+    "origin": ORIGIN_RX,
+}
+_INTENT_NAMES = tuple(_INTENT_RXS)
+
+# With google-re2 installed the donation pattern, with its chained .{0,200}? gaps, runs on
+# RE2 (linear in the message, whatever the input); Hyperscan, when present, still wins.
+_INTENT_RXS_RE2 = {
+    name: twin for name in ("donation",) if (twin := _re2_twin(_INTENT_RXS[name])) is not None
+}
+
+# Bytes twins of the heaviest patterns. On ASCII text (most chat) the bytes engine skips
+# the per-character Unicode checks, which measured ~10% faster on the donation scan.
+_INTENT_RXS_BYTES: Dict[str, "re.Pattern[bytes]"] = {
+    name: re.compile(_INTENT_RXS[name].pattern.encode("ascii"), _INTENT_RXS[name].flags & ~re.UNICODE)
+    for name in ("donation",)
+}
+
+# Literals each pattern cannot match without (normalized text is lowercase). On the re
+# path a pattern only runs when one is present, so a typical message costs a few substring
+# tests instead of a regex walk per rule. detect_intent's rule order is its precedence,
+# so the fast path comes from skipping rules, not from reordering them. The keyword
+# groups have no entry: their pattern is already just the literals.
+_INTENT_FINGERPRINTS: Dict[str, Tuple[str, ...]] = {
+    "donation": ("8", "eight"),
+    "husband_cue": ("husband", "spouse"),
+    "donation_cue": ("donat", "giv", "gift", "seed", "8", "eight", "virginia", "vuu"),
+    "prophetic": ("prophe",),
+    "identity": ("husband", "spouse", "married", "wife"),
+    "tithe": ("tithe", "offering", "give", "donat", "zoe"),
+    "books": ("book", "chapter", "eve"),
+    "destiny_cue": ("destiny", "dob", "date of birth"),
+    "theme_number": tuple("123456789"),
+    "origin": ("how", "who", "what"),
+}
+
+
+# Messages the Hyperscan database must classify exactly as the re patterns do before it is used
+_INTENT_DB_PROBES = (
+    "give me a prophetic word",
+    "prophesy over me please",
+    "is your husband a pastor too",
+    "how can i donate or give my tithe",
+    "did the 8 million gift go to virginia union",
+    "tell me about the book faces of eve",
+    "what is my destiny theme, my dob is 1980-05-01",
+    "i am a 7",
+    "who created you and how do you work",
+    "i need prayer for my marriage",
+)
+
+
+def _hs_expression(rx: "re.Pattern[str]") -> bytes:
+    # Hyperscan has no compile flag for verbose mode, so carry it inline
+    pattern = rx.pattern
+    if rx.flags & re.X and not re.match(r"\(\?[aiLmsu]*x", pattern):
+        pattern = "(?x)" + pattern
+    return pattern.encode("utf-8")
+
+
+def _hs_scan(db, t: str) -> set:
+    found = set()
+    db.scan(
+        t.encode("utf-8"),
+        match_event_handler=lambda i, start, end, flags, ctx: found.add(_INTENT_NAMES[i]),
+    )
+    return found
+
+
+def _build_intent_db():
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[_hs_expression(rx) for rx in _INTENT_RXS.values()],
+            ids=list(range(len(_INTENT_RXS))),
+            elements=len(_INTENT_RXS),
+            flags=[
+                hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                | (hyperscan.HS_FLAG_CASELESS if rx.flags & re.I else 0)
+                for rx in _INTENT_RXS.values()
+            ],
+        )
+        for probe in _INTENT_DB_PROBES:
+            want = {name for name, rx in _INTENT_RXS.items() if rx.search(probe)}
+            got = _hs_scan(db, probe)
+            if got != want:
+                logger.warning(
+                    "hyperscan intents disagree with re on %r (hs=%s re=%s), using re",
+                    probe, sorted(got), sorted(want),
+                )
+                return None
+        return db
+    except Exception as e:
+        logger.warning("hyperscan intent database unavailable, using re: %s", e)
+        return None
+
+_INTENT_DB = _build_intent_db()
 
-# Matches questions about books/Faces of Eve/chapters
-BOOK_PAT = re.compile(r"\b(book|books|faces\s+of\s+eve|chapter|chapters)\b", re.I)
 
+class _IntentHits:
+    """Answers "does intent pattern <name> match t?" for one message."""
+    __slots__ = ("t", "names")
 
+    def __init__(self, t: str):
+        self.t = t
+        self.names = None
+        if _INTENT_DB is not None:
+            try:
+                self.names = _hs_scan(_INTENT_DB, t)
+            except Exception as e:
+                logger.warning("hyperscan scan failed, using re: %s", e)
+
+    def __call__(self, name: str) -> bool:
+        if self.names is not None:
+            return name in self.names
+        t = self.t
+        fingerprints = _INTENT_FINGERPRINTS.get(name)
+        if fingerprints and not any(f in t for f in fingerprints):
+            return False
+        rx_re2 = _INTENT_RXS_RE2.get(name)
+        if rx_re2 is not None:
+            return rx_re2.search(t) is not None
+        rx_bytes = _INTENT_RXS_BYTES.get(name)
+        if rx_bytes is not None and t.isascii():
+            return rx_bytes.search(t.encode("ascii")) is not None
+        return _INTENT_RXS[name].search(t) is not None
+
+
+
+
+_GLORY_BULLETS = (
+    "Here are five Scriptures that include the word *glory*:\n\n"
+    "• **Psalm 19:1** – “The heavens declare the glory of God; the skies proclaim the work of his hands.”\n"
+    "• **Isaiah 6:3** – “Holy, holy, holy is the Lord Almighty; the whole earth is full of his glory.”\n"
+    "• **John 1:14** – “We have seen his glory, the glory of the one and only Son, "
+    "who came from the Father, full of grace and truth.”\n"
+    "• **Romans 8:18** – “Our present sufferings are not worth comparing with the glory that will be revealed in us.”\n"
+    "• **Revelation 21:23** – “The city does not need the sun or the moon to shine on it, "
+    "for the glory of God gives it light, and the Lamb is its lamp.”\n\n"
+    "Which of these verses speaks most strongly to your spirit right now?"
+)
 
 
 def answer_glory_bullets() -> str:
@@ -6837,22 +6501,54 @@ def answer_glory_bullets() -> str:
     Special-case: user wants '5 scriptures with the word glory' in bullet points.
     We don’t rely on 'previous answer'—we just give them fresh in bullet form.
     """
-    return (
-        "Here are five Scriptures that include the word *glory*:\n\n"
-        "• **Psalm 19:1** – “The heavens declare the glory of God; the skies proclaim the work of his hands.”\n"
-        "• **Isaiah 6:3** – “Holy, holy, holy is the Lord Almighty; the whole earth is full of his glory.”\n"
-        "• **John 1:14** – “We have seen his glory, the glory of the one and only Son, "
-        "who came from the Father, full of grace and truth.”\n"
-        "• **Romans 8:18** – “Our present sufferings are not worth comparing with the glory that will be revealed in us.”\n"
-        "• **Revelation 21:23** – “The city does not need the sun or the moon to shine on it, "
-        "for the glory of God gives it light, and the Lamb is its lamp.”\n\n"
-        "Which of these verses speaks most strongly to your spirit right now?"
-    )
+    return _GLORY_BULLETS
+
+
+# detect_intent's rules in precedence order: (patterns that must all match, intent)
+_INTENT_RULES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("donation",), "donation"),                      # donation FIRST
+    (("husband_cue", "donation_cue"), "donation"),    # husband + donation cues (guard)
+    (("prophetic",), "prophetic"),
+    (("identity",), "identity"),                      # identity / faq shortcuts
+    (("tithe",), "faq"),
+    (("advice",), "advice"),                          # advice / pastoral care
+    (("books",), "books"),                            # books / faces
+    (("destiny_cue", "theme_number"), "destiny"),     # context-bound numbers
+    (("teachings",), "teachings"),
+    (("origin",), "origin"),                          # origin/tech
+)
 
 
-def detect_intent(user_text: str) -> str:
-    import re
+@functools.lru_cache(maxsize=4096)
+def _detect_intent_cached(t: str) -> str:
+    """Intent for already-normalized text; pure, so repeated messages skip every check."""
+    # prophecology => FAQ
+    if _asks_about_prophecology(t):
+        return "faq"
+
+    hit = _IntentHits(t)
+    for names, intent in _INTENT_RULES:
+        if all(hit(name) for name in names):
+            return intent
+    return "general"
+
+
+_INTENT_TYPOS = {
+    "dontae": "donate",
+    "dontate": "donate",
+    "bernad": "bernard",
+    "virgina": "virginia",
+    "prophecolog": "prophecology",
+    "prophechology": "prophecology",
+    "prophecology?": "prophecology",
+    "school of the prophets": "prophecology",
+}
+_INTENT_TYPO_RX = _typo_rx(_INTENT_TYPOS)
 
+
+# Normalization is a few cheap passes and stays outside the cache; the one cache is
+# _detect_intent_cached, keyed on the normalized text, so spelling variants share an entry
+def detect_intent(user_text: str) -> str:
     # --- normalization ---
     try:
         t = _normalize_simple(user_text or "")
@@ -6862,112 +6558,9 @@ def detect_intent(user_text: str) -> str:
     # normalize prophecology typos too
     t = _normalize_prophecology_typos(t)
 
-    typo_map = {
-        " dontae ": " donate ",
-        " dontate ": " donate ",
-        " bernad ": " bernard ",
-        " virgina ": " virginia ",
-        " prophecolog ": " prophecology ",
-        " prophechology ": " prophecology ",
-        " prophecology? ": " prophecology ",
-        " school of the prophets ": " prophecology ",
-    }
-    t_pad = f" {t} "
-    for _bad, _good in typo_map.items():
-        t_pad = t_pad.replace(_bad, _good)
-    t = t_pad.strip()
-
-    # ensure globals referenced elsewhere exist
-    global BOOK_PAT, PROPHETIC_PAT
-    if 'BOOK_PAT' not in globals() or BOOK_PAT is None:
-        BOOK_PAT = re.compile(r"\b(book|books|faces\s+of\s+eve|chapter|chapters|author|wrote|writing)\b", re.I)
-    if 'PROPHETIC_PAT' not in globals() or PROPHETIC_PAT is None:
-        PROPHETIC_PAT = re.compile(
-            r"\b(prophetic\s+word|prophecy|prophesy|speak\s+into\s+my\s+season|word\s+for\s+my\s+season|ask\s+prophetic)\b",
-            re.I
-        )
-
-    # donation cues
-    DONATE = r"(?:donat(?:e|ed)|giv(?:e|en|ing)|gift(?:ed)?|seed(?:ed)?)"
-    EIGHTM = r"(?:8\s*[,\.]?\s*m(?:illion)?|eight\s+million|\$?\s*8[, ]?0{3}[, ]?0{3})"
-    SCHOOL = r"(?:virginia(?:\s*union)?\s*(?:university)?|vuu)"
-
-    DONATION_RX = re.compile(
-        rf"(?:(?:did|why(?:\s+did)?)\s+(?:your|ur)\s+(?:husband|spouse)|"
-        rf"(?:did|why(?:\s+did)?)\s+(?:the\s+)?master\s+prophet|"
-        rf"(?:did|why(?:\s+did)?)\s+(?:e\.?\s*bernard\s+jordan|bishop\s+e\.?\s*bernard\s+jordan)|"
-        rf"\bjordan\b|\bmaster\s+prophet\b)"
-        rf".{{0,200}}?{DONATE}"
-        rf".{{0,200}}?{EIGHTM}"
-        rf".{{0,200}}?{SCHOOL}",
-        re.I
-    )
-
-    DONATION_SHORT_RX = re.compile(
-        rf"(jordan|master\s+prophet|husband).{{0,200}}?{EIGHTM}.{{0,200}}?{SCHOOL}|"
-        rf"{EIGHTM}.{{0,200}}?(jordan|master\s+prophet|husband).{{0,200}}?{SCHOOL}",
-        re.I
-    )
-
-    # prophecology => FAQ
-    if PROPHECOLOGY_SIGNUP_RX.search(t) or PROPHECOLOGY_INFO_RX.search(t):
-        return "faq"
-
-    # donation FIRST
-    if DONATION_RX.search(t) or DONATION_SHORT_RX.search(t):
-        return "donation"
-
-    # husband + donation cues => donation (guard)
-    if re.search(r"\bhusband|spouse\b", t, re.I) and (
-        re.search(DONATE, t, re.I) or re.search(EIGHTM, t, re.I) or re.search(SCHOOL, t, re.I)
-    ):
-        return "donation"
-
-    # prophetic
-    try:
-        if PROPHETIC_PAT.search(t):
-            return "prophetic"
-    except Exception:
-        pass
-
-    # identity / faq shortcuts
-    if IS_HUSBAND_Q_RX.search(t):
-        return "identity"
-    if TITHE_ZOE_RX.search(t) or TITHE_ME_RX.search(t) or ZOE_SITE_RX.search(t):
-        return "faq"
-
-    # advice / pastoral care
-    ADVICE_KEYS = (
-        "advice","help","what should i do","today","now","feeling","anxious","anxiety","panic",
-        "grief","relationship","marriage","breakup","dating","boundaries","forgiveness",
-        "career","calling","purpose","health","sick","diagnosis","pray","prayer","intercede",
-        "week","weekly","encouragement","discern my calling","wise next step","one step","next step"
-    )
-    if any(k in t for k in ADVICE_KEYS):
-        return "advice"
-
-    # books / faces
-    if BOOK_PAT.search(t):
-        return "books"
-
-    # destiny (context-bound numbers)
-    if (re.search(r"\bdestiny\s*theme\b", t) or "dob" in t or "date of birth" in t or "name and dob" in t) and \
-       re.search(r"\b(1|2|3|4|5|6|7|8|9|11|22|33)\b", t):
-        return "destiny"
-
-    # teachings
-    THEOLOGY_KEYS = (
-        "faces of eve","womanist","moon","waxing","waning","binah","chesed","gevurah",
-        "scripture","bible","teaching","conference","session","clip","video","sermon","notes","excerpt"
-    )
-    if any(k in t for k in THEOLOGY_KEYS):
-        return "teachings"
+    t = _INTENT_TYPO_RX.sub(lambda m: _INTENT_TYPOS[m.group(0)], t).strip()
 
-    # origin/tech — reuse global
-    if ORIGIN_RX.search(t):
-        return "origin"
-
-    return "general"
+    return _detect_intent_cached(t)
 
 
 
@@ -6981,6 +6574,19 @@ def faces_search_top(query: str, k: int = 1) -> Optional[Dict[str, Any]]:
         logger.warning("faces_search_top error: %s", e)
         return None
 
+_FACES_BOOK_COUNT_MSG = (
+    "I’ve written *Faces of Eve*—a work inviting women to recognize how God restores "
+    "identity through grace and wisdom. I continue to write and teach from that stream.\n"
+    "Scripture: Proverbs 4:7\n"
+    "What theme from the book are you most curious about?"
+)
+_FACES_FALLBACK_MSG = (
+    "In *Faces of Eve*, I write about identity, healing, and the ways God restores dignity where "
+    "life tried to diminish it. It’s an invitation to encounter grace and walk in holy wisdom.\n"
+    "Scripture: Isaiah 61:3\n"
+    "What aspect—identity, healing, or purpose—would you like me to unpack?"
+)
+
 def answer_faces_of_eve_or_books(user_text: str) -> Optional[str]:
     t = (user_text or "").strip().lower()
 
@@ -6988,13 +6594,7 @@ def answer_faces_of_eve_or_books(user_text: str) -> Optional[str]:
     if BOOK_COUNT_PAT.search(t):
         # You can expand this if you later add more book JSONs.
         n = 1 if faces_docs else 0
-        msg = (
-            f"I’ve written *Faces of Eve*—a work inviting women to recognize how God restores "
-            f"identity through grace and wisdom. I continue to write and teach from that stream.\n"
-            f"Scripture: Proverbs 4:7\n"
-            f"What theme from the book are you most curious about?"
-        )
-        return expand_scriptures_in_text(msg)
+        return _expand_static(_FACES_BOOK_COUNT_MSG)
 
     # General Faces-of-Eve questions: pull a representative passage/summary
     if FACES_PAT.search(t):
@@ -7016,13 +6616,7 @@ def answer_faces_of_eve_or_books(user_text: str) -> Optional[str]:
             return expand_scriptures_in_text(msg)
 
         # If corpus is missing, still respond coherently
-        msg = (
-            "In *Faces of Eve*, I write about identity, healing, and the ways God restores dignity where "
-            "life tried to diminish it. It’s an invitation to encounter grace and walk in holy wisdom.\n"
-            "Scripture: Isaiah 61:3\n"
-            "What aspect—identity, healing, or purpose—would you like me to unpack?"
-        )
-        return expand_scriptures_in_text(msg)
+        return _expand_static(_FACES_FALLBACK_MSG)
 
     return None  # not a Faces/Books question
 
@@ -7045,7 +6639,7 @@ SCRIPTURE_WORD_RX = re.compile(
 def should_include_scripture(user_text: str) -> bool:
     if SCRIPTURE_WORD_RX.search(user_text or ""):
         return True
-    return random.random() < 0.8
+    return _rng.random() < 0.8
 
 base_system_prompt = (
     "You are Pastor Dr. Debra Jordan — warm, Christ-centered, nurturing, prophetic, and emotionally intelligent. "
@@ -7102,78 +6696,60 @@ _HTML_TAGS = re.compile(r"<(/?\w+)[^>]*>")
 def _sanitize_text(s: str, max_len: int = 2000) -> str:
     s = (s or "").strip()
     s = _HTML_TAGS.sub("", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = " ".join(s.split())  # collapse whitespace runs and trim, without a regex pass
     return s[:max_len]
 
 # Light heuristic for token estimate
 def _approx_token_count(s: str) -> int:
     # ~4 chars per token is a decent lower bound; add a floor
-    return max(1, int(len(s) / 4))
+    return (len(s) >> 2) or 1
 
 # Thread-safe daily budget tracker
 _gpt_budget_lock = threading.Lock()
 _gpt_spend_cents_day = {"day": time.strftime("%Y-%m-%d"), "cents": 0.0}
+_gpt_budget_day_ends = 0.0  # epoch seconds of the next local midnight
+
+def _roll_budget_day() -> None:
+    """Reset the spend at local midnight. Caller holds _gpt_budget_lock."""
+    global _gpt_budget_day_ends
+    now = time.time()
+    if now < _gpt_budget_day_ends:
+        return
+    lt = time.localtime(now)
+    today = time.strftime("%Y-%m-%d", lt)
+    # strftime is only needed once a day; until then a float compare answers "same day?"
+    _gpt_budget_day_ends = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+    if _gpt_spend_cents_day["day"] != today:
+        _gpt_spend_cents_day["day"] = today
+        _gpt_spend_cents_day["cents"] = 0.0
 
 def _budget_okay(about_tokens: int) -> bool:
     est_cents = (about_tokens / 1000.0) * GPT_APPROX_CENTS_PER_1K_TOKENS
-    today = time.strftime("%Y-%m-%d")
     with _gpt_budget_lock:
-        if _gpt_spend_cents_day["day"] != today:
-            _gpt_spend_cents_day["day"] = today
-            _gpt_spend_cents_day["cents"] = 0.0
+        _roll_budget_day()
         return (_gpt_spend_cents_day["cents"] + est_cents) <= float(GPT_DAILY_BUDGET_CENTS)
 
 def _charge_budget(about_tokens: int):
     est_cents = (about_tokens / 1000.0) * GPT_APPROX_CENTS_PER_1K_TOKENS
-    today = time.strftime("%Y-%m-%d")
     with _gpt_budget_lock:
-        if _gpt_spend_cents_day["day"] != today:
-            _gpt_spend_cents_day["day"] = today
-            _gpt_spend_cents_day["cents"] = 0.0
+        _roll_budget_day()
         _gpt_spend_cents_day["cents"] += est_cents
 
-# Tiny LRU-ish cache with TTL to avoid stale context reuse
-_GPT_CACHE: Dict[str, Tuple[float, str]] = {}  # key -> (expiry_ts, text)
-_GPT_CACHE_MAX = 256
-_GPT_CACHE_TTL_SECONDS = 60 * 15  # 15 minutes
-_gpt_cache_lock = threading.Lock()
-
-def _cache_key(user_text: str, snippets: List[str], model: str) -> str:
-    key_raw = json.dumps({"u": user_text.strip(), "s": snippets, "m": model}, ensure_ascii=False)
-    return hashlib.sha256(key_raw.encode("utf-8")).hexdigest()
-
-def _cache_get(key: str) -> Optional[str]:
-    now = time.time()
-    with _gpt_cache_lock:
-        hit = _GPT_CACHE.get(key)
-        if not hit:
-            return None
-        exp, val = hit
-        if now > exp:
-            _GPT_CACHE.pop(key, None)
-            return None
-        return val
-
-def _cache_put(key: str, value: str):
-    exp = time.time() + _GPT_CACHE_TTL_SECONDS
-    with _gpt_cache_lock:
-        if len(_GPT_CACHE) >= _GPT_CACHE_MAX:
-            # Evict one arbitrary (oldest-like by min exp)
-            victim = min(_GPT_CACHE.items(), key=lambda kv: kv[1][0])[0]
-            _GPT_CACHE.pop(victim, None)
-        _GPT_CACHE[key] = (exp, value)
+_DESTINY_NUMBER_KEYS = ("destiny_number", "destiny_theme_number", "theme_number", "num")
 
 def detect_destiny_number_from_context(raw_hits: List["Hit"]) -> Optional[int]:
     """
     Try to pull a destiny-theme number from your search hits.
-    Adjust the keys ('destiny_number', etc.) to match your actual metadata.
+    Adjust the keys (_DESTINY_NUMBER_KEYS) to match your actual metadata.
     """
     for h in raw_hits or []:
         meta = getattr(h, "meta", {}) or {}
-        for key in ("destiny_number", "destiny_theme_number", "theme_number", "num"):
+        for key in _DESTINY_NUMBER_KEYS:
             val = meta.get(key)
             if val is None:
                 continue
+            if type(val) is int:  # the usual case; skip int() and its exception path
+                return val
             try:
                 return int(val)
             except (TypeError, ValueError):
@@ -7181,6 +6757,147 @@ def detect_destiny_number_from_context(raw_hits: List["Hit"]) -> Optional[int]:
     return None
 
 
+# Banks for build_year_based_prophetic_word, built once at import. Openings are
+# str.format templates filled with theme_label and year_str per reply.
+# ---------- Openings (per topic) ----------
+_YEAR_GENERIC_OPENINGS = (
+    "{theme_label}, as I pray into {year_str}, I sense the Lord gently preparing you.",
+    "{theme_label}, I’m lifting {year_str} before the Lord and I sense quiet movement in your favor.",
+    "As I consider {year_str} with you in prayer, I sense God steadying your steps.",
+)
+
+_YEAR_TOPIC_OPENINGS = {
+    "finances": (
+        "{theme_label}, as I pray into your finances for {year_str}, I sense God untangling old pressure.",
+        "For {year_str}, I see the Lord touching the way you see provision and stewardship.",
+    ),
+    "love": (
+        "{theme_label}, concerning your heart in {year_str}, I sense God healing expectations around love.",
+        "As I pray about relationships in {year_str}, I sense the Lord protecting your heart and timing.",
+    ),
+    "relocation": (
+        "{theme_label}, around location and placement in {year_str}, I sense God speaking to your sense of ‘home.’",
+        "As I look at {year_str}, I sense the Lord weighing where you are planted and where you are called.",
+    ),
+    "health": (
+        "{theme_label}, in the area of your health for {year_str}, I sense a gentle strengthening coming.",
+        "As I pray into your body and mind for {year_str}, I sense the Lord calming what has been inflamed.",
+    ),
+    "ministry": (
+        "{theme_label}, concerning your ministry in {year_str}, I sense a refining of your voice and assignment.",
+        "As I pray into your call for {year_str}, I sense the Lord deepening your confidence and clarity.",
+    ),
+    "general": (),
+}
+
+# ---------- Core “sense” phrases per topic ----------
+_YEAR_CORE_LINES = {
+    "finances": (
+        "God is bringing order to your decisions so that peace can sit where panic once lived.",
+        "There is a shift from survival into strategy; you will see where to trim, where to sow, and where to wait.",
+        "Hidden opportunities will begin to surface as you bring your plans before the Lord with honesty.",
+    ),
+    "love": (
+        "God is untangling old disappointments so that you can receive love without shrinking who you are.",
+        "This is a season where love will come with clarity, not chaos; conversations will reveal character quickly.",
+        "The Lord is teaching you to recognize relationships that honor your heart instead of draining it.",
+    ),
+    "relocation": (
+        "There is a quiet alignment around where you live, work, and worship; peace will keep returning to the right place.",
+        "You will notice divine timing in doors that open easily and close gently, rather than by force.",
+        "God is preparing surroundings that support your next level, not just your last battle.",
+    ),
+    "health": (
+        "The Lord is addressing both the root stress and the visible symptoms, working from the inside out.",
+        "Small adjustments in rest, boundaries, and habits will carry a grace that feels different from striving.",
+        "Your body will respond to the peace you allow into your schedule, your relationships, and your thoughts.",
+    ),
+    "ministry": (
+        "God is refining your message so you can speak with simplicity, depth, and authority.",
+        "Connections and platforms will open that recognize the oil on your life without you forcing yourself to be seen.",
+        "This is a year where fruit will confirm your call more than feelings or opinions.",
+    ),
+    "general": (
+        "God is weaving together loose ends, turning scattered pieces into a clearer path.",
+        "You’ll see alignment between what you pray, what you say yes to, and what truly bears fruit.",
+        "The Lord is trading confusion for a slow, steady clarity about your next faithful steps.",
+    ),
+}
+
+# ---------- Application lines per topic ----------
+_YEAR_APPLICATION_LINES = {
+    "finances": (
+        "Lay your financial picture before God on paper, then simplify one area that drains you.",
+        "Treat every decision this year as a seed—ask what it will grow in three to five years.",
+    ),
+    "love": (
+        "Let God reset your standards; write what healthy love looks like and refuse to negotiate your peace.",
+        "Practice honest, gentle communication and watch who responds with respect versus defensiveness.",
+    ),
+    "relocation": (
+        "Pay attention to where peace lingers after you visit or inquire—it’s often a quiet confirmation.",
+        "Hold your plans loosely in prayer and ask the Lord to close every door that is not for you.",
+    ),
+    "health": (
+        "Agree with God about one small health habit and keep it for thirty days; watch the shift.",
+        "Invite trusted support—doctor, counselor, or friend—into the process; healing is often communal.",
+    ),
+    "ministry": (
+        "Serve faithfully where you are now; God often promotes through hidden seasons of consistency.",
+        "Begin to document what God is saying through you—patterns will reveal your core assignment.",
+    ),
+    "general": (
+        "Write down three areas where you sense God nudging you, then choose one to act on this month.",
+        "Treat {year} as a year of alignment: release what no longer fits and lean into what bears fruit.",
+    ),
+}
+
+# ---------- Scripture pool ----------
+_YEAR_SCRIPTURES = {
+    "finances": (
+        "Scripture: Philippians 4:19",
+        "Scripture: Proverbs 3:9–10",
+        "Scripture: Deuteronomy 8:18",
+    ),
+    "love": (
+        "Scripture: 1 Corinthians 13:4–7",
+        "Scripture: Psalm 147:3",
+        "Scripture: Proverbs 4:23",
+    ),
+    "relocation": (
+        "Scripture: Psalm 37:23",
+        "Scripture: Proverbs 3:5–6",
+        "Scripture: Isaiah 30:21",
+    ),
+    "health": (
+        "Scripture: Isaiah 40:29–31",
+        "Scripture: Jeremiah 30:17",
+        "Scripture: 3 John 1:2",
+    ),
+    "ministry": (
+        "Scripture: Ephesians 4:11–12",
+        "Scripture: 2 Timothy 1:6–7",
+        "Scripture: Colossians 3:23–24",
+    ),
+    "general": (
+        "Scripture: Jeremiah 29:11",
+        "Scripture: Isaiah 43:19",
+        "Scripture: Psalm 32:8",
+    ),
+}
+
+# ---------- Closing questions (varied) ----------
+_YEAR_CLOSERS = (
+    "Which part of this word feels like confirmation to you?",
+    "What one step do you feel grace to take toward this word?",
+    "If you’re willing to share, where do you sense God already nudging you?",
+    "What small agreement can you make with this word over the next seven days?",
+)
+
+# Each topic's openings followed by the generic ones, as the per-call list used to be
+_YEAR_OPENINGS = {topic: lines + _YEAR_GENERIC_OPENINGS for topic, lines in _YEAR_TOPIC_OPENINGS.items()}
+
+
 def build_year_based_prophetic_word(
     user_text: str,
     topic: str,
@@ -7194,173 +6911,29 @@ def build_year_based_prophetic_word(
     text = (user_text or "").strip()
 
     # Extract year, or fall back
-    m = re.search(r"(202[4-9]|203\d)", text)
+    m = _FUTURE_YEAR_RX.search(text)
     year_str = m.group(1) if m else "this coming season"
 
     # Normalize topic + theme
     topic = topic or "general"
     theme_label = (theme_name or "").strip() or "Beloved"
 
-    # ---------- Openings (per topic) ----------
-    generic_openings = [
-        f"{theme_label}, as I pray into {year_str}, I sense the Lord gently preparing you.",
-        f"{theme_label}, I’m lifting {year_str} before the Lord and I sense quiet movement in your favor.",
-        f"As I consider {year_str} with you in prayer, I sense God steadying your steps.",
-    ]
-
-    topic_openings = {
-        "finances": [
-            f"{theme_label}, as I pray into your finances for {year_str}, I sense God untangling old pressure.",
-            f"For {year_str}, I see the Lord touching the way you see provision and stewardship.",
-        ],
-        "love": [
-            f"{theme_label}, concerning your heart in {year_str}, I sense God healing expectations around love.",
-            f"As I pray about relationships in {year_str}, I sense the Lord protecting your heart and timing.",
-        ],
-        "relocation": [
-            f"{theme_label}, around location and placement in {year_str}, I sense God speaking to your sense of ‘home.’",
-            f"As I look at {year_str}, I sense the Lord weighing where you are planted and where you are called.",
-        ],
-        "health": [
-            f"{theme_label}, in the area of your health for {year_str}, I sense a gentle strengthening coming.",
-            f"As I pray into your body and mind for {year_str}, I sense the Lord calming what has been inflamed.",
-        ],
-        "ministry": [
-            f"{theme_label}, concerning your ministry in {year_str}, I sense a refining of your voice and assignment.",
-            f"As I pray into your call for {year_str}, I sense the Lord deepening your confidence and clarity.",
-        ],
-        "general": [],
-    }
-
-    # ---------- Core “sense” phrases per topic ----------
-    core_bank = {
-        "finances": [
-            "God is bringing order to your decisions so that peace can sit where panic once lived.",
-            "There is a shift from survival into strategy; you will see where to trim, where to sow, and where to wait.",
-            "Hidden opportunities will begin to surface as you bring your plans before the Lord with honesty.",
-        ],
-        "love": [
-            "God is untangling old disappointments so that you can receive love without shrinking who you are.",
-            "This is a season where love will come with clarity, not chaos; conversations will reveal character quickly.",
-            "The Lord is teaching you to recognize relationships that honor your heart instead of draining it.",
-        ],
-        "relocation": [
-            "There is a quiet alignment around where you live, work, and worship; peace will keep returning to the right place.",
-            "You will notice divine timing in doors that open easily and close gently, rather than by force.",
-            "God is preparing surroundings that support your next level, not just your last battle.",
-        ],
-        "health": [
-            "The Lord is addressing both the root stress and the visible symptoms, working from the inside out.",
-            "Small adjustments in rest, boundaries, and habits will carry a grace that feels different from striving.",
-            "Your body will respond to the peace you allow into your schedule, your relationships, and your thoughts.",
-        ],
-        "ministry": [
-            "God is refining your message so you can speak with simplicity, depth, and authority.",
-            "Connections and platforms will open that recognize the oil on your life without you forcing yourself to be seen.",
-            "This is a year where fruit will confirm your call more than feelings or opinions.",
-        ],
-        "general": [
-            "God is weaving together loose ends, turning scattered pieces into a clearer path.",
-            "You’ll see alignment between what you pray, what you say yes to, and what truly bears fruit.",
-            "The Lord is trading confusion for a slow, steady clarity about your next faithful steps.",
-        ],
-    }
-
     # If topic not found, fall back to general
-    topic_key = topic if topic in core_bank else "general"
-
-    # ---------- Application lines per topic ----------
-    application_bank = {
-        "finances": [
-            "Lay your financial picture before God on paper, then simplify one area that drains you.",
-            "Treat every decision this year as a seed—ask what it will grow in three to five years.",
-        ],
-        "love": [
-            "Let God reset your standards; write what healthy love looks like and refuse to negotiate your peace.",
-            "Practice honest, gentle communication and watch who responds with respect versus defensiveness.",
-        ],
-        "relocation": [
-            "Pay attention to where peace lingers after you visit or inquire—it’s often a quiet confirmation.",
-            "Hold your plans loosely in prayer and ask the Lord to close every door that is not for you.",
-        ],
-        "health": [
-            "Agree with God about one small health habit and keep it for thirty days; watch the shift.",
-            "Invite trusted support—doctor, counselor, or friend—into the process; healing is often communal.",
-        ],
-        "ministry": [
-            "Serve faithfully where you are now; God often promotes through hidden seasons of consistency.",
-            "Begin to document what God is saying through you—patterns will reveal your core assignment.",
-        ],
-        "general": [
-            "Write down three areas where you sense God nudging you, then choose one to act on this month.",
-            "Treat {year} as a year of alignment: release what no longer fits and lean into what bears fruit.",
-        ],
-    }
-
-    # ---------- Scripture pool ----------
-    scripture_pool = {
-        "finances": [
-            "Scripture: Philippians 4:19",
-            "Scripture: Proverbs 3:9–10",
-            "Scripture: Deuteronomy 8:18",
-        ],
-        "love": [
-            "Scripture: 1 Corinthians 13:4–7",
-            "Scripture: Psalm 147:3",
-            "Scripture: Proverbs 4:23",
-        ],
-        "relocation": [
-            "Scripture: Psalm 37:23",
-            "Scripture: Proverbs 3:5–6",
-            "Scripture: Isaiah 30:21",
-        ],
-        "health": [
-            "Scripture: Isaiah 40:29–31",
-            "Scripture: Jeremiah 30:17",
-            "Scripture: 3 John 1:2",
-        ],
-        "ministry": [
-            "Scripture: Ephesians 4:11–12",
-            "Scripture: 2 Timothy 1:6–7",
-            "Scripture: Colossians 3:23–24",
-        ],
-        "general": [
-            "Scripture: Jeremiah 29:11",
-            "Scripture: Isaiah 43:19",
-            "Scripture: Psalm 32:8",
-        ],
-    }
-
-    # ---------- Closing questions (varied) ----------
-    closers = [
-        "Which part of this word feels like confirmation to you?",
-        "What one step do you feel grace to take toward this word?",
-        "If you’re willing to share, where do you sense God already nudging you?",
-        "What small agreement can you make with this word over the next seven days?",
-    ]
+    topic_key = topic if topic in _YEAR_CORE_LINES else "general"
 
     # ---------- Build final message ----------
-    openings = topic_openings.get(topic_key, []) + generic_openings
-    opening = random.choice(openings)
-
-    core_line = random.choice(core_bank[topic_key])
-    app_options = application_bank.get(topic_key, application_bank["general"])
-    app_line = random.choice(app_options).format(year=year_str)
-
-    script_options = scripture_pool.get(topic_key, scripture_pool["general"])
-    scripture_line = random.choice(script_options)
-
-    closer = random.choice(closers)
-
-    lines = [
-        opening.strip(),
-        core_line.strip(),
-        app_line.strip(),
-        scripture_line.strip(),
-        closer.strip(),
-    ]
+    opening, core_line, app_line, scripture_line, closer = _pick_each(
+        _YEAR_OPENINGS[topic_key],
+        _YEAR_CORE_LINES[topic_key],
+        _YEAR_APPLICATION_LINES[topic_key],
+        _YEAR_SCRIPTURES[topic_key],
+        _YEAR_CLOSERS,
+    )
+    opening = opening.format(theme_label=theme_label, year_str=year_str)
+    app_line = app_line.format(year=year_str)
 
-    return "\n".join(lines).strip()
+    # Bank lines carry no edge whitespace and theme_label is stripped above
+    return f"{opening}\n{core_line}\n{app_line}\n{scripture_line}\n{closer}"
 
 def clean_scripture_duplicates(text: str) -> str:
     """
@@ -7368,7 +6941,8 @@ def clean_scripture_duplicates(text: str) -> str:
     in one answer. If you already had a fancier version before,
     you can paste that back instead.
     """
-    if not text:
+    # A duplicate needs two "Scripture:" lines; most replies have one at most
+    if not text or text.count("Scripture:") < 2:
         return text
 
     lines = [ln.rstrip() for ln in text.splitlines()]
@@ -7399,9 +6973,11 @@ def _comfort_reply_shame() -> str:
 
 
 
+_NO_SCRIPTURE_RX = re.compile(r"\b(no scripture|not in the mood for scripture|no verse|don’t preach|no sermon)\b", re.I)
+
 def build_comfort_mode_reply(user_text, history, scripture_hint):
     # If user says "no scripture", override
-    if re.search(r"\b(no scripture|not in the mood for scripture|no verse|don’t preach|no sermon)\b", user_text, re.I):
+    if _NO_SCRIPTURE_RX.search(user_text):
         scripture_block = ""
     else:
         scripture_block = f"Scripture: {scripture_hint}" if scripture_hint else ""
@@ -7427,36 +7003,29 @@ def build_comfort_mode_reply(user_text, history, scripture_hint):
 # -------------------------------------------------------
 # Comfort mode detection (triggered by user distress)
 # -------------------------------------------------------
-distress_keywords = [
-    "scared", "afraid", "fear", "panicked", "panic", "overwhelmed", "anxious",
-    "anxiety", "worried", "ashamed", "guilty", "alone", "the world is against me",
-    "hurt", "in trouble", "messed up", "screwed", "lost", "depressed", "crying",
-]
 
-def is_in_distress(user_text):
-    return False
 
 
 
+# "palm" as a whole word, but not Palm Sunday; "astrolog" also covers astrologer/astrological
+_OCCULT_RX = re.compile(r"astrolog|tarot|psychic|\bpalm(?:s|istry)?\b(?!\s+sunday)")
 
-def _gpt_answer_impl(
-    prompt: str,
-    raw_hits=None,
-    hits_ctx=None,
-    no_cache=False,
-    comfort_mode=False,
-    scripture_hint=None,
-    history=None,
-    system_hint=None,
-):
-    raw_hits = raw_hits or []
-    history = history or []
+# Matches wherever any fast reply below would. Most prompts match none, so one scan
+# settles it; otherwise the individual checks run in their usual precedence.
+_FAST_REPLY_RX = _any_rx(
+    GREET_RX,
+    WHAT_CAN_YOU_DO_RX,
+    GLORY_BULLET_RX,
+    CHURCH_QUESTION_RX,
+    _OCCULT_RX,
+)
 
-    simple_key = (prompt or "").strip().lower()
 
-    # -----------------------------
-    # FAST TEXT RESPONSES ONLY
-    # -----------------------------
+def _fast_text_reply(prompt: str, simple_key: str) -> Optional[str]:
+    """Canned reply for greetings, capabilities, glory bullets, church and occult questions."""
+    if not _FAST_REPLY_RX.search(simple_key):
+        return None
+
     if GREET_RX.search(simple_key):
         return answer_greeting(prompt)
 
@@ -7469,37 +7038,23 @@ def _gpt_answer_impl(
     if CHURCH_QUESTION_RX.search(simple_key):
         return answer_church_question(simple_key)
 
-    if any(k in simple_key for k in ("astrology", "tarot", "psychic", "palm")):
-        return expand_scriptures_in_text(
+    if _OCCULT_RX.search(simple_key):
+        return _expand_static(
             "I don’t practice those things, but I will gladly pray with you.\n"
             "Scripture: James 1:5"
         )
-
-    # -----------------------------
-    # GPT CORE
-    # -----------------------------
-    system_prompt = system_hint or build_system_prompt(prompt)
-
-    user_payload = prompt
-    if history:
-        lines = [f"{h['role']}: {h['content']}" for h in history[-5:]]
-        user_payload = "\n".join(lines) + "\n\nUser: " + prompt
-
-    out = _gpt_chat(OPENAI_MODEL, system_prompt, user_payload, OPENAI_TEMP)
-
-    if not out and OPENAI_MODEL_ALT:
-        out = _gpt_chat(OPENAI_MODEL_ALT, system_prompt, user_payload, OPENAI_TEMP)
-
-    if not out:
-        return expand_scriptures_in_text(
-            "Let’s pause together.\nScripture: Matthew 11:28"
-        )
-
-    return out
-
+    return None
 
 
+_GPT_FALLBACK_MSG = "Let’s pause together.\nScripture: Matthew 11:28"
 
+def _gpt_user_payload(prompt: str, history: List[Dict[str, str]]) -> str:
+    """The user message sent to GPT: the last few turns, then the prompt."""
+    if not history:
+        return prompt
+    lines = [f"{h['role']}: {h['content']}" for h in history[-5:]]
+    lines += ("", f"User: {prompt}")
+    return "\n".join(lines)
 
 
 def gpt_answer(
@@ -7511,6 +7066,7 @@ def gpt_answer(
     scripture_hint=None,
     history=None,
     system_hint=None,
+    max_tokens=None,
 ):
     raw_hits = raw_hits or []
     history = history or []
@@ -7520,47 +7076,68 @@ def gpt_answer(
     # -----------------------------
     # FAST TEXT RESPONSES ONLY
     # -----------------------------
-    if GREET_RX.search(simple_key):
-        return answer_greeting(prompt)
-
-    if WHAT_CAN_YOU_DO_RX.search(simple_key):
-        return answer_capabilities()
-
-    if GLORY_BULLET_RX.search(simple_key):
-        return answer_glory_bullets()
-
-    if CHURCH_QUESTION_RX.search(simple_key):
-        return answer_church_question(simple_key)
-
-    if any(k in simple_key for k in ("astrology", "tarot", "psychic", "palm")):
-        return expand_scriptures_in_text(
-            "I don’t practice those things, but I will gladly pray with you.\n"
-            "Scripture: James 1:5"
-        )
+    fast = _fast_text_reply(prompt, simple_key)
+    if fast is not None:
+        return fast
 
     # -----------------------------
     # GPT CORE
     # -----------------------------
     system_prompt = system_hint or build_system_prompt(prompt)
 
-    user_payload = prompt
-    if history:
-        lines = [f"{h['role']}: {h['content']}" for h in history[-5:]]
-        user_payload = "\n".join(lines) + "\n\nUser: " + prompt
+    user_payload = _gpt_user_payload(prompt, history)
 
-    out = _gpt_chat(OPENAI_MODEL, system_prompt, user_payload, OPENAI_TEMP)
+    # Budget guard: refuse when this call could push the day past GPT_DAILY_BUDGET_CENTS
+    prompt_tokens = _approx_token_count(system_prompt) + _approx_token_count(user_payload)
+    if not _budget_okay(prompt_tokens + (max_tokens or 0)):
+        logger.warning("GPT daily budget reached; sending fallback reply")
+        return _expand_static(_GPT_FALLBACK_MSG)
 
-    if not out and OPENAI_MODEL_ALT:
-        out = _gpt_chat(OPENAI_MODEL_ALT, system_prompt, user_payload, OPENAI_TEMP)
+    out = _gpt_chat_hedged(system_prompt, user_payload, OPENAI_TEMP, max_tokens)
 
     if not out:
-        return expand_scriptures_in_text(
-            "Let’s pause together.\nScripture: Matthew 11:28"
-        )
+        return _expand_static(_GPT_FALLBACK_MSG)
 
+    _charge_budget(prompt_tokens + _approx_token_count(out))
     return out
 
 
+def gpt_answer_stream(prompt: str, history=None, system_hint=None, max_tokens=None):
+    """
+    gpt_answer as a generator of text pieces, for /chat's SSE mode. Fast replies
+    come back whole; otherwise OPENAI_MODEL streams, and if it produced nothing
+    the alternate model (non-streamed) or the fallback text is sent instead.
+    """
+    fast = _fast_text_reply(prompt, (prompt or "").strip().lower())
+    if fast is not None:
+        yield fast
+        return
+
+    system_prompt = system_hint or build_system_prompt(prompt)
+    user_payload = _gpt_user_payload(prompt, history or [])
+
+    prompt_tokens = _approx_token_count(system_prompt) + _approx_token_count(user_payload)
+    if not _budget_okay(prompt_tokens + (max_tokens or 0)):
+        logger.warning("GPT daily budget reached; sending fallback reply")
+        yield _expand_static(_GPT_FALLBACK_MSG)
+        return
+
+    sent = []
+    for delta in _gpt_chat_stream(OPENAI_MODEL, system_prompt, user_payload, OPENAI_TEMP, max_tokens):
+        sent.append(delta)
+        yield delta
+    if sent:
+        _charge_budget(prompt_tokens + _approx_token_count("".join(sent)))
+        return
+
+    out = ""
+    if OPENAI_MODEL_ALT:
+        out = _gpt_chat(OPENAI_MODEL_ALT, system_prompt, user_payload, OPENAI_TEMP, max_tokens)
+    if out:
+        _charge_budget(prompt_tokens + _approx_token_count(out))
+    yield out or _expand_static(_GPT_FALLBACK_MSG)
+
+
 
 
 
@@ -7590,38 +7167,34 @@ SYSTEM_TONE_T5 = (
     "Your goal is to make the user feel seen, safe, and held in God’s love while offering Christ-centered, practical encouragement."
 )
 
+# Everything in the T5 prompt ahead of the passages is fixed, so it is assembled once
+_T5_PROMPT_PREFIX = (
+    f"{SYSTEM_TONE_T5}\n\n"
+    "FORMAT RULES:\n"
+    "- Write your reply as EXACTLY two short paragraphs with a blank line between them.\n"
+    "- Use 4–7 sentences total across both paragraphs.\n"
+    "- The last sentence must be a gentle, permission-based question starting with one of: "
+    "'Can I ask you', 'May I ask', 'If you’re comfortable sharing', 'Could I ask', or 'Would you like to share'.\n"
+    "- You may include at most one 'Scripture:' line when it feels natural and helpful, "
+    "and you must NOT include Scripture if the user says they don’t want verses or a sermon.\n\n"
+    "Use these passages only if they truly help you answer the user:\n"
+)
+
 def build_t5_prompt(user_text: str, raw_hits: List[Hit]) -> str:
     intent = detect_intent(user_text)
     ctx_hits = filter_hits_for_context(raw_hits, intent)
 
     contexts: List[str] = []
     for h in ctx_hits:
-        piece = (
-            h.meta.get("summary")
-            or h.meta.get("answer")
-            or h.meta.get("faces_of_eve_principle")
-            or ""
-        ).strip()
-        if piece:
-            # normalize whitespace and keep it reasonably short
-            contexts.append(re.sub(r"\s+", " ", piece)[:400])
-
-    ctx_block = "\n\n".join(f"Passage {i+1}: {c}" for i, c in enumerate(contexts)) or "[no passages available]"
+        get = h.meta.get
+        piece = get("summary") or get("answer") or get("faces_of_eve_principle")
+        if piece and not piece.isspace():
+            # normalize whitespace (split/join also trims) and keep it reasonably short
+            contexts.append(" ".join(piece.split())[:400])
 
-    return (
-        f"{SYSTEM_TONE_T5}\n\n"
-        "FORMAT RULES:\n"
-        "- Write your reply as EXACTLY two short paragraphs with a blank line between them.\n"
-        "- Use 4–7 sentences total across both paragraphs.\n"
-        "- The last sentence must be a gentle, permission-based question starting with one of: "
-        "'Can I ask you', 'May I ask', 'If you’re comfortable sharing', 'Could I ask', or 'Would you like to share'.\n"
-        "- You may include at most one 'Scripture:' line when it feels natural and helpful, "
-        "and you must NOT include Scripture if the user says they don’t want verses or a sermon.\n\n"
-        "Use these passages only if they truly help you answer the user:\n"
-        f"{ctx_block}\n\n"
-        f"User: {user_text}\n"
-        "Pastor Debra:"
-    )
+    ctx_block = "\n\n".join(f"Passage {i}: {c}" for i, c in enumerate(contexts, 1)) or "[no passages available]"
+
+    return f"{_T5_PROMPT_PREFIX}{ctx_block}\n\nUser: {user_text}\nPastor Debra:"
 
 
 # ────────── Videos (prefer mp4; inject first) ──────────
@@ -7647,6 +7220,50 @@ def match_theme_from_text(text: str):
     return None
 
 
+def _recent_history(msgs: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Short rolling history for gpt_answer; only the GPT branches of /chat need it."""
+    history = []
+    for m in msgs[-5:]:
+        txt = (m.get("text") or "").strip()
+        if txt:
+            history.append({
+                "role": "assistant" if m.get("role") == "assistant" else "user",
+                "content": txt
+            })
+    return history
+
+
+# Fixed /chat replies. Each body is serialized and scrubbed once, on first use after
+# its Scripture lines resolve, instead of jsonify per hit.
+_RATELIMIT_TEXT = "Please pause for a moment.\nScripture: Psalm 46:10"
+_WELCOME_TEXT = "Welcome, beloved. How can I pray or reflect with you today?"
+_NEED_PROFILE_TEXT = (
+    "Beloved, I need your full name or date of birth to reflect accurately "
+    "on your Destiny Theme. Please enter it above, and ask me again."
+)
+_ERROR_TEXT = "Let’s pause together.\nScripture: Matthew 11:28\nPrayer: Jesus, steady our hearts. Amen."
+
+_STATIC_BODIES: Dict[Tuple[str, str], bytes] = {}
+
+def _static_reply(model: str, text: str, status: int = 200) -> Response:
+    key = (model, text)
+    body = _STATIC_BODIES.get(key)
+    if body is None:
+        expanded = _expand_static(text)
+        payload = _sanitize_payload({"messages": [{
+            "role": "assistant",
+            "model": model,
+            "text": expanded,
+        }]})
+        if orjson is not None:
+            body = orjson.dumps(payload, option=_ORJSON_OPTS)
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        if _scripture_resolved(expanded):
+            _STATIC_BODIES[key] = body
+    return _StaticJSON(body, status=status, mimetype="application/json")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # /chat  (FULL OPTION-A REPLACEMENT)
 # Unified Destiny Theme Engine → Always highest priority.
@@ -7658,18 +7275,12 @@ def chat():
         # ────────────────────────────────────────────
         # 0) RATE LIMIT
         # ────────────────────────────────────────────
+        # First hop of the proxy chain; partition stops at the first comma instead of
+        # splitting out every hop
         ip = (request.headers.get("X-Forwarded-For", request.remote_addr or "0.0.0.0")
-              .split(",")[0].strip())
+              .partition(",")[0].strip())
         if _throttle(ip):
-            return jsonify({
-                "messages": [{
-                    "role": "assistant",
-                    "model": "sys",
-                    "text": expand_scriptures_in_text(
-                        "Please pause for a moment.\nScripture: Psalm 46:10"
-                    )
-                }]
-            }), 429
+            return _static_reply("sys", _RATELIMIT_TEXT, 429)
 
         # ────────────────────────────────────────────
         # 1) PARSE PAYLOAD
@@ -7678,29 +7289,13 @@ def chat():
         msgs = data.get("messages", [])
 
         if not msgs:
-            return jsonify({
-                "messages": [{
-                    "role": "assistant",
-                    "model": "sys",
-                    "text": "Welcome, beloved. How can I pray or reflect with you today?"
-                }]
-            }), 200
+            return _static_reply("sys", _WELCOME_TEXT)
 
         user_text = (msgs[-1].get("text") or "").strip()[:MAX_INPUT_CHARS]
         full_name = (data.get("name") or data.get("full_name") or "").strip()
         birthdate = (data.get("dob") or data.get("birthdate") or "").strip()
-        t_norm = _normalize_simple(user_text).lower().strip()
-
+        t_norm = _normalize_simple(user_text).strip()
 
-        # Build short rolling history
-        history = []
-        for m in msgs[-5:]:
-            txt = (m.get("text") or "").strip()
-            if txt:
-                history.append({
-                    "role": "assistant" if m.get("role") == "assistant" else "user",
-                    "content": txt
-                })
 
         intent_now = detect_intent(user_text)
 
@@ -7712,16 +7307,7 @@ def chat():
             theme_num = _maybe_theme_from_profile(full_name, birthdate)
 
             if not theme_num or theme_num not in DESTINY_THEME_NAMES:
-                return jsonify({
-                    "messages": [{
-                        "role": "assistant",
-                        "model": "destiny",
-                        "text": (
-                            "Beloved, I need your full name or date of birth to reflect accurately "
-                            "on your Destiny Theme. Please enter it above, and ask me again."
-                        )
-                    }]
-                }), 200
+                return _static_reply("destiny", _NEED_PROFILE_TEXT)
 
             theme_name = DESTINY_THEME_NAMES[theme_num]
 
@@ -7744,8 +7330,9 @@ def chat():
                 no_cache=True,
                 comfort_mode=False,
                 scripture_hint=None,
-                history=history,
-                system_hint=system_hint
+                history=_recent_history(msgs),
+                system_hint=system_hint,
+                max_tokens=GPT_MAX_TOKENS_DEEP,
             )
 
             return jsonify({
@@ -7814,15 +7401,45 @@ def chat():
             "Respond with warmth, biblical grounding, and pastoral clarity."
         )
 
+        comfort = is_in_distress(user_text)
+        max_tokens = GPT_MAX_TOKENS_COMFORT if comfort else GPT_MAX_TOKENS_REPLY
+
+        if data.get("stream") is True:
+            # SSE: dash-scrubbed text deltas as the model decodes, then one final event
+            # with the expanded, scrubbed reply (after_request only scrubs JSON bodies)
+            history = _recent_history(msgs)
+
+            def events():
+                parts = []
+
+                def pieces():
+                    for piece in gpt_answer_stream(user_text, history, system_hint, max_tokens):
+                        parts.append(piece)
+                        yield piece
+
+                # Deltas get the same dash replacement as JSON replies
+                for piece in _strip_dashes_stream(pieces()):
+                    yield f"data: {json.dumps({'delta': piece}, ensure_ascii=False)}\n\n"
+                final = _sanitize_payload({
+                    "role": "assistant",
+                    "model": "gpt",
+                    "text": expand_scriptures_in_text("".join(parts)),
+                    "cites": [],
+                })
+                yield f"data: {json.dumps({'done': True, 'messages': [final]}, ensure_ascii=False)}\n\n"
+
+            return Response(events(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
         out = gpt_answer(
             user_text,
             raw_hits=[],
             hits_ctx=[],
             no_cache=True,
-            comfort_mode=is_in_distress(user_text),
+            comfort_mode=comfort,
             scripture_hint=None,
-            history=history,
-            system_hint=system_hint
+            history=_recent_history(msgs),
+            system_hint=system_hint,
+            max_tokens=max_tokens,
         )
 
         return jsonify({
@@ -7836,34 +7453,28 @@ def chat():
 
     except Exception as e:
         logger.exception("Unhandled error in /chat: %s", e)
-        return jsonify({
-            "messages": [{
-                "role": "assistant",
-                "model": "sys",
-                "text": expand_scriptures_in_text(
-                    "Let’s pause together.\nScripture: Matthew 11:28\nPrayer: Jesus, steady our hearts. Amen."
-                )
-            }]
-        }), 200
+        return _static_reply("sys", _ERROR_TEXT)
 
 
 
 # ────────── Ops ──────────
+_WHITESPACE_RUN_RX = re.compile(r"\s+")
+
 @app.route("/search", methods=["GET"])
 def debug_search():
     q = request.args.get("q", "").strip()
     if not q:
         return jsonify({"query":"", "hits":[]}), 200
-    hits = blended_search(q)
-    return jsonify({
-        "query": q,
-        "hits": [{
+    hits_out = []
+    for h in blended_search(q):
+        get = h.meta.get
+        hits_out.append({
             "score": round(h.score, 4),
             "corpus": h.corpus,
-            "section": h.meta.get("section") or h.meta.get("category") or h.meta.get("title") or h.meta.get("number") or "passage",
-            "preview": re.sub(r"\s+", " ", (h.meta.get("summary") or h.meta.get("answer") or h.meta.get("faces_of_eve_principle") or ""))[:240]
-        } for h in hits]
-    }), 200
+            "section": get("section") or get("category") or get("title") or get("number") or "passage",
+            "preview": _WHITESPACE_RUN_RX.sub(" ", get("summary") or get("answer") or get("faces_of_eve_principle") or "")[:240]
+        })
+    return jsonify({"query": q, "hits": hits_out}), 200
 
 
 @app.route("/reload", methods=["POST"])